@@ -1,31 +1,26 @@
 #!/usr/bin/env python3
 
+import os
 import numpy as np
-import tensorflow as tf
+from DL import datasets
 import DL.mapping as Mapping
 from DL.parameteriedmapping import Para, ParaInit, dense, relu, sigmoid, to_para
 from DL.statistics import accuracy
 from DL.update import rda_momentum
 from DL.supervised import supervised_step, train_supervised, mse_loss, learning_rate
 
-# 使用 TensorFlow 加载 MNIST 数据集
-def load_mnist():
-    # 使用 tensorflow 加载 MNIST 数据集
-    (x_train, y_train), (x_test, y_test) = tf.keras.datasets.mnist.load_data()
-
-    # 归一化到 [0, 1] 范围
-    x_train = x_train.astype('float32') / 255.0
-    x_test = x_test.astype('float32') / 255.0
-
-    # 将数据从 (28, 28) 扩展到 (28, 28, 1)
-    x_train = x_train.reshape(x_train.shape[0], 28 * 28)  # 展平图像
-    x_test = x_test.reshape(x_test.shape[0], 28 * 28)  # 展平图像
-
-    # one-hot 编码标签
-    _MNIST_CLASSES = 10
-    y_train = np.identity(_MNIST_CLASSES)[y_train]
-    y_test = np.identity(_MNIST_CLASSES)[y_test]
+# MNIST 的 IDX 文件（gzip 压缩或未压缩）所在的目录：仓库根目录
+ROOT = os.path.dirname(os.path.abspath(__file__))
 
+# 使用 DL.datasets 加载 MNIST 数据集
+def load_mnist():
+    # 图像归一化到 [0, 1] 并展平为 28 * 28 的向量，标签按需 one-hot 编码
+    try:
+        x_train, y_train = datasets.load_mnist(ROOT, "train")
+    except ValueError as e:
+        raise ValueError("MNIST training images not found: download train-images-idx3-ubyte.gz "
+                         "and train-labels-idx1-ubyte.gz into {} ({})".format(ROOT, e)) from e
+    x_test, y_test = datasets.load_mnist(ROOT, "t10k")
     return (x_train, y_train), (x_test, y_test)
 
 # 定义三层神经网络（激活函数使用 ReLU 或 Sigmoid）
@@ -34,8 +29,6 @@ model = (dense((28 * 28, 512), activation=Mapping.relu)  # 输入层到隐藏层
          >> dense((256, 10), activation=Mapping.sigmoid))  # 隐藏层2到输出层
 
 if __name__ == "__main__":
-    print("NOTE: TensorFlow will load the MNIST dataset.")
-
     # 加载 MNIST 数据集
     try:
         (x_train, y_train), (x_test, y_test) = load_mnist()
@@ -56,11 +49,11 @@ if __name__ == "__main__":
             continue
 
         e_prev = e
-        predict = lambda x: fwd((param[1], x)).argmax()
+        predict = lambda x: fwd((param[1], x)).argmax(axis=-1)
         # 打印测试集上的准确率
-        acc = accuracy(predict, x_test, y_test.argmax(axis=1))
+        acc = accuracy(predict, x_test, y_test.labels, batched=True)
         print('epoch', e, 'sample', j, '\taccuracy {0:.4f}'.format(acc), sep='\t')
 
     # 打印最终的测试集准确率
-    acc = accuracy(predict, x_test, y_test.argmax(axis=1))
+    acc = accuracy(predict, x_test, y_test.labels, batched=True)
     print('final accuracy: {0:.4f}'.format(acc))
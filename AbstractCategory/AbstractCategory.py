@@ -59,6 +59,21 @@ class AbstractCategory:
             # Ensure the identity morphism maps to itself
             self.morphism_equivalences[identity.name] = identity.name
 
+    @classmethod
+    def from_morphisms(cls, objects: List[str], morphisms: List[Morphism], **kwargs) -> "AbstractCategory":
+        """
+        Build a category from its objects and morphisms, deriving the morphism association.
+
+        :param objects: List of objects in the category.
+        :param morphisms: List of morphisms in the category (excluding identity morphisms).
+        :param kwargs: Further arguments of the constructor, e.g. compositions.
+        :return: The category.
+        """
+        association: Dict[str, Dict[str, List[Morphism]]] = {obj: {} for obj in objects}
+        for morph in morphisms:
+            association[morph.source].setdefault(morph.target, []).append(morph)
+        return cls(objects=objects, morphisms=morphisms, morphism_association=association, **kwargs)
+
     def are_equivalent(self, element1: str, element2: str, equivalence_type: str = 'morphism') -> bool:
         """
         Check if two elements (objects or morphisms) are equivalent.
@@ -212,38 +227,19 @@ class AbstractCategory:
         return False
 
     def initial_objects(self) -> List[str]:
-        """Return all initial objects."""
-        initial_objs = []
-        for obj in self.objects:
-            # Initial objects do not have any morphisms coming into them
-            incoming = any(
-                morph.target == obj for src, targets in self.morphism_association.items()
-                for morphs in targets.values() for morph in morphs if morph.source != obj
-            )
-            if not incoming:
-                initial_objs.append(obj)
-        return initial_objs
+        """Return all initial objects: objects I with exactly one morphism I → A to every object A."""
+        from .Universal import UniversalPropertyVerifier
+        return UniversalPropertyVerifier.of(self).initial_objects()
 
     def terminal_objects(self) -> List[str]:
-        """Return all terminal objects."""
-        terminal_objs = []
-        for obj in self.objects:
-            # Terminal objects do not have any morphisms going out of them
-            outgoing = any(
-                morph.source == obj for morphs in self.morphism_association.get(obj, {}).values()
-                for morph in morphs if morph.target != obj
-            )
-            if not outgoing:
-                terminal_objs.append(obj)
-        return terminal_objs
-
+        """Return all terminal objects: objects T with exactly one morphism A → T from every object A."""
+        from .Universal import UniversalPropertyVerifier
+        return UniversalPropertyVerifier.of(self).terminal_objects()
 
     def zero_objects(self) -> List[str]:
-        """Return all zero objects."""
-        initial_objs = self.initial_objects()
-        terminal_objs = self.terminal_objects()
-        zero_objs = [obj for obj in initial_objs if obj in terminal_objs]
-        return zero_objs
+        """Return all zero objects, both initial and terminal."""
+        terminal = set(self.terminal_objects())
+        return [obj for obj in self.initial_objects() if obj in terminal]
 
     def __str__(self):
         morphism_details = "\n  Morphisms:"
@@ -698,19 +694,34 @@ class AbstractCategory:
         """Return the simplified section morphisms."""
         return [morph for morph in self.morphisms if morph.name in self.ReducedSimpleMorphismNames and self.is_section(morph)]
 
+    def limit_failures(self) -> List[Dict[str, object]]:
+        """
+        Report the finite diagrams without a limit: a missing terminal object, cospans without
+        a pullback and parallel pairs without an equalizer, found by searching cones over the
+        hom-sets of this (finite) category.
+
+        :return: One report {"diagram": kind, "morphisms": names} per failing diagram.
+        """
+        from .Completeness import CompletenessAnalyzer
+        return CompletenessAnalyzer(self).limit_failures()
+
+    def colimit_failures(self) -> List[Dict[str, object]]:
+        """
+        Report the finite diagrams without a colimit: a missing initial object, spans without
+        a pushout and parallel pairs without a coequalizer.
+
+        :return: One report {"diagram": kind, "morphisms": names} per failing diagram.
+        """
+        from .Completeness import CompletenessAnalyzer
+        return CompletenessAnalyzer(self).colimit_failures()
+
     def has_all_small_limits(self) -> bool:
         """Check if the category supports all small limits (completeness)."""
-        # The implementation here is just an example. A more complex logic might be needed based on the actual category definition.
-        # Check if finite pullbacks are supported
-        supports_finite_pullbacks = all(
-            self.pullback(f, g) is not None
-            for f in self.morphisms
-            for g in self.morphisms
-            if f != g and f.target == g.target
-        )
-        # Check if there are initial objects
-        has_initial_object = len(self.initial_objects()) > 0
-        return supports_finite_pullbacks and has_initial_object
+        # A terminal object, pullbacks and equalizers generate all finite limits
+        failures = self.limit_failures()
+        for failure in failures:
+            print(f"No limit for {failure['diagram']} {', '.join(failure['morphisms'])}".rstrip())
+        return not failures
 
     def is_complete_category(self) -> bool:
         """
@@ -722,17 +733,11 @@ class AbstractCategory:
 
     def has_all_small_colimits(self) -> bool:
         """Check if the category supports all small colimits (cocompleteness)."""
-        # The implementation here is just an example. A more complex logic might be needed based on the actual category definition.
-        # Check if finite pushouts are supported
-        supports_finite_pushouts = all(
-            self.pushout(f, g) is not None
-            for f in self.morphisms
-            for g in self.morphisms
-            if f != g and f.source == g.source
-        )
-        # Check if there are terminal objects
-        has_terminal_object = len(self.terminal_objects()) > 0
-        return supports_finite_pushouts and has_terminal_object
+        # An initial object, pushouts and coequalizers generate all finite colimits
+        failures = self.colimit_failures()
+        for failure in failures:
+            print(f"No colimit for {failure['diagram']} {', '.join(failure['morphisms'])}".rstrip())
+        return not failures
 
     def is_cocomplete_category(self) -> bool:
         """
@@ -0,0 +1,286 @@
+# CategoryTheory/AbstractCategory/Completeness.py
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import multiprocessing
+import numpy as np
+from .Morphism import Morphism
+
+# A diagram is given positionally: a tuple of object indices and a tuple of arrows
+# (source position, target position, morphism index).
+Shape = Tuple[Tuple[int, ...], Tuple[Tuple[int, int, int], ...]]
+
+# Analyzer shared with forked worker processes
+_WORKER_ANALYZER = None
+
+
+def _cones_of_apexes(args) -> List[Tuple[int, List[Tuple[int, ...]]]]:
+    """Worker: enumerate the cones over a diagram for a batch of apexes."""
+    shape, apexes, dual = args
+    return [(apex, _WORKER_ANALYZER.cones(shape, apex, dual)) for apex in apexes]
+
+
+class CompletenessAnalyzer:
+    """
+    Decides which finite limits and colimits exist in a finite category by searching
+    cones over its indexed hom-sets.
+
+    Composites are looked up in the category: identities compose trivially, f ∘ g is the
+    morphism of that name in Hom(source of f, target of g) if present, and otherwise the
+    only morphism of that hom-set if there is exactly one. Pairs without a known composite
+    never satisfy a commutativity condition.
+    """
+
+    def __init__(self, category, workers: int = 1):
+        """
+        :param category: A finite AbstractCategory.
+        :param workers: Number of processes used to enumerate cones over candidate apexes.
+        """
+        self.category = category
+        self.workers = workers
+        self.objects: List[str] = list(category.objects)
+        self.object_index = {obj: i for i, obj in enumerate(self.objects)}
+
+        # Index every morphism once and group them into hom-sets
+        self.morphisms: List[Morphism] = []
+        self._morphism_index: Dict[Tuple[str, str, str], int] = {}
+        self._hom: Dict[Tuple[int, int], List[int]] = {}
+        for src, targets in category.morphism_association.items():
+            for tgt, morphs in targets.items():
+                for morph in morphs:
+                    key = (morph.name, morph.source, morph.target)
+                    if key in self._morphism_index or morph.source not in self.object_index \
+                            or morph.target not in self.object_index:
+                        continue
+                    self._morphism_index[key] = len(self.morphisms)
+                    self.morphisms.append(morph)
+                    hom = (self.object_index[morph.source], self.object_index[morph.target])
+                    self._hom.setdefault(hom, []).append(self._morphism_index[key])
+        self.source = np.array([self.object_index[m.source] for m in self.morphisms], dtype=np.int64)
+        self.target = np.array([self.object_index[m.target] for m in self.morphisms], dtype=np.int64)
+        # Hom-sets are kept sparse: one entry per non-empty hom-set
+        homs = list(self._hom)
+        self.hom_source = np.array([src for src, _ in homs], dtype=np.int64)
+        self.hom_target = np.array([tgt for _, tgt in homs], dtype=np.int64)
+        self.hom_size = np.array([len(self._hom[hom]) for hom in homs], dtype=np.int64)
+        # Reachability: in a category, tgt is reachable from src iff Hom(src, tgt) is non-empty
+        self._reaches: Dict[int, Set[int]] = {}
+        self._reached_by: Dict[int, Set[int]] = {}
+        for src, tgt in homs:
+            self._reaches.setdefault(src, set()).add(tgt)
+            self._reached_by.setdefault(tgt, set()).add(src)
+
+        self._identity = {i: self._lookup(i, i, f"id_{obj}") for i, obj in enumerate(self.objects)}
+        self._composites: Dict[Tuple[int, int], Optional[int]] = {}
+        self._cones: Dict[Tuple[bool, Shape, int], List[Tuple[int, ...]]] = {}
+        self._limits: Dict[Tuple[bool, Shape], Optional[Tuple[int, Tuple[int, ...]]]] = {}
+
+    def _lookup(self, src: int, tgt: int, name: str) -> Optional[int]:
+        """Index of the morphism with the given name in Hom(src, tgt), if any."""
+        return self._morphism_index.get((name, self.objects[src], self.objects[tgt]))
+
+    def index(self, morph: Morphism) -> int:
+        """Index of a morphism of the category."""
+        return self._morphism_index[(morph.name, morph.source, morph.target)]
+
+    def hom(self, src: int, tgt: int, dual: bool = False) -> List[int]:
+        """Indexed hom-set Hom(src, tgt), or Hom(tgt, src) in the opposite category."""
+        return self._hom.get((tgt, src) if dual else (src, tgt), [])
+
+    def compose(self, f: int, g: int, dual: bool = False) -> Optional[int]:
+        """Diagrammatic composite f ∘ g (f first), in the opposite category if dual."""
+        if dual:
+            f, g = g, f
+        key = (f, g)
+        if key not in self._composites:
+            src, tgt = int(self.source[f]), int(self.target[g])
+            if self.target[f] != self.source[g]:
+                result = None
+            elif f == self._identity[src]:
+                result = g
+            elif g == self._identity[tgt]:
+                result = f
+            else:
+                result = self._lookup(src, tgt, f"{self.morphisms[f].name} ∘ {self.morphisms[g].name}")
+                if result is None and len(self.hom(src, tgt)) == 1:
+                    result = self.hom(src, tgt)[0]
+            self._composites[key] = result
+        return self._composites[key]
+
+    ################################################################################
+    # Terminal and initial objects
+    ################################################################################
+
+    def terminal_objects(self) -> List[str]:
+        """Objects T with exactly one morphism A → T from every object A."""
+        singletons = np.bincount(self.hom_target[self.hom_size == 1], minlength=len(self.objects))
+        return [self.objects[t] for t in np.flatnonzero(singletons == len(self.objects))]
+
+    def initial_objects(self) -> List[str]:
+        """Objects I with exactly one morphism I → A to every object A."""
+        singletons = np.bincount(self.hom_source[self.hom_size == 1], minlength=len(self.objects))
+        return [self.objects[i] for i in np.flatnonzero(singletons == len(self.objects))]
+
+    def reaches(self, obj: int, dual: bool = False) -> Set[int]:
+        """Objects B with Hom(obj, B) non-empty (Hom(B, obj) if dual)."""
+        return (self._reached_by if dual else self._reaches).get(obj, set())
+
+    def reached_by(self, obj: int, dual: bool = False) -> Set[int]:
+        """Objects A with Hom(A, obj) non-empty (Hom(obj, A) if dual)."""
+        return (self._reaches if dual else self._reached_by).get(obj, set())
+
+    ################################################################################
+    # Cones and limits of finite diagrams
+    ################################################################################
+
+    def cones(self, shape: Shape, apex: int, dual: bool = False) -> List[Tuple[int, ...]]:
+        """
+        All cones over a diagram with the given apex (cocones if dual), as tuples of legs.
+        Legs are chosen node by node from the indexed hom-sets; a leg reached by an arrow
+        from an already chosen leg is determined, and every arrow is checked as soon as
+        both its ends are chosen.
+        """
+        key = (dual, shape, apex)
+        if key not in self._cones:
+            nodes, arrows = shape
+            legs: List[Optional[int]] = [None] * len(nodes)
+            found: List[Tuple[int, ...]] = []
+
+            def consistent() -> bool:
+                for s, t, m in arrows:
+                    if legs[s] is not None and legs[t] is not None and \
+                            self.compose(legs[s], m, dual) != legs[t]:
+                        return False
+                return True
+
+            def extend(p: int):
+                if p == len(nodes):
+                    found.append(tuple(legs))
+                    return
+                if legs[p] is not None:
+                    extend(p + 1)
+                    return
+                for leg in self.hom(apex, nodes[p], dual):
+                    legs[p] = leg
+                    # Propagate along arrows out of the node (a leg followed by an arrow is a leg)
+                    forced = []
+                    for s, t, m in arrows:
+                        if s == p and legs[t] is None:
+                            legs[t] = self.compose(leg, m, dual)
+                            forced.append(t)
+                            if legs[t] is None:
+                                break
+                    if all(legs[t] is not None for t in forced) and consistent():
+                        extend(p + 1)
+                    for t in forced:
+                        legs[t] = None
+                legs[p] = None
+
+            extend(0)
+            self._cones[key] = found
+        return self._cones[key]
+
+    def candidate_apexes(self, shape: Shape, dual: bool = False) -> List[int]:
+        """Apexes that can carry a cone over the diagram: those reaching every object of it."""
+        nodes, _ = shape
+        if not nodes:
+            return list(range(len(self.objects)))
+        candidates = set.intersection(*(self.reached_by(node, dual) for node in set(nodes)))
+        return sorted(candidates)
+
+    def all_cones(self, shape: Shape, dual: bool = False) -> List[Tuple[int, Tuple[int, ...]]]:
+        """
+        All cones over a diagram (cocones if dual), as (apex, legs) pairs. Only apexes bounded
+        by reachability are searched; with several workers the apexes are split across
+        forked processes.
+        """
+        apexes = self.candidate_apexes(shape, dual)
+        pending = [apex for apex in apexes if (dual, shape, apex) not in self._cones]
+        if self.workers > 1 and len(pending) >= 2 * self.workers and \
+                "fork" in multiprocessing.get_all_start_methods():
+            global _WORKER_ANALYZER
+            _WORKER_ANALYZER = self
+            batches = [(shape, pending[k::self.workers], dual) for k in range(self.workers)]
+            with multiprocessing.get_context("fork").Pool(self.workers) as pool:
+                for batch in pool.map(_cones_of_apexes, batches):
+                    for apex, cones in batch:
+                        self._cones[(dual, shape, apex)] = cones
+            _WORKER_ANALYZER = None
+        return [(apex, legs) for apex in apexes for legs in self.cones(shape, apex, dual)]
+
+    def limit(self, shape: Shape, dual: bool = False) -> Optional[Tuple[int, Tuple[int, ...]]]:
+        """
+        Search for a limit of a diagram (a colimit if dual): a cone through which every
+        other cone factors uniquely. Results are memoized per diagram shape.
+
+        :param shape: The diagram.
+        :param dual: Whether to search for a colimit instead.
+        :return: A pair (apex, legs) of the limit cone, or None if there is no limit.
+        """
+        key = (dual, shape)
+        if key not in self._limits:
+            all_cones = self.all_cones(shape, dual)
+            # Every cone must factor through the limit, so its apex needs a morphism into it
+            apexes = {apex for apex, _ in all_cones}
+            candidates = set.intersection(*(self.reaches(apex, dual) for apex in apexes)) if apexes else set()
+            self._limits[key] = next(
+                ((apex, legs) for apex, legs in all_cones
+                 if apex in candidates and self._is_universal(apex, legs, all_cones, dual)), None)
+        return self._limits[key]
+
+    def _is_universal(self, apex: int, legs: Tuple[int, ...], all_cones, dual: bool) -> bool:
+        """Whether every cone factors through (apex, legs) by exactly one morphism."""
+        for other_apex, other_legs in all_cones:
+            factorizations = 0
+            for u in self.hom(other_apex, apex, dual):
+                if all(self.compose(u, leg, dual) == other for leg, other in zip(legs, other_legs)):
+                    factorizations += 1
+                    if factorizations > 1:
+                        return False
+            if factorizations != 1:
+                return False
+        return True
+
+    ################################################################################
+    # Reports
+    ################################################################################
+
+    def _pairs(self, key_of) -> List[Tuple[int, int]]:
+        """Unordered pairs of morphisms sharing key_of(morphism), grouped through an index."""
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        for m in range(len(self.morphisms)):
+            groups.setdefault(key_of(m), []).append(m)
+        return [(f, g) for group in groups.values() for a, f in enumerate(group) for g in group[a:]]
+
+    def limit_failures(self, dual: bool = False) -> List[Dict[str, object]]:
+        """
+        Finite diagrams without a limit (colimit if dual): the empty diagram (terminal object),
+        every cospan (pullback) and every parallel pair (equalizer).
+
+        :param dual: Whether to check colimits: initial object, spans (pushouts) and coequalizers.
+        :return: One report per failing diagram.
+        """
+        failures: List[Dict[str, object]] = []
+        if not (self.initial_objects() if dual else self.terminal_objects()):
+            failures.append({"diagram": "initial object" if dual else "terminal object", "morphisms": ()})
+        apex_end = self.source if dual else self.target
+        for f, g in self._pairs(lambda m: (int(apex_end[m]),)):
+            # Cospan X → Z ← Y as the diagram (X, Y, Z); a span is a cospan in the opposite category
+            shape = ((int(self.source[f]), int(self.source[g]), int(self.target[f])), ((0, 2, f), (1, 2, g)))
+            if dual:
+                shape = ((int(self.target[f]), int(self.target[g]), int(self.source[f])), ((0, 2, f), (1, 2, g)))
+            if self.limit(shape, dual) is None:
+                failures.append({"diagram": "span" if dual else "cospan",
+                                 "morphisms": (self.morphisms[f].name, self.morphisms[g].name)})
+        for f, g in self._pairs(lambda m: (int(self.source[m]), int(self.target[m]))):
+            if f == g:
+                continue
+            shape = ((int(self.target[f]), int(self.source[f])) if dual else (int(self.source[f]), int(self.target[f])),
+                     ((0, 1, f), (0, 1, g)))
+            if self.limit(shape, dual) is None:
+                failures.append({"diagram": "parallel pair",
+                                 "morphisms": (self.morphisms[f].name, self.morphisms[g].name)})
+        return failures
+
+    def colimit_failures(self) -> List[Dict[str, object]]:
+        """Finite diagrams without a colimit, see limit_failures."""
+        return self.limit_failures(dual=True)
@@ -0,0 +1,314 @@
+# CategoryTheory/AbstractCategory/ProductCategory.py
+
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+from itertools import product
+from .Morphism import Morphism
+
+# An object of C × D: (index of an object of C, index of an object of D)
+Pair = Tuple[int, int]
+
+
+class _FactorIndex:
+    """Positions of the objects of a factor, and of its morphisms in the order they are first seen."""
+
+    def __init__(self, category):
+        self.category = category
+        self.objects: List[str] = category.Objects
+        self.object_index: Dict[str, int] = {obj: i for i, obj in enumerate(self.objects)}
+        self.morphisms: List[Morphism] = []
+        self.morphism_index: Dict[Morphism, int] = {}
+
+    def intern(self, morph: Morphism) -> int:
+        index = self.morphism_index.get(morph)
+        if index is None:
+            index = self.morphism_index[morph] = len(self.morphisms)
+            self.morphisms.append(morph)
+        return index
+
+
+class ProductObjects(Sequence):
+    """The objects of C × D as a read-only sequence of index pairs, decoded on access."""
+
+    def __init__(self, first: int, second: int):
+        self.first = first
+        self.second = second
+
+    def __len__(self) -> int:
+        return self.first * self.second
+
+    def __getitem__(self, k: int) -> Pair:
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError(f"Object index {k} out of range.")
+        return divmod(k, self.second)
+
+    def __iter__(self) -> Iterator[Pair]:
+        return product(range(self.first), range(self.second))
+
+    def __contains__(self, obj) -> bool:
+        return isinstance(obj, tuple) and len(obj) == 2 and \
+            0 <= obj[0] < self.first and 0 <= obj[1] < self.second
+
+    def index(self, obj: Pair, *args) -> int:
+        if obj not in self:
+            raise ValueError(f"{obj} is not an object of the product category.")
+        return obj[0] * self.second + obj[1]
+
+    def count(self, obj: Pair) -> int:
+        return int(obj in self)
+
+
+class ProductMorphisms(Sequence):
+    """The morphisms of C × D as a read-only sequence, built from the factors' morphism lists on access."""
+
+    def __init__(self, category: "ProductCategory"):
+        self.category = category
+
+    def __len__(self) -> int:
+        return len(self.category.first.morphisms) * len(self.category.second.morphisms)
+
+    def __getitem__(self, k: int) -> Morphism:
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError(f"Morphism index {k} out of range.")
+        p, q = divmod(k, len(self.category.second.morphisms))
+        return self.category.morphism(self.category.first.morphisms[p], self.category.second.morphisms[q])
+
+    def __iter__(self) -> Iterator[Morphism]:
+        for f in list(self.category.first.morphisms):
+            for g in list(self.category.second.morphisms):
+                yield self.category.morphism(f, g)
+
+    def __contains__(self, morph) -> bool:
+        return morph in self.category._components
+
+
+class _HomRow(Mapping):
+    """Hom(src, -) of the product, keyed by target pair; the hom-sets are computed on access."""
+
+    def __init__(self, category: "ProductCategory", src: Pair):
+        self.category = category
+        self.src = src
+
+    def __getitem__(self, tgt: Pair) -> List[Morphism]:
+        if tgt not in self.category.Objects:
+            raise KeyError(tgt)
+        return self.category.Hom(self.src, tgt)
+
+    def _targets(self) -> Tuple[List[int], List[int]]:
+        c = self.category
+        firsts = [c._first.object_index[t] for t, morphs in
+                  c.first.morphism_association.get(c._first.objects[self.src[0]], {}).items()
+                  if morphs and t in c._first.object_index]
+        seconds = [c._second.object_index[t] for t, morphs in
+                   c.second.morphism_association.get(c._second.objects[self.src[1]], {}).items()
+                   if morphs and t in c._second.object_index]
+        return firsts, seconds
+
+    def __iter__(self) -> Iterator[Pair]:
+        """Only the targets with a non-empty hom-set."""
+        return product(*self._targets())
+
+    def __len__(self) -> int:
+        firsts, seconds = self._targets()
+        return len(firsts) * len(seconds)
+
+
+class _HomTable(Mapping):
+    """The morphism association of the product: source pair -> target pair -> hom-set."""
+
+    def __init__(self, category: "ProductCategory"):
+        self.category = category
+
+    def __getitem__(self, src: Pair) -> _HomRow:
+        if src not in self.category.Objects:
+            raise KeyError(src)
+        return _HomRow(self.category, src)
+
+    def __iter__(self) -> Iterator[Pair]:
+        return iter(self.category.Objects)
+
+    def __len__(self) -> int:
+        return len(self.category.Objects)
+
+
+class ProductCategory:
+    """
+    The product category C × D, built lazily from its two factors.
+
+    An object is a pair (i, j) of indices into the objects of C and D, and a morphism
+    (f, g): (A, B) → (A', B') is a Morphism whose source and target are such pairs and whose
+    components are kept as a pair of indices into the morphisms of the factors.
+    Hom((a, b), (c, d)) is the product Hom_C(a, c) × Hom_D(b, d), computed when it is asked for,
+    and composition is component-wise through the factors' own compose, so neither the N·M
+    objects nor the hom-sets are ever materialized. The category offers the interface
+    AbstractFunctor relies on (Objects, morphism_association, morphisms, compositions,
+    get_identity, get_morphism, compose, are_isomorphic), so it can be the source or the
+    target of a functor, e.g. the tensor product C × C → C of a monoidal category.
+    """
+
+    def __init__(self, first, second):
+        """
+        :param first: The first factor C, an AbstractCategory.
+        :param second: The second factor D, an AbstractCategory.
+        """
+        self.first = first
+        self.second = second
+        self._first = _FactorIndex(first)
+        self._second = _FactorIndex(second)
+        self.objects = ProductObjects(len(self._first.objects), len(self._second.objects))
+        self.morphisms = ProductMorphisms(self)
+        self.morphism_association = _HomTable(self)
+        # Composites computed through compose, by morphism names, as in AbstractCategory
+        self.compositions: Dict[Tuple[str, str], str] = {}
+        self.object_equivalences: Dict[str, str] = {}
+        self.morphism_equivalences: Dict[str, str] = {}
+        # Interned product morphisms and their component indices
+        self._morphisms: Dict[Pair, Morphism] = {}
+        self._components: Dict[Morphism, Pair] = {}
+        self._by_name: Dict[str, Morphism] = {}
+
+    ################################################################################
+    # Objects
+    ################################################################################
+
+    @property
+    def Objects(self) -> ProductObjects:
+        """Return the objects of the product as a lazy sequence of index pairs."""
+        return self.objects
+
+    @property
+    def ObjectCount(self) -> int:
+        """Return the number of objects."""
+        return len(self.objects)
+
+    def pair(self, A: str, B: str) -> Pair:
+        """
+        The object (A, B) of the product.
+
+        :param A: An object of the first factor.
+        :param B: An object of the second factor.
+        :return: Its index pair.
+        """
+        if A not in self._first.object_index or B not in self._second.object_index:
+            raise ValueError(f"({A}, {B}) is not an object of the product category.")
+        return self._first.object_index[A], self._second.object_index[B]
+
+    def components(self, obj: Pair) -> Tuple[str, str]:
+        """The objects of the factors an index pair stands for."""
+        if obj not in self.objects:
+            raise ValueError(f"{obj} is not an object of the product category.")
+        return self._first.objects[obj[0]], self._second.objects[obj[1]]
+
+    def object_name(self, obj: Pair) -> str:
+        A, B = self.components(obj)
+        return f"({A}, {B})"
+
+    ################################################################################
+    # Morphisms
+    ################################################################################
+
+    def morphism(self, f: Morphism, g: Morphism) -> Morphism:
+        """
+        The morphism (f, g) of the product; the same instance is returned for the same components.
+
+        :param f: A morphism of the first factor.
+        :param g: A morphism of the second factor.
+        :return: The product morphism (f, g): (f.source, g.source) → (f.target, g.target).
+        """
+        key = (self._first.intern(f), self._second.intern(g))
+        morph = self._morphisms.get(key)
+        if morph is None:
+            morph = Morphism(f"({f.name}, {g.name})", self.pair(f.source, g.source), self.pair(f.target, g.target))
+            self._morphisms[key] = morph
+            self._components[morph] = key
+            self._by_name.setdefault(morph.name, morph)
+        return morph
+
+    def index(self, morph: Morphism) -> Pair:
+        """The indices of the components of a product morphism."""
+        key = self._components.get(morph)
+        if key is None:
+            raise ValueError(f"{morph.name} is not a morphism of the product category.")
+        return key
+
+    def morphism_components(self, morph: Morphism) -> Tuple[Morphism, Morphism]:
+        """The components (f, g) of a product morphism."""
+        p, q = self.index(morph)
+        return self._first.morphisms[p], self._second.morphisms[q]
+
+    def Hom(self, obj1: Pair, obj2: Pair) -> List[Morphism]:
+        """
+        Return all morphisms from obj1 to obj2, the product of the hom-sets of the components.
+
+        :param obj1: Source object.
+        :param obj2: Target object.
+        :return: List of morphisms.
+        """
+        (A, B), (C, D) = self.components(obj1), self.components(obj2)
+        return [self.morphism(f, g) for f, g in product(self.first.Hom(A, C), self.second.Hom(B, D))]
+
+    def hom_size(self, obj1: Pair, obj2: Pair) -> int:
+        """The size of Hom(obj1, obj2), without building it."""
+        (A, B), (C, D) = self.components(obj1), self.components(obj2)
+        return len(self.first.Hom(A, C)) * len(self.second.Hom(B, D))
+
+    def identity(self, obj: Pair) -> Morphism:
+        """Return the identity morphism (id_A, id_B) of the object (A, B)."""
+        A, B = self.components(obj)
+        return self.morphism(self.first.identity(A), self.second.identity(B))
+
+    def get_identity(self, obj: Pair) -> Optional[Morphism]:
+        """
+        Retrieve the identity morphism for the given object.
+
+        :param obj: The object whose identity morphism is to be retrieved.
+        :return: The identity morphism if found, else None.
+        """
+        if obj not in self.objects:
+            print(f"No identity morphism found for object {obj}.")
+            return None
+        return self.identity(obj)
+
+    def get_morphism(self, name: str) -> Optional[Morphism]:
+        """
+        Retrieve a product morphism that has already been built (through Hom, compose, identity...) by its name.
+
+        :param name: The name of the morphism.
+        :return: The morphism if found, else None.
+        """
+        morph = self._by_name.get(name)
+        if morph is None:
+            print(f"Morphism {name} not found in category.")
+        return morph
+
+    def compose(self, morph1: Morphism, morph2: Morphism, add_if_missing: bool = True) -> Morphism:
+        """
+        Compose two morphisms component-wise: (f, g) ∘ (f', g') = (f ∘ f', g ∘ g'), each
+        component composed by its factor.
+
+        :param morph1: The first morphism.
+        :param morph2: The second morphism.
+        :param add_if_missing: Whether the factors may add composites they do not know yet.
+        :return: The composed morphism.
+        """
+        if morph1.target != morph2.source:
+            raise ValueError(f"Cannot compose morphism {morph1.name} with {morph2.name}")
+        f1, g1 = self.morphism_components(morph1)
+        f2, g2 = self.morphism_components(morph2)
+        result = self.morphism(self.first.compose(f1, f2, add_if_missing),
+                               self.second.compose(g1, g2, add_if_missing))
+        if result is not morph1 and result is not morph2:
+            self.compositions[(morph1.name, morph2.name)] = result.name
+        return result
+
+    def are_isomorphic(self, obj1: Pair, obj2: Pair) -> bool:
+        """Two objects of the product are isomorphic iff their components are."""
+        (A, B), (C, D) = self.components(obj1), self.components(obj2)
+        return self.first.are_isomorphic(A, C) and self.second.are_isomorphic(B, D)
+
+    def __str__(self):
+        return (f"ProductCategory(\n  Objects: {len(self.objects)} pairs,\n"
+                f"  Factors: {len(self._first.objects)} × {len(self._second.objects)} objects\n)")
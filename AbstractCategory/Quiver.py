@@ -1,7 +1,5 @@
 # CategoryTheory/AbstractCategory/Quiver.py
 
-import networkx as nx
-import matplotlib.pyplot as plt
 from typing import List, Dict
 from .Morphism import Morphism
 
@@ -22,6 +20,10 @@ class Quiver:
 
         :param graph_type: The type of the graph, can be 'simple', 'labeled', 'full_labeled', etc.
         """
+        # The graph and plotting backends are slow to import, so they are loaded on first use
+        import networkx as nx
+        import matplotlib.pyplot as plt
+
         G = nx.DiGraph()
 
         # Add nodes
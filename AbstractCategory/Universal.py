@@ -0,0 +1,167 @@
+# CategoryTheory/AbstractCategory/Universal.py
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import weakref
+from .Completeness import CompletenessAnalyzer, Shape
+from .Morphism import Morphism
+
+# One verifier per category, rebuilt whenever objects or morphisms are added
+_VERIFIERS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+class UniversalPropertyVerifier(CompletenessAnalyzer):
+    """
+    Verifies universal properties of (co)cones in a finite category: a cone is a limit
+    if every cone over the same diagram factors through it by exactly one morphism.
+    Mediating morphisms are searched in the indexed hom-sets, and verdicts are memoized
+    so repeated verifications of the same diagram are free.
+    """
+
+    def __init__(self, category, workers: int = 1):
+        """
+        :param category: A finite AbstractCategory.
+        :param workers: Number of processes used to enumerate cones over candidate apexes.
+        """
+        super().__init__(category, workers)
+        self._mediating: Dict[Tuple, List[int]] = {}
+        self._verdicts: Dict[Tuple, Optional[str]] = {}
+
+    @classmethod
+    def of(cls, category, workers: int = 1) -> "UniversalPropertyVerifier":
+        """
+        The shared verifier of a category, so memoized results survive across verifications.
+
+        :param category: A finite AbstractCategory.
+        :param workers: Number of processes used to enumerate cones over candidate apexes.
+        :return: The verifier, rebuilt if the category has changed since it was created.
+        """
+        version = (len(category.objects), len(category.morphisms))
+        cached = _VERIFIERS.get(category)
+        if cached is None or cached[0] != version:
+            cached = (version, cls(category, workers))
+            _VERIFIERS[category] = cached
+        cached[1].workers = workers
+        return cached[1]
+
+    def shape(self, nodes: Sequence[str], arrows: Sequence[Tuple[int, int, Morphism]]) -> Shape:
+        """
+        Index a diagram given by object names and arrows (source position, target position, morphism).
+
+        :raises KeyError: If an object or morphism is not part of the category.
+        """
+        return (tuple(self.object_index[obj] for obj in nodes),
+                tuple((s, t, self.index(morph)) for s, t, morph in arrows))
+
+    def complete_legs(self, shape: Shape, legs: Sequence[Optional[int]], dual: bool = False) -> Optional[Tuple[int, ...]]:
+        """
+        Fill in the legs a cone is forced to have: a missing leg at the target of an arrow
+        is the composite of the leg at its source with the arrow.
+
+        :return: The complete legs, or None if some leg cannot be determined.
+        """
+        legs = list(legs)
+        changed = True
+        while changed:
+            changed = False
+            for s, t, m in shape[1]:
+                if legs[s] is not None and legs[t] is None:
+                    legs[t] = self.compose(legs[s], m, dual)
+                    changed = changed or legs[t] is not None
+        return None if any(leg is None for leg in legs) else tuple(legs)
+
+    def is_cone(self, shape: Shape, apex: int, legs: Tuple[int, ...], dual: bool = False) -> bool:
+        """Whether legs from apex (into apex if dual) commute with every arrow of the diagram."""
+        for leg, node in zip(legs, shape[0]):
+            ends = (self.target[leg], self.source[leg]) if dual else (self.source[leg], self.target[leg])
+            if ends != (apex, node):
+                return False
+        return all(self.compose(legs[s], m, dual) == legs[t] for s, t, m in shape[1])
+
+    def mediating_morphisms(self, shape: Shape, apex: int, legs: Tuple[int, ...],
+                            other_apex: int, other_legs: Tuple[int, ...], dual: bool = False) -> List[int]:
+        """
+        All u: other_apex → apex (apex → other_apex if dual) with leg ∘ u = other leg for every node.
+        Only the legs are compared, so hom-sets outside the diagram are never searched.
+        """
+        key = (dual, shape, apex, legs, other_apex, other_legs)
+        if key not in self._mediating:
+            self._mediating[key] = [
+                u for u in self.hom(other_apex, apex, dual)
+                if all(self.compose(u, leg, dual) == other for leg, other in zip(legs, other_legs))]
+        return self._mediating[key]
+
+    def check(self, shape: Shape, apex: int, legs: Sequence[Optional[int]],
+              other_cones: Optional[Sequence[Tuple[int, Sequence[Optional[int]]]]] = None,
+              dual: bool = False) -> Optional[str]:
+        """
+        Check the universal property of a cone (cocone if dual).
+
+        :param shape: The diagram.
+        :param apex: The apex of the cone.
+        :param legs: Its legs, one per node (None for legs forced by the arrows).
+        :param other_cones: Cones to factor through it as (apex, legs); all cones over the diagram if None.
+        :param dual: Whether to check a colimit instead.
+        :return: None if the property holds, otherwise the reason it fails.
+        """
+        key = (dual, shape, apex, tuple(legs),
+               None if other_cones is None else tuple((a, tuple(l)) for a, l in other_cones))
+        if key not in self._verdicts:
+            self._verdicts[key] = self._check(shape, apex, legs, other_cones, dual)
+        return self._verdicts[key]
+
+    def _check(self, shape, apex, legs, other_cones, dual) -> Optional[str]:
+        kind = "cocone" if dual else "cone"
+        complete = self.complete_legs(shape, legs, dual)
+        if complete is None or not self.is_cone(shape, apex, complete, dual):
+            return f"The universal {kind} does not commute with the diagram."
+        if other_cones is None:
+            cones = self.all_cones(shape, dual)
+        else:
+            cones = []
+            for other_apex, other_legs in other_cones:
+                other = self.complete_legs(shape, other_legs, dual)
+                if other is None or not self.is_cone(shape, other_apex, other, dual):
+                    return f"The other {kind} at {self.objects[other_apex]} does not commute with the diagram."
+                cones.append((other_apex, other))
+        for other_apex, other in cones:
+            found = self.mediating_morphisms(shape, apex, complete, other_apex, other, dual)
+            if len(found) != 1:
+                names = ", ".join(self.morphisms[leg].name for leg in other)
+                problem = "is no mediating morphism" if not found else f"are {len(found)} mediating morphisms"
+                return f"There {problem} for the {kind} ({names}) at {self.objects[other_apex]}."
+        return None
+
+    def verify(self, nodes: Sequence[str], arrows: Sequence[Tuple[int, int, Morphism]],
+               apex: str, legs: Sequence[Optional[Morphism]],
+               other_cones: Optional[Sequence[Sequence[Optional[Morphism]]]] = None,
+               dual: bool = False) -> Optional[str]:
+        """
+        Name-level entry point of check.
+
+        :param nodes: Objects of the diagram.
+        :param arrows: Arrows of the diagram as (source position, target position, morphism),
+                       positions swapped if dual since arrows then live in the opposite category.
+        :param apex: The apex of the cone.
+        :param legs: Its legs, one per node (None for legs forced by the arrows).
+        :param other_cones: Legs of other cones (None entries are forced); all cones if None.
+        :param dual: Whether to check a colimit instead.
+        :return: None if the property holds, otherwise the reason it fails.
+        """
+        try:
+            shape = self.shape(nodes, arrows)
+            apex_index = self.object_index[apex]
+            leg_indices = [None if leg is None else self.index(leg) for leg in legs]
+            others = None
+            if other_cones is not None:
+                others = []
+                for other_legs in other_cones:
+                    given = [leg for leg in other_legs if leg is not None]
+                    if not given:
+                        return "The other cone has no legs."
+                    other_apex = given[0].target if dual else given[0].source
+                    others.append((self.object_index[other_apex],
+                                   [None if leg is None else self.index(leg) for leg in other_legs]))
+        except KeyError as error:
+            missing = error.args[0]
+            return f"{missing[0] if isinstance(missing, tuple) else missing} is not part of the category."
+        return self.check(shape, apex_index, leg_indices, others, dual)
@@ -1,3 +1,20 @@
 from .AbstractCategory import AbstractCategory
 from .Morphism import Morphism
 from .Quiver import Quiver
+from .ProductCategory import ProductCategory
+
+# The analyzers depend on numpy, which would dominate the import time of the core package,
+# so they are imported when first accessed
+_LAZY = {
+    "CompletenessAnalyzer": ".Completeness",
+    "UniversalPropertyVerifier": ".Universal",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,12 @@
 # CategoryTheory/AbstractCoequalizer/AbstractCoequalizer.py
 
 from typing import Dict, List, Optional
+import numpy as np
 from AbstractColimit.AbstractColimit import AbstractColimit
 from AbstractCategory.Morphism import Morphism
 from AbstractCategory.AbstractCategory import AbstractCategory
 from Diagram.Diagram import Diagram
+from FinSet.FinSetCategory import FinSetCategory
 
 class Coequalizer(AbstractColimit):
     """
@@ -43,6 +45,14 @@ class Coequalizer(AbstractColimit):
         
         :return: The name of the coequalizer object, or None if not computed.
         """
+        if isinstance(self.category, FinSetCategory):
+            # Concrete coequalizer: Y modulo the equivalence generated by f(x) ~ g(x)
+            self.colimit_object, q = self.category.coequalizer_projection(self.morphism1, self.morphism2)
+            self.cocone_morphisms = {"Y": q}
+            self.is_computed = True
+            print(f"Computed coequalizer object: {self.colimit_object} with {self.category.size(self.colimit_object)} elements")
+            return self.colimit_object
+
         # For demonstration, assume the coequalizer object is predefined
         # In a real implementation, this would involve constructing the coequalizer
         self.colimit_object = "CoequalizerObject"
@@ -72,14 +82,20 @@ class Coequalizer(AbstractColimit):
 
         q_prime = other_cocone["Y"]
 
-        # 检查 q' ∘ f = q' ∘ g
-        # 由于缺乏具体的范畴操作，我们假设此条件被满足
+        if isinstance(self.category, FinSetCategory):
+            print("Verifying universal property of the coequalizer.")
+            u = self.category.coequalizer_mediating_map(self.morphism1, self.morphism2, q_prime)
+            if u is None:
+                print(f"{q_prime.name} ∘ {self.morphism1.name} ≠ {q_prime.name} ∘ {self.morphism2.name}")
+                return False
+            # q is an epimorphism, so u ∘ q = q' determines u uniquely
+            return bool(np.array_equal(u[self.cocone_morphisms["Y"].index_map], q_prime.index_map))
+
+        # 检查 q' ∘ f = q' ∘ g，并搜索唯一的 u: Q → C 使得 u ∘ q = q'
         print("Verifying universal property of the coequalizer.")
-        print(f"Assuming {q_prime.name} ∘ {self.morphism1.name} = {q_prime.name} ∘ {self.morphism2.name}")
-        print("Assuming existence of unique morphism u: CoequalizerObject → C such that u ∘ q = q'")
-        
-        # 返回 True，表示验证通过
-        return True
+        return self._verify_cocone([self.morphism1.target, self.morphism1.source],
+                                   [(0, 1, self.morphism1), (0, 1, self.morphism2)],
+                                   [self.cocone_morphisms.get("Y"), None], [q_prime, None])
     
     def visualize(self, filename: str = "coequalizer_diagram", format: str = "png"):
         """
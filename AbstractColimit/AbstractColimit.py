@@ -1,8 +1,11 @@
 # CategoryTheory/AbstractColimit/AbstractColimit.py
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from AbstractCategory.AbstractCategory import AbstractCategory
 from AbstractCategory.Morphism import Morphism
+from AbstractCategory.Universal import UniversalPropertyVerifier
+from Diagram.Diagram import Diagram
+from FinSet.FinSetCategory import FinSetCategory
 
 class AbstractColimit:
     """
@@ -30,28 +33,71 @@ class AbstractColimit:
     def compute_colimit(self) -> Optional[str]:
         """
         Computes the colimit object based on the diagram and cocone.
-        This method should be overridden by subclasses to provide specific colimit computations.
+        In a FinSetCategory the colimit of any finite diagram is computed directly;
+        otherwise this method should be overridden by subclasses.
 
         :return: The name of the colimit object, or None if not computed.
         """
+        if isinstance(self.category, FinSetCategory):
+            objects, morphisms = self._diagram_objects_and_morphisms()
+            self.colimit_object, injections = self.category.colimit_injections(objects, morphisms)
+            self.cocone_morphisms = {injection.source: injection for injection in injections}
+            self.is_computed = True
+            print(f"Computed colimit object: {self.colimit_object} with {self.category.size(self.colimit_object)} elements")
+            return self.colimit_object
         raise NotImplementedError("compute_colimit method must be implemented by subclasses.")
 
-    def verify_universal_property(self) -> bool:
+    def _diagram_objects_and_morphisms(self) -> Tuple[List[str], List[Morphism]]:
+        """Return the objects and morphisms of the diagram, given either as a Diagram or as a dictionary."""
+        if isinstance(self.diagram, Diagram):
+            return list(self.diagram.objects), list(self.diagram.morphisms)
+        morphisms = [morph for morphs in self.diagram.values() for morph in morphs]
+        objects = list(self.diagram)
+        objects += [obj for morph in morphisms for obj in (morph.source, morph.target) if obj not in objects]
+        return objects, morphisms
+
+    def verify_universal_property(self, other_cocone: Optional[Dict[str, Morphism]] = None) -> bool:
         """
         Verifies that the computed colimit satisfies the universal property.
         This involves checking that for any other cocone, there exists a unique morphism from the colimit object.
 
+        :param other_cocone: Another cocone, mapping each object of the diagram to a morphism out of it.
         :return: True if the universal property is satisfied, False otherwise.
         """
         if not self.is_computed or self.colimit_object is None:
             print("Colimit object has not been computed yet.")
             return False
 
-        # Placeholder for universal property verification.
-        # In a complete implementation, this would involve checking uniqueness of morphisms.
-        # Here, we'll assume it's satisfied.
         print("Verifying universal property of the colimit.")
-        return True
+        if isinstance(self.category, FinSetCategory):
+            # The FinSet colimit is universal by construction; other cocones factor through its injections
+            return other_cocone is None or self.category.colimit_mediating_map(self.colimit_object, other_cocone) is not None
+
+        objects, morphisms = self._diagram_objects_and_morphisms()
+        position = {obj: i for i, obj in enumerate(objects)}
+        # Cocones are cones in the opposite category, where arrows run from target to source
+        arrows = [(position[m.target], position[m.source], m) for m in morphisms]
+        return self._verify_cocone(objects, arrows, [self.cocone_morphisms.get(obj) for obj in objects],
+                                   None if other_cocone is None else [other_cocone.get(obj) for obj in objects])
+
+    def _verify_cocone(self, nodes: List[str], arrows: List[Tuple[int, int, Morphism]],
+                       legs: List[Optional[Morphism]], other_legs: Optional[List[Optional[Morphism]]] = None) -> bool:
+        """
+        Checks the universal property in a finite category: the cocone must commute, and every
+        other cocone (the given one, or all cocones over the diagram) must factor through it by
+        exactly one morphism, searched in the hom-sets of the category.
+
+        :param nodes: Objects of the diagram.
+        :param arrows: Arrows of the diagram as (target position, source position, morphism).
+        :param legs: Legs of the computed cocone, one per node (None where forced by the arrows).
+        :param other_legs: Legs of another cocone, or None to check every cocone.
+        :return: True if the universal property is satisfied, False otherwise.
+        """
+        reason = UniversalPropertyVerifier.of(self.category).verify(
+            nodes, arrows, self.colimit_object, legs, None if other_legs is None else [other_legs], dual=True)
+        if reason is not None:
+            print(reason)
+        return reason is None
 
     def __str__(self):
         if self.is_computed and self.colimit_object:
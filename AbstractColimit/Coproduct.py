@@ -3,6 +3,7 @@
 from typing import Dict, List, Optional
 from AbstractCategory.AbstractCategory import AbstractCategory
 from AbstractCategory.Morphism import Morphism
+from FinSet.FinSetCategory import FinSetCategory
 from .AbstractColimit import AbstractColimit
 
 class Coproduct(AbstractColimit):
@@ -12,27 +13,19 @@ class Coproduct(AbstractColimit):
     
     def __init__(self, 
                  category: AbstractCategory, 
-                 objects: List[str]):
+                 objects: List[str],
+                 lazy: bool = False):
         """
         Initializes the Coproduct with a category and a list of objects.
 
         :param category: The category in which to compute the coproduct.
         :param objects: A list of objects to form the coproduct.
+        :param lazy: In a FinSetCategory, build the coproduct lazily instead of materializing its elements.
         """
+        self.lazy = lazy
         self.coproduct_objects = objects
-        self.diagram = {}  # In coproducts, the diagram consists of injections.
-        self.cocone_morphisms = {}  # Morphisms η_X: CoproductObject → X
-
-        # Define the diagram as injections from each object to the coproduct
-        for obj in objects:
-            # Injection morphism: ι_i: X_i → CoproductObject
-            injection_name = f"ι_{obj}"
-            injection = category.get_morphism(injection_name)
-            if injection is None:
-                raise ValueError(f"Injection morphism '{injection_name}' not found in the category.")
-            if obj not in self.diagram:
-                self.diagram[obj] = []
-            self.diagram[obj].append(injection)
+        self.diagram = {obj: [] for obj in objects}  # The discrete diagram: no morphisms between the objects.
+        self.cocone_morphisms = {}  # Morphisms ι_X: X → CoproductObject
 
         # Initialize the Coproduct via AbstractColimit's constructor
         super().__init__(category, self.diagram, self.cocone_morphisms)
@@ -44,25 +37,47 @@ class Coproduct(AbstractColimit):
 
         :return: The name of the coproduct object, or None if not computed.
         """
-        # For demonstration, assume the coproduct object is predefined
-        # In a real implementation, this would involve constructing the coproduct
-        self.colimit_object = "CoproductObject"
-        self.cocone_morphisms = {obj: Morphism(name=f"ι_{obj}", source=obj, target=self.colimit_object) for obj in self.coproduct_objects}
+        if isinstance(self.category, FinSetCategory):
+            # Disjoint union, tagged by the offsets of the injections
+            self.colimit_object, injections = self.category.coproduct_injections(self.coproduct_objects, lazy=self.lazy)
+            self.cocone_morphisms = {injection.source: injection for injection in injections}
+            self.is_computed = True
+            print(f"Computed coproduct object: {self.colimit_object} with {self.category.size(self.colimit_object)} elements")
+            return self.colimit_object
+
+        # Elsewhere the coproduct is given by injection morphisms ι_X: X → CoproductObject of the category
+        injections = {obj: self.category.get_morphism(f"ι_{obj}") for obj in self.coproduct_objects}
+        missing = [f"ι_{obj}" for obj, injection in injections.items() if injection is None]
+        if missing:
+            raise ValueError(f"Injection morphisms {missing} not found in the category.")
+        targets = {injection.target for injection in injections.values()}
+        if len(targets) != 1:
+            raise ValueError(f"Injection morphisms must share their target, got {sorted(targets)}.")
+        self.colimit_object = targets.pop()
+        self.cocone_morphisms = injections
         self.is_computed = True
         print(f"Computed coproduct object: {self.colimit_object}")
         return self.colimit_object
 
-    def verify_universal_property(self) -> bool:
+    def verify_universal_property(self, other_cocone: Optional[Dict[str, Morphism]] = None) -> bool:
         """
         Verifies that the computed coproduct satisfies the universal property.
+
+        :param other_cocone: Another cocone, mapping each object to a morphism out of it.
+        :return: True if the universal property is satisfied, False otherwise.
         """
         if not self.is_computed or self.colimit_object is None:
             print("Coproduct object has not been computed yet.")
             return False
 
-        # Placeholder: Assume universal property is satisfied
         print("Verifying universal property of the coproduct.")
-        return True
+        if isinstance(self.category, FinSetCategory):
+            return other_cocone is None or self.category.colimit_mediating_map(self.colimit_object, other_cocone) is not None
+
+        # The discrete diagram: every family of morphisms out of the summands must factor uniquely
+        return self._verify_cocone(self.coproduct_objects, [],
+                                   [self.cocone_morphisms.get(obj) for obj in self.coproduct_objects],
+                                   None if other_cocone is None else [other_cocone.get(obj) for obj in self.coproduct_objects])
 
     def __str__(self):
         if self.is_computed and self.colimit_object:
@@ -1,10 +1,12 @@
 # CategoryTheory/AbstractEqualizer/AbstractEqualizer.py
 
 from typing import Dict, List, Optional
+import numpy as np
 from AbstractLimit.AbstractLimit import AbstractLimit
 from AbstractCategory.Morphism import Morphism
 from AbstractCategory.AbstractCategory import AbstractCategory
 from Diagram.Diagram import Diagram
+from FinSet.FinSetCategory import FinSetCategory
 
 class Equalizer(AbstractLimit):
     """
@@ -43,6 +45,14 @@ class Equalizer(AbstractLimit):
 
         :return: The name of the equalizer object, or None if not computed.
         """
+        if isinstance(self.category, FinSetCategory):
+            # Concrete equalizer {x | f(x) = g(x)} selected by a boolean mask
+            self.limit_object, e = self.category.equalizer_inclusion(self.morphism1, self.morphism2)
+            self.cone_morphisms = {"X": e}
+            self.is_computed = True
+            print(f"Computed equalizer object: {self.limit_object} with {self.category.size(self.limit_object)} elements")
+            return self.limit_object
+
         # For demonstration, assume the equalizer object is predefined
         # In a real implementation, this would involve constructing the equalizer
         self.limit_object = "EqualizerObject"
@@ -72,14 +82,20 @@ class Equalizer(AbstractLimit):
 
         e_prime = other_cone["X"]
 
-        # Check if f ∘ e' = g ∘ e'
-        # Given the lack of concrete category operations, we assume this condition is satisfied
-        print("Verifying universal property of the equalizer.")
-        print(f"Assuming {self.morphism1.name} ∘ {e_prime.name} = {self.morphism2.name} ∘ {e_prime.name}")
-        print("Assuming existence of unique morphism u: C → EqualizerObject such that e ∘ u = e'")
+        if isinstance(self.category, FinSetCategory):
+            print("Verifying universal property of the equalizer.")
+            u = self.category.equalizer_mediating_map(self.morphism1, self.morphism2, e_prime)
+            if u is None:
+                print(f"{self.morphism1.name} ∘ {e_prime.name} ≠ {self.morphism2.name} ∘ {e_prime.name}")
+                return False
+            # e is a monomorphism, so e ∘ u = e' determines u uniquely
+            return bool(np.array_equal(self.cone_morphisms["X"].index_map[u], e_prime.index_map))
 
-        # Return True, indicating verification passed
-        return True
+        # Check f ∘ e' = g ∘ e' and search the unique u: C → E with e ∘ u = e'
+        print("Verifying universal property of the equalizer.")
+        return self._verify_cone([self.morphism1.source, self.morphism1.target],
+                                 [(0, 1, self.morphism1), (0, 1, self.morphism2)],
+                                 [self.cone_morphisms.get("X"), None], [e_prime, None])
 
     def visualize(self, filename: str = "equalizer_diagram", format: str = "png"):
         """
@@ -1,8 +1,12 @@
 # CategoryTheory/AbstractLimit/AbstractLimit.py
 
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
 from AbstractCategory.AbstractCategory import AbstractCategory
 from AbstractCategory.Morphism import Morphism
+from AbstractCategory.Universal import UniversalPropertyVerifier
+from Diagram.Diagram import Diagram
+from FinSet.FinSetCategory import FinSetCategory
 
 class AbstractLimit:
     """
@@ -30,28 +34,82 @@ class AbstractLimit:
     def compute_limit(self) -> Optional[str]:
         """
         Computes the limit object based on the diagram and cone.
-        This method should be overridden by subclasses to provide specific limit computations.
+        In a FinSetCategory the limit of any finite diagram is computed directly, as a
+        multiway join; otherwise this method should be overridden by subclasses.
 
         :return: The name of the limit object, or None if not computed.
         """
+        if isinstance(self.category, FinSetCategory):
+            objects, morphisms = self._diagram_objects_and_morphisms()
+            self.limit_object, projections = self.category.limit_projections(objects, morphisms)
+            self.cone_morphisms = {projection.target: projection for projection in projections}
+            self.is_computed = True
+            print(f"Computed limit object: {self.limit_object} with {self.category.size(self.limit_object)} elements")
+            return self.limit_object
         raise NotImplementedError("compute_limit method must be implemented by subclasses.")
 
-    def verify_universal_property(self) -> bool:
+    def iter_limit(self, chunk_size: int = 1 << 20) -> Iterator[np.ndarray]:
+        """
+        Streams the elements of the limit of a diagram in a FinSetCategory without materializing it.
+
+        :param chunk_size: Approximate number of limit elements per chunk.
+        :return: An iterator of (k, number of objects) arrays of element indices.
+        """
+        if not isinstance(self.category, FinSetCategory):
+            raise ValueError("Streaming limits are only available in a FinSetCategory.")
+        objects, morphisms = self._diagram_objects_and_morphisms()
+        return self.category.iter_limit(objects, morphisms, chunk_size)
+
+    def _diagram_objects_and_morphisms(self) -> Tuple[List[str], List[Morphism]]:
+        """Return the objects and morphisms of the diagram, given either as a Diagram or as a dictionary."""
+        if isinstance(self.diagram, Diagram):
+            return list(self.diagram.objects), list(self.diagram.morphisms)
+        morphisms = [morph for morphs in self.diagram.values() for morph in morphs]
+        objects = list(self.diagram)
+        objects += [obj for morph in morphisms for obj in (morph.source, morph.target) if obj not in objects]
+        return objects, morphisms
+
+    def verify_universal_property(self, other_cone: Optional[Dict[str, Morphism]] = None) -> bool:
         """
         Verifies that the computed limit satisfies the universal property.
         This involves checking that for any other cone, there exists a unique morphism to the limit object.
 
+        :param other_cone: Another cone, mapping each object of the diagram to a morphism into it.
         :return: True if the universal property is satisfied, False otherwise.
         """
         if not self.is_computed or self.limit_object is None:
             print("Limit object has not been computed yet.")
             return False
 
-        # Placeholder for universal property verification.
-        # In a complete implementation, this would involve checking uniqueness of morphisms.
-        # Here, we'll assume it's satisfied.
         print("Verifying universal property of the limit.")
-        return True
+        if isinstance(self.category, FinSetCategory):
+            # The FinSet limit is universal by construction; other cones factor through a row lookup
+            return other_cone is None or self.category.limit_mediating_map(self.limit_object, other_cone) is not None
+
+        objects, morphisms = self._diagram_objects_and_morphisms()
+        position = {obj: i for i, obj in enumerate(objects)}
+        arrows = [(position[m.source], position[m.target], m) for m in morphisms]
+        return self._verify_cone(objects, arrows, [self.cone_morphisms.get(obj) for obj in objects],
+                                 None if other_cone is None else [other_cone.get(obj) for obj in objects])
+
+    def _verify_cone(self, nodes: List[str], arrows: List[Tuple[int, int, Morphism]],
+                     legs: List[Optional[Morphism]], other_legs: Optional[List[Optional[Morphism]]] = None) -> bool:
+        """
+        Checks the universal property in a finite category: the cone must commute, and every
+        other cone (the given one, or all cones over the diagram) must factor through it by
+        exactly one morphism, searched in the hom-sets of the category.
+
+        :param nodes: Objects of the diagram.
+        :param arrows: Arrows of the diagram as (source position, target position, morphism).
+        :param legs: Legs of the computed cone, one per node (None where forced by the arrows).
+        :param other_legs: Legs of another cone, or None to check every cone.
+        :return: True if the universal property is satisfied, False otherwise.
+        """
+        reason = UniversalPropertyVerifier.of(self.category).verify(
+            nodes, arrows, self.limit_object, legs, None if other_legs is None else [other_legs])
+        if reason is not None:
+            print(reason)
+        return reason is None
 
     def __str__(self):
         if self.is_computed and self.limit_object:
@@ -3,6 +3,7 @@
 from typing import Dict, List, Optional
 from AbstractCategory.AbstractCategory import AbstractCategory
 from AbstractCategory.Morphism import Morphism
+from FinSet.FinSetCategory import FinSetCategory
 from .AbstractLimit import AbstractLimit
 
 class Product(AbstractLimit):
@@ -12,27 +13,19 @@ class Product(AbstractLimit):
 
     def __init__(self, 
                  category: AbstractCategory, 
-                 objects: List[str]):
+                 objects: List[str],
+                 lazy: bool = False):
         """
         Initializes the Product with a category and a list of objects.
 
         :param category: The category in which to compute the product.
         :param objects: A list of objects to form the product.
+        :param lazy: In a FinSetCategory, build the product lazily instead of materializing its elements.
         """
+        self.lazy = lazy
         self.product_objects = objects
-        self.diagram = {}  # In products, the diagram consists of projections.
-        self.cone_morphisms = {}  # Morphisms η_X: X → ProductObject
-
-        # Define the diagram as projections from the product to each object
-        for obj in objects:
-            # Projection morphism: π_i: ProductObject → X_i
-            projection_name = f"π_{obj}"
-            projection = category.get_morphism(projection_name)
-            if projection is None:
-                raise ValueError(f"Projection morphism '{projection_name}' not found in the category.")
-            if obj not in self.diagram:
-                self.diagram[obj] = []
-            self.diagram[obj].append(projection)
+        self.diagram = {obj: [] for obj in objects}  # The discrete diagram: no morphisms between the objects.
+        self.cone_morphisms = {}  # Morphisms π_X: ProductObject → X
 
         # Initialize the Product via AbstractLimit's constructor
         super().__init__(category, self.diagram, self.cone_morphisms)
@@ -44,25 +37,47 @@ class Product(AbstractLimit):
 
         :return: The name of the product object, or None if not computed.
         """
-        # For demonstration, assume the product object is predefined
-        # In a real implementation, this would involve constructing the product
-        self.limit_object = "ProductObject"
-        self.cone_morphisms = {obj: Morphism(name=f"π_{obj}", source=self.limit_object, target=obj) for obj in self.product_objects}
+        if isinstance(self.category, FinSetCategory):
+            # The limit of the discrete diagram: a sequence of Cartesian steps
+            self.limit_object, projections = self.category.product_projections(self.product_objects, lazy=self.lazy)
+            self.cone_morphisms = {projection.target: projection for projection in projections}
+            self.is_computed = True
+            print(f"Computed product object: {self.limit_object} with {self.category.size(self.limit_object)} elements")
+            return self.limit_object
+
+        # Elsewhere the product is given by projection morphisms π_X: ProductObject → X of the category
+        projections = {obj: self.category.get_morphism(f"π_{obj}") for obj in self.product_objects}
+        missing = [f"π_{obj}" for obj, projection in projections.items() if projection is None]
+        if missing:
+            raise ValueError(f"Projection morphisms {missing} not found in the category.")
+        sources = {projection.source for projection in projections.values()}
+        if len(sources) != 1:
+            raise ValueError(f"Projection morphisms must share their source, got {sorted(sources)}.")
+        self.limit_object = sources.pop()
+        self.cone_morphisms = projections
         self.is_computed = True
         print(f"Computed product object: {self.limit_object}")
         return self.limit_object
 
-    def verify_universal_property(self) -> bool:
+    def verify_universal_property(self, other_cone: Optional[Dict[str, Morphism]] = None) -> bool:
         """
         Verifies that the computed product satisfies the universal property.
+
+        :param other_cone: Another cone, mapping each object to a morphism into it.
+        :return: True if the universal property is satisfied, False otherwise.
         """
         if not self.is_computed or self.limit_object is None:
             print("Product object has not been computed yet.")
             return False
 
-        # Placeholder: Assume universal property is satisfied
         print("Verifying universal property of the product.")
-        return True
+        if isinstance(self.category, FinSetCategory):
+            return other_cone is None or self.category.limit_mediating_map(self.limit_object, other_cone) is not None
+
+        # The discrete diagram: every pair of morphisms into the factors must factor uniquely
+        return self._verify_cone(self.product_objects, [],
+                                 [self.cone_morphisms.get(obj) for obj in self.product_objects],
+                                 None if other_cone is None else [other_cone.get(obj) for obj in self.product_objects])
 
     def __str__(self):
         if self.is_computed and self.limit_object:
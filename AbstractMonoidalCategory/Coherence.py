@@ -0,0 +1,285 @@
+# CategoryTheory/AbstractMonoidalCategory/Coherence.py
+
+from collections import ChainMap
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
+import multiprocessing
+import numpy as np
+from AbstractCategory.Morphism import Morphism
+
+# Checker shared with forked worker processes
+_WORKER_CHECKER = None
+
+
+def _violations_of_chunk(args) -> Tuple[List[Dict[str, object]], Dict[Tuple, Optional[str]]]:
+    """Worker: check an identity for a chunk of object tuples, returning the verdicts it added."""
+    identity, chunk = args
+    checker = _WORKER_CHECKER
+    verdicts = checker._verdicts
+    checker._verdicts = ChainMap({}, verdicts)
+    try:
+        violations = checker._check_range(identity, checker._rows(identity, chunk))
+        added = checker._verdicts.maps[0]
+    finally:
+        checker._verdicts = verdicts
+    verdicts.update(added)
+    return violations, added
+
+
+class CoherenceChecker:
+    """
+    Checks the pentagon and triangle identities of a monoidal category.
+
+    For every object quadruple (pentagon) or pair (triangle) both sides of the identity are
+    built from the associators, unitors and tensor products of morphisms, and composed through
+    the composition table of the category: identities compose trivially, f ∘ g is the morphism
+    of that name in its hom-set if present, then the user-defined composition of that hom-set,
+    then the only morphism of the hom-set if there is exactly one; otherwise the composite is
+    kept formal. Both sides must agree, or be declared equivalent in the category.
+    """
+
+    # Checked identities: the method checking one object tuple and the size of the tuples
+    ARITY = {"pentagon": 4, "triangle": 2}
+
+    def __init__(self, category, workers: int = 1, chunk_size: int = 4096):
+        """
+        :param category: An AbstractMonoidalCategory.
+        :param workers: Number of processes the object tuples are split across.
+        :param chunk_size: Number of object tuples per task.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+        self.category = category
+        self.workers = workers
+        self.chunk_size = chunk_size
+        # Equivalent objects give the same identities, so only one object per class is checked.
+        # An object is only equivalent to a distinct one through an entry of object_equivalences,
+        # so the representatives are only scanned for objects that have such an entry
+        equivalences = category.object_equivalences
+        self.objects: List[str] = []
+        chosen: Set[str] = set()
+        keyed: List[str] = []
+        for obj in category.objects:
+            if obj in chosen or \
+                    (obj in equivalences and any(category.are_equivalent(obj, other, 'object') for other in self.objects)) or \
+                    any(category.are_equivalent(obj, other, 'object') for other in keyed):
+                continue
+            self.objects.append(obj)
+            chosen.add(obj)
+            if obj in equivalences:
+                keyed.append(obj)
+        self._composites: Dict[Tuple[Morphism, Morphism], Optional[Morphism]] = {}
+        # Tuples whose sides consist of the same morphisms share one verdict
+        self._verdicts: Dict[Tuple, Optional[str]] = {}
+
+    ################################################################################
+    # Composition table
+    ################################################################################
+
+    def identity(self, obj: str) -> Morphism:
+        """The identity of an object, also for tensor products outside the object list."""
+        return self.category.identity_morphisms.get(obj) or Morphism(f"id_{obj}", obj, obj)
+
+    @staticmethod
+    def is_identity(morph: Morphism) -> bool:
+        return morph.source == morph.target and morph.name == f"id_{morph.source}"
+
+    def inverse(self, morph: Morphism) -> Morphism:
+        """The inverse recorded in the category, or a formal inverse of a structural isomorphism."""
+        name = self.category.morphism_equivalences.get(morph.name)
+        inverse = next((m for m in self.category.morphism_association.get(morph.target, {}).get(morph.source, [])
+                        if m.name == name), None)
+        return inverse or Morphism(f"{morph.name}⁻¹", morph.target, morph.source)
+
+    def compose(self, f: Morphism, g: Morphism) -> Optional[Morphism]:
+        """Diagrammatic composite f ∘ g (f first), or None if g does not start where f ends."""
+        key = (f, g)
+        if key not in self._composites:
+            if f.target != g.source:
+                result = None
+            elif self.is_identity(f):
+                result = g
+            elif self.is_identity(g):
+                result = f
+            else:
+                name = f"{f.name} ∘ {g.name}"
+                hom = self.category.morphism_association.get(f.source, {}).get(g.target, [])
+                predefined = self.category.compositions.get((f.source, g.target))
+                result = next((m for m in hom if m.name == name), None) \
+                    or next((m for m in hom if m.name == predefined), None) \
+                    or (hom[0] if len(hom) == 1 else Morphism(name, f.source, g.target))
+            self._composites[key] = result
+        return self._composites[key]
+
+    def compose_path(self, path: Sequence[Morphism]) -> Optional[Morphism]:
+        """Composite of a path of morphisms in diagrammatic order, or None if it does not compose."""
+        result = path[0]
+        for morph in path[1:]:
+            result = self.compose(result, morph)
+            if result is None:
+                return None
+        return result
+
+    def agree(self, f: Morphism, g: Morphism) -> bool:
+        """Whether two parallel morphisms are equal or declared equivalent."""
+        return (f.source, f.target) == (g.source, g.target) and \
+            (f == g or self.category.are_equivalent(f.name, g.name))
+
+    ################################################################################
+    # Identities
+    ################################################################################
+
+    def _structure(self, kind: str, morph: Optional[Morphism], label: str,
+                   source: str, target: str) -> Tuple[Optional[Morphism], Optional[str]]:
+        """A structural morphism checked against its expected source and target."""
+        if morph is None:
+            return None, f"No {kind} {label}."
+        if (morph.source, morph.target) != (source, target):
+            return None, f"{kind.capitalize()} {label} is {morph.name}: {morph.source} → {morph.target}, " \
+                         f"expected {source} → {target}."
+        return morph, None
+
+    def _associator(self, A: str, B: str, C: str):
+        c = self.category
+        return self._structure("associator", c.get_associator(A, B, C), f"α_{{{A},{B},{C}}}",
+                               c.tensor(c.tensor(A, B), C), c.tensor(A, c.tensor(B, C)))
+
+    def _compare(self, left: Sequence[Morphism], right: Sequence[Morphism], name: str) -> Optional[str]:
+        key = (name, tuple(left), tuple(right))
+        if key not in self._verdicts:
+            lhs, rhs = self.compose_path(left), self.compose_path(right)
+            if lhs is None or rhs is None:
+                self._verdicts[key] = f"The sides of the {name} do not compose."
+            elif not self.agree(lhs, rhs):
+                self._verdicts[key] = f"{lhs.name} ≠ {rhs.name}"
+            else:
+                self._verdicts[key] = None
+        return self._verdicts[key]
+
+    def pentagon(self, A: str, B: str, C: str, D: str) -> Optional[str]:
+        """
+        Check the pentagon identity for objects A, B, C, D:
+        α_{A⊗B,C,D} ∘ α_{A,B,C⊗D} = (α_{A,B,C} ⊗ id_D) ∘ α_{A,B⊗C,D} ∘ (id_A ⊗ α_{B,C,D}),
+        composites read in diagrammatic order as everywhere in the category.
+
+        :return: None if it holds, otherwise the reason it fails.
+        """
+        c = self.category
+        AB, BC, CD = c.tensor(A, B), c.tensor(B, C), c.tensor(C, D)
+        sides = [self._associator(AB, C, D), self._associator(A, B, CD), self._associator(A, B, C),
+                 self._associator(A, BC, D), self._associator(B, C, D)]
+        for _, problem in sides:
+            if problem is not None:
+                return problem
+        top1, top2, abc, a_bc_d, bcd = (morph for morph, _ in sides)
+        left = [top1, top2]
+        right = [c.tensor_morphisms_pair(abc, self.identity(D)), a_bc_d,
+                 c.tensor_morphisms_pair(self.identity(A), bcd)]
+        return self._compare(left, right, "pentagon")
+
+    def triangle(self, A: str, B: str) -> Optional[str]:
+        """
+        Check the triangle identity for objects A, B:
+        α_{A,I,B} ∘ (id_A ⊗ λ_B) = ρ_A ⊗ id_B (diagrammatic order).
+
+        :return: None if it holds, otherwise the reason it fails.
+        """
+        c = self.category
+        I = c.unit_object
+        alpha, problem = self._associator(A, I, B)
+        if problem is not None:
+            return problem
+        lam, problem = self._structure("left unitor", c.get_left_unitor(B), f"λ_{B}", c.tensor(I, B), B)
+        if problem is not None:
+            return problem
+        rho, problem = self._structure("right unitor", c.get_right_unitor(A), f"ρ_{A}", c.tensor(A, I), A)
+        if problem is not None:
+            return problem
+        return self._compare([alpha, c.tensor_morphisms_pair(self.identity(A), lam)],
+                             [c.tensor_morphisms_pair(rho, self.identity(B))], "triangle")
+
+    ################################################################################
+    # Enumeration
+    ################################################################################
+
+    def _decode(self, identity: str, codes: np.ndarray) -> np.ndarray:
+        """Object tuples of the given codes, in mixed radix over the object list."""
+        arity, n = self.ARITY[identity], len(self.objects)
+        strides = n ** np.arange(arity - 1, -1, -1, dtype=np.int64)
+        return (codes[:, None] // strides) % n
+
+    def _check_range(self, identity: str, rows: np.ndarray) -> List[Dict[str, object]]:
+        check = getattr(self, identity)
+        violations = []
+        for row in rows:
+            objects = tuple(self.objects[i] for i in row)
+            reason = check(*objects)
+            if reason is not None:
+                violations.append({"identity": identity, "objects": objects, "reason": reason})
+        return violations
+
+    def _rows(self, identity: str, chunk: Union[range, np.ndarray]) -> np.ndarray:
+        """Rows of object indices of a chunk: a range or array of tuple codes, or the rows themselves."""
+        if isinstance(chunk, range):
+            chunk = np.arange(chunk.start, chunk.stop, dtype=np.int64)
+        return self._decode(identity, chunk) if chunk.ndim == 1 else chunk
+
+    def _chunks(self, identity: str, sample: Optional[int], seed: int) -> Iterator[Union[range, np.ndarray]]:
+        """
+        Chunks of object tuples in lexicographic order, see _rows. All tuples are chunked as
+        ranges of codes, so that neither the tuples nor their codes are built ahead of the checks.
+        """
+        arity, n = self.ARITY[identity], len(self.objects)
+        total = n ** arity
+        if sample is None or sample >= total:
+            for lo in range(0, total, self.chunk_size):
+                yield range(lo, min(lo + self.chunk_size, total))
+            return
+        rng = np.random.default_rng(seed)
+        if total < 2 ** 63:
+            drawn = np.sort(rng.choice(total, size=sample, replace=False))
+        else:
+            # Too many tuples to code in 64 bits: draw them directly, repeats are negligible at this size
+            drawn = np.unique(rng.integers(0, n, size=(sample, arity)), axis=0)
+        for lo in range(0, len(drawn), self.chunk_size):
+            yield drawn[lo:lo + self.chunk_size]
+
+    def violations(self, identity: str, sample: Optional[int] = None, seed: int = 0) -> List[Dict[str, object]]:
+        """
+        Check an identity for all object tuples, or a random sample of them.
+
+        :param identity: One of ARITY, e.g. "pentagon" or "triangle".
+        :param sample: Number of object tuples drawn without replacement, or None to check all.
+        :param seed: Seed of the sample.
+        :return: One report {"identity", "objects", "reason"} per failing tuple.
+
+        With several workers, the chunks are streamed to forked processes as they are generated,
+        and the verdicts the workers reach are merged into this checker, so that a later check
+        reuses them; composites memoized in the workers are not kept.
+        """
+        if identity not in self.ARITY:
+            raise ValueError(f"Unknown coherence identity: {identity}")
+        total = len(self.objects) ** self.ARITY[identity]
+        count = total if sample is None else min(sample, total)
+        chunks = self._chunks(identity, sample, seed)
+        if self.workers > 1 and count > self.chunk_size and "fork" in multiprocessing.get_all_start_methods():
+            global _WORKER_CHECKER
+            _WORKER_CHECKER = self
+            violations = []
+            try:
+                with multiprocessing.get_context("fork").Pool(self.workers) as pool:
+                    for found, verdicts in pool.imap(_violations_of_chunk, ((identity, chunk) for chunk in chunks)):
+                        violations.extend(found)
+                        self._verdicts.update(verdicts)
+            finally:
+                _WORKER_CHECKER = None
+            return violations
+        return [violation for chunk in chunks for violation in self._check_range(identity, self._rows(identity, chunk))]
+
+    def pentagon_violations(self, sample: Optional[int] = None, seed: int = 0) -> List[Dict[str, object]]:
+        """Object quadruples violating the pentagon identity, see violations."""
+        return self.violations("pentagon", sample, seed)
+
+    def triangle_violations(self, sample: Optional[int] = None, seed: int = 0) -> List[Dict[str, object]]:
+        """Object pairs violating the triangle identity, see violations."""
+        return self.violations("triangle", sample, seed)
+
@@ -0,0 +1,210 @@
+# CategoryTheory/AbstractMonoidalCategory/Normalizer.py
+
+from typing import Dict, List, Optional, Tuple
+from AbstractCategory.Morphism import Morphism
+from .TensorTerms import OBJECT
+
+# A rewriting step: (depth of its context, kind "α", "λ" or "ρ", term nodes it acts on).
+# The context of a step at depth d is x1 ⊗ (x2 ⊗ (... ⊗ [ ])) for the first d leaves of the
+# right spine built while normalizing, so contexts are shared instead of copied.
+Step = Tuple[int, str, Tuple[int, ...]]
+
+
+class CoherenceNormalizer:
+    """
+    Normal forms of bracketed tensor words with units, after Mac Lane's coherence theorem.
+
+    Terms are node ids of the category's TensorTermStore. The normal form of a term is the
+    word of its non-unit leaves, and two terms are connected by associators and unitors iff
+    their normal forms agree; by coherence all such structural morphisms are then equal, so
+    comparing them costs one pass over the words. Normal forms are cached per term id.
+    """
+
+    def __init__(self, category):
+        """
+        :param category: An AbstractMonoidalCategory.
+        """
+        self.category = category
+        self.terms = category.terms
+        self._normal_forms: Dict[int, Tuple] = {}
+        self._units_only: Dict[int, bool] = {}
+        self._steps: Dict[int, Tuple[Tuple[int, ...], List[Step]]] = {}
+
+    def term(self, expression) -> int:
+        """
+        Intern a bracketed expression of object names, e.g. ("A", (("B", "I"), "C")).
+
+        :return: The term id.
+        """
+        if not isinstance(expression, tuple):
+            return self.terms.leaf(expression)
+        # Iterative post-order, so deeply nested expressions do not hit the recursion limit
+        results: List[int] = []
+        stack = [(expression, False)]
+        while stack:
+            expr, expanded = stack.pop()
+            if not isinstance(expr, tuple):
+                results.append(self.terms.leaf(expr))
+            elif len(expr) != 2:
+                raise ValueError(f"A tensor expression must be a pair, got {len(expr)} factors.")
+            elif expanded:
+                right = results.pop()
+                results.append(self.terms.tensor_nodes(results.pop(), right))
+            else:
+                stack.extend([(expr, True), (expr[1], False), (expr[0], False)])
+        return results[0]
+
+    def _is_unit(self, node: int) -> bool:
+        return self.terms.children[node] is None and self.terms.kinds[node] == OBJECT and \
+            self.terms.leaves[node] == self.category.unit_object
+
+    def normal_form(self, node: int) -> Tuple:
+        """
+        The flat normal form of a term: its non-unit leaves from left to right.
+        Linear in the size of the term; cached subterms are reused as a whole.
+        """
+        if node not in self._normal_forms:
+            word: List = []
+            stack = [node]
+            while stack:
+                top = stack.pop()
+                if top in self._normal_forms:
+                    word.extend(self._normal_forms[top])
+                elif self.terms.children[top] is None:
+                    if not self._is_unit(top):
+                        word.append(self.terms.leaves[top])
+                else:
+                    left, right = self.terms.children[top]
+                    stack.extend((right, left))
+            self._normal_forms[node] = tuple(word)
+        return self._normal_forms[node]
+
+    def units_only(self, node: int) -> bool:
+        """Whether a term consists of units only, i.e. its normal form is empty."""
+        flags = self._units_only
+        stack = [node]
+        while stack:
+            top = stack[-1]
+            if top in flags:
+                stack.pop()
+                continue
+            children = self.terms.children[top]
+            if children is None:
+                flags[top] = self._is_unit(top)
+            elif children[0] in flags and children[1] in flags:
+                flags[top] = flags[children[0]] and flags[children[1]]
+            else:
+                stack.extend(child for child in children if child not in flags)
+                continue
+            stack.pop()
+        return flags[node]
+
+    def coherent(self, source: int, target: int) -> bool:
+        """Whether the two terms are connected by associators and unitors."""
+        return source == target or self.normal_form(source) == self.normal_form(target)
+
+    def same_structural_morphism(self, first: Tuple[int, int], second: Tuple[int, int]) -> bool:
+        """
+        Whether two structural morphisms, given as (source term, target term), are equal.
+        By coherence this only depends on their ends.
+        """
+        return first == second and self.coherent(*first)
+
+    ################################################################################
+    # Canonical composites
+    ################################################################################
+
+    def steps(self, node: int) -> Tuple[Tuple[int, ...], List[Step]]:
+        """
+        The rewriting of a term into its normal bracketing x1 ⊗ (x2 ⊗ (... ⊗ xn)), or into the
+        unit if it consists of units only: (a ⊗ b) ⊗ c is rotated by α_{a,b,c}, I ⊗ r is
+        removed by λ_r and x ⊗ I by ρ_x. Every rotation lengthens the right spine, so there
+        are at most as many steps as leaves.
+
+        :return: The right spine of leaves the contexts refer to, and the steps.
+        """
+        if node in self._steps:
+            return self._steps[node]
+        children = self.terms.children
+        steps: List[Step] = []
+        spine: List[int] = []
+        # (depth, x) once x ⊗ r with r made of units is entered: ρ_x is due when r has become I
+        collapse: Optional[Tuple[int, int]] = None
+        current = node
+        while True:
+            if children[current] is None:
+                if collapse is None:
+                    break
+                depth, x = collapse
+                collapse = None
+                steps.append((depth, "ρ", (x,)))
+                current = x
+                continue
+            left, right = children[current]
+            if children[left] is not None:
+                a, b = children[left]
+                steps.append((len(spine), "α", (a, b, right)))
+                current = self.terms.tensor_nodes(a, self.terms.tensor_nodes(b, right))
+            elif self._is_unit(left):
+                steps.append((len(spine), "λ", (right,)))
+                current = right
+            else:
+                if collapse is None and self.units_only(right):
+                    collapse = (len(spine), left)
+                spine.append(left)
+                current = right
+        self._steps[node] = (tuple(spine), steps)
+        return self._steps[node]
+
+    def _structure(self, kind: str, nodes: Tuple[int, ...]) -> Morphism:
+        c = self.category
+        values = [self.terms.value(n) for n in nodes]
+        if kind == "α":
+            morph = c.get_associator(*values)
+            label = f"α_{{{','.join(values)}}}"
+        elif kind == "λ":
+            morph, label = c.get_left_unitor(values[0]), f"λ_{values[0]}"
+        else:
+            morph, label = c.get_right_unitor(values[0]), f"ρ_{values[0]}"
+        if morph is None:
+            raise ValueError(f"No structural morphism {label} in the category.")
+        return morph
+
+    def _morphism(self, spine: Tuple[int, ...], step: Step, inverse: bool = False) -> Morphism:
+        """A step as a morphism, whiskered by the identities of its context."""
+        depth, kind, nodes = step
+        morph = self._structure(kind, nodes)
+        checker = self.category.coherence_checker()
+        if inverse:
+            morph = checker.inverse(morph)
+        for i in range(depth - 1, -1, -1):
+            morph = self.category.tensor_morphisms_pair(checker.identity(self.terms.value(spine[i])), morph)
+        return morph
+
+    def canonical_path(self, source: int, target: int) -> List[Morphism]:
+        """
+        The canonical structural morphism between two bracketings, as a path in diagrammatic
+        order: normalize the source, then run the normalization of the target backwards.
+
+        :raises ValueError: If the terms have different normal forms or a structural morphism is missing.
+        """
+        if not self.coherent(source, target):
+            raise ValueError(f"{self.terms.value(source)} and {self.terms.value(target)} "
+                             f"are not related by associators and unitors.")
+        if source == target:
+            return []
+        source_spine, source_steps = self.steps(source)
+        target_spine, target_steps = self.steps(target)
+        return [self._morphism(source_spine, step) for step in source_steps] + \
+               [self._morphism(target_spine, step, inverse=True) for step in reversed(target_steps)]
+
+    def canonical_morphism(self, source: int, target: int) -> Optional[Morphism]:
+        """
+        The canonical structural morphism between two bracketings, composed through the
+        composition table of the category (the identity if both terms coincide).
+        """
+        path = self.canonical_path(source, target)
+        checker = self.category.coherence_checker()
+        if not path:
+            return checker.identity(self.terms.value(source))
+        return checker.compose_path(path)
@@ -0,0 +1,284 @@
+# CategoryTheory/AbstractMonoidalCategory/Rewrite.py
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import heapq
+from AbstractCategory.Morphism import Morphism
+from .StringDiagram import StringDiagram
+
+# A match of a rule: pattern box -> host box
+Match = Dict[int, int]
+
+
+class RewriteRule:
+    """
+    A rewrite rule lhs ⇒ rhs between string diagrams with the same boundary, applied in the
+    double-pushout style: the boxes of a match of lhs and the wires between them are deleted,
+    and a copy of rhs is glued in along the boundary wires.
+    """
+
+    def __init__(self, lhs: StringDiagram, rhs: StringDiagram, priority: int = 0, name: Optional[str] = None):
+        """
+        :param lhs: The pattern; it needs at least one box and no wire from its inputs straight to its outputs.
+        :param rhs: The replacement, with the same input and output types as lhs.
+        :param priority: Rules of higher priority are applied first.
+        :param name: Name of the rule in reports.
+        """
+        if not len(lhs):
+            raise ValueError("The left-hand side of a rewrite rule needs at least one box.")
+        if lhs.input_types != rhs.input_types or lhs.output_types != rhs.output_types:
+            raise ValueError(f"Both sides of a rewrite rule need the same boundary: "
+                             f"{lhs.input_types} → {lhs.output_types} vs {rhs.input_types} → {rhs.output_types}.")
+        if set(lhs.inputs) & set(lhs.outputs):
+            raise ValueError("The left-hand side of a rewrite rule cannot pass wires straight through.")
+        for side in (lhs, rhs):
+            boundary = set(side.inputs) | set(side.outputs)
+            if any((side.producer[w] is None or side.consumer[w] is None) and w not in boundary
+                   for w in side.wire_type) or \
+                    any(side.consumer[w] is None and w not in side.outputs for w in side.inputs) or \
+                    any(side.producer[w] is None and w not in side.inputs for w in side.outputs):
+                raise ValueError("Every wire of a rewrite rule must be plugged on both ends.")
+        self.lhs = lhs
+        self.rhs = rhs
+        self.priority = priority
+        self.name = name or f"{' ; '.join(lhs.label[b].name for b in lhs.topological_order())} ⇒ " \
+                            f"{' ; '.join(rhs.label[b].name for b in rhs.topological_order()) or 'id'}"
+        # Connected components of the pattern: the first box of a component is matched through the
+        # label index, the others follow from the wires
+        self.components: List[List[int]] = []
+        seen: Set[int] = set()
+        for box in lhs.topological_order():
+            if box in seen:
+                continue
+            component, stack = [], [box]
+            seen.add(box)
+            while stack:
+                current = stack.pop()
+                component.append(current)
+                for neighbour in lhs.successors(current) + lhs.predecessors(current):
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        stack.append(neighbour)
+            self.components.append(component)
+
+    def __repr__(self):
+        return f"RewriteRule({self.name}, priority={self.priority})"
+
+
+class Rewriter:
+    """
+    Applies rewrite rules to string diagrams until none matches.
+
+    Matches are searched from an anchor box found through the label index of the diagram and
+    extended deterministically along the wires, so a connected pattern is matched in time
+    proportional to its size. A match is only applied if it is convex (no path leaves it and
+    re-enters it), which is decided by a search bounded by the topological ranks of the boxes.
+    Pending (rule, box) pairs are kept in a priority queue ordered by rule priority, and after
+    every rewrite only the neighbourhood of the rewritten region is revisited.
+    """
+
+    def __init__(self, rules: Sequence[RewriteRule]):
+        """
+        :param rules: The rewrite rules; rules of equal priority are tried in the given order.
+        """
+        self.rules = sorted(rules, key=lambda rule: -rule.priority)
+        self._anchors: Dict[Morphism, List[Tuple[int, int]]] = {}
+        for r, rule in enumerate(self.rules):
+            for box, label in rule.lhs.label.items():
+                self._anchors.setdefault(label, []).append((r, box))
+        self.radius = max((len(rule.lhs) for rule in self.rules), default=1)
+        self.steps: List[Tuple[str, List[int]]] = []
+
+    ################################################################################
+    # Matching
+    ################################################################################
+
+    @staticmethod
+    def _fits(host: StringDiagram, pattern: StringDiagram, h: int, p: int) -> bool:
+        return host.label[h] == pattern.label[p] and \
+            [host.wire_type[w] for w in host.box_inputs[h]] == [pattern.wire_type[w] for w in pattern.box_inputs[p]] and \
+            [host.wire_type[w] for w in host.box_outputs[h]] == [pattern.wire_type[w] for w in pattern.box_outputs[p]]
+
+    def _propagate(self, host: StringDiagram, pattern: StringDiagram, match: Match, used: Set[int], root: int) -> bool:
+        """Extend a match from one assigned pattern box along the wires of its component."""
+        stack = [root]
+        while stack:
+            p = stack.pop()
+            h = match[p]
+            for pattern_wires, host_wires, other_end, host_end in (
+                    (pattern.box_outputs[p], host.box_outputs[h], pattern.consumer, host.consumer),
+                    (pattern.box_inputs[p], host.box_inputs[h], pattern.producer, host.producer)):
+                for k, wire in enumerate(pattern_wires):
+                    end = other_end[wire]
+                    if end is None:
+                        continue
+                    found = host_end[host_wires[k]]
+                    if found is None or found[1] != end[1]:
+                        return False
+                    q, g = end[0], found[0]
+                    if q in match:
+                        if match[q] != g:
+                            return False
+                    elif g in used or not self._fits(host, pattern, g, q):
+                        return False
+                    else:
+                        match[q] = g
+                        used.add(g)
+                        stack.append(q)
+        return True
+
+    def _boundary(self, host: StringDiagram, pattern: StringDiagram, match: Match) -> Optional[Tuple[List[int], List[int]]]:
+        """Host wires of the pattern boundary, or None if one of them is internal to the match."""
+        matched = set(match.values())
+        inputs, outputs = [], []
+        for wire in pattern.inputs:
+            p, port = pattern.consumer[wire]
+            host_wire = host.box_inputs[match[p]][port]
+            producer = host.producer[host_wire]
+            if producer is not None and producer[0] in matched:
+                return None
+            inputs.append(host_wire)
+        for wire in pattern.outputs:
+            p, port = pattern.producer[wire]
+            host_wire = host.box_outputs[match[p]][port]
+            consumer = host.consumer[host_wire]
+            if consumer is not None and consumer[0] in matched:
+                return None
+            outputs.append(host_wire)
+        return inputs, outputs
+
+    @staticmethod
+    def _convex(host: StringDiagram, matched: Set[int]) -> bool:
+        """Whether no path leaves the matched boxes and enters them again."""
+        bound = max(host.rank[b] for b in matched)
+        stack = [s for b in matched for s in host.successors(b) if s not in matched and host.rank[s] < bound]
+        seen = set(stack)
+        while stack:
+            box = stack.pop()
+            for s in host.successors(box):
+                if s in matched:
+                    return False
+                if s not in seen and host.rank[s] < bound:
+                    seen.add(s)
+                    stack.append(s)
+        return True
+
+    def _complete(self, host: StringDiagram, rule: RewriteRule, roots: List[int], match: Match,
+                  used: Set[int]) -> Optional[Match]:
+        """Match the components of the pattern with the given roots by backtracking over the label index."""
+        if not roots:
+            if self._boundary(host, rule.lhs, match) is None or not self._convex(host, set(match.values())):
+                return None
+            return match
+        root = roots[0]
+        for candidate in sorted(host.by_label.get(rule.lhs.label[root], ())):
+            if candidate in used or not self._fits(host, rule.lhs, candidate, root):
+                continue
+            extended, extended_used = dict(match), set(used)
+            extended[root] = candidate
+            extended_used.add(candidate)
+            if self._propagate(host, rule.lhs, extended, extended_used, root):
+                result = self._complete(host, rule, roots[1:], extended, extended_used)
+                if result is not None:
+                    return result
+        return None
+
+    def match_at(self, host: StringDiagram, rule: RewriteRule, box: int) -> Optional[Match]:
+        """A match of the rule containing the given host box, or None."""
+        for p in rule.lhs.label:
+            if not self._fits(host, rule.lhs, box, p):
+                continue
+            match, used = {p: box}, {box}
+            if not self._propagate(host, rule.lhs, match, used, p):
+                continue
+            # The anchored component is complete; match the others
+            roots = [c[0] for c in rule.components if p not in c]
+            result = self._complete(host, rule, roots, match, used)
+            if result is not None:
+                return result
+        return None
+
+    def find(self, host: StringDiagram, rule: RewriteRule) -> Optional[Match]:
+        """Any match of the rule in the diagram, or None."""
+        anchor = rule.components[0][0]
+        for box in sorted(host.by_label.get(rule.lhs.label[anchor], ()), key=host.rank.__getitem__):
+            match = self.match_at(host, rule, box)
+            if match is not None:
+                return match
+        return None
+
+    ################################################################################
+    # Rewriting
+    ################################################################################
+
+    def apply(self, host: StringDiagram, rule: RewriteRule, match: Match) -> List[int]:
+        """
+        Replace a match of rule.lhs by a copy of rule.rhs.
+
+        :return: The boxes of the diagram next to the rewritten region, including the new ones.
+        """
+        inputs, outputs = self._boundary(host, rule.lhs, match)
+        matched = set(match.values())
+        internal = [w for b in matched for w in host.box_outputs[b]
+                    if host.consumer[w] is not None and host.consumer[w][0] in matched]
+        before = [host.producer[w][0] for w in inputs if host.producer[w] is not None]
+        after = [host.consumer[w][0] for w in outputs if host.consumer[w] is not None]
+        ranks = [host.rank[b] for b in matched]
+        lo = max((host.rank[b] for b in before), default=min(ranks) - 1.0)
+        hi = min((host.rank[b] for b in after), default=max(ranks) + 1.0)
+        for box in matched:
+            host.remove_box(box)
+        for wire in internal:
+            host._drop_wire(wire)
+        consistent = lo < hi and hi - lo > 1e-9 * max(1.0, abs(lo))
+        new_boxes, _ = host._embed(rule.rhs, inputs, outputs, (lo, hi) if consistent else (lo, lo + 1.0))
+        if new_boxes and not consistent:
+            host.rerank()
+        self.steps.append((rule.name, sorted(matched)))
+        return new_boxes + [b for b in before + after if b in host.label]
+
+    def _push(self, queue: list, host: StringDiagram, boxes: Sequence[int]):
+        for box in boxes:
+            for r, _ in self._anchors.get(host.label.get(box), ()):
+                heapq.heappush(queue, (r, host.rank[box], box))
+
+    def _neighbourhood(self, host: StringDiagram, boxes: Sequence[int]) -> List[int]:
+        """Boxes within the radius of the largest pattern from the given ones."""
+        seen = set(b for b in boxes if b in host.label)
+        frontier = list(seen)
+        for _ in range(self.radius - 1):
+            frontier = [n for b in frontier for n in host.successors(b) + host.predecessors(b) if n not in seen]
+            seen.update(frontier)
+        return list(seen)
+
+    def rewrite(self, host: StringDiagram, max_steps: Optional[int] = None) -> int:
+        """
+        Rewrite the diagram in place until no rule matches (a fixpoint) or max_steps rewrites.
+
+        :return: The number of rewrites applied.
+        """
+        count = 0
+        queue: list = []
+        self._push(queue, host, list(host.label))
+        while max_steps is None or count < max_steps:
+            while queue and (max_steps is None or count < max_steps):
+                r, _, box = heapq.heappop(queue)
+                if box not in host.label:
+                    continue
+                match = self.match_at(host, self.rules[r], box)
+                if match is not None:
+                    touched = self.apply(host, self.rules[r], match)
+                    count += 1
+                    self._push(queue, host, self._neighbourhood(host, touched))
+            if max_steps is not None and count >= max_steps:
+                break
+            # A rewrite may make a distant match convex, so the fixpoint is confirmed by a full sweep
+            for r, rule in enumerate(self.rules):
+                match = self.find(host, rule)
+                if match is not None:
+                    touched = self.apply(host, rule, match)
+                    count += 1
+                    self._push(queue, host, self._neighbourhood(host, touched))
+                    break
+            else:
+                break
+        return count
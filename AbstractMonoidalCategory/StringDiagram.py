@@ -0,0 +1,304 @@
+# CategoryTheory/AbstractMonoidalCategory/StringDiagram.py
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from AbstractCategory.Morphism import Morphism
+
+# A port of a box: (box id, position among its inputs or outputs)
+Port = Tuple[int, int]
+
+
+class StringDiagram:
+    """
+    A string diagram as an open hypergraph: boxes labelled by morphisms are hyperedges
+    from a list of input wires to a list of output wires, and every wire is produced by at
+    most one box port (or is an input of the diagram) and consumed by at most one box port
+    (or is an output of the diagram).
+
+    Boxes are indexed by label for subgraph matching, and carry a rank that is kept
+    consistent with a topological order so that convexity of matches can be decided by a
+    search bounded to the region between them.
+    """
+
+    def __init__(self, input_types: Sequence[str] = ()):
+        """
+        :param input_types: Object types of the input wires; the diagram starts as their identity.
+        """
+        self.wire_type: Dict[int, str] = {}
+        self.producer: Dict[int, Optional[Port]] = {}
+        self.consumer: Dict[int, Optional[Port]] = {}
+        self.label: Dict[int, Morphism] = {}
+        self.box_inputs: Dict[int, List[int]] = {}
+        self.box_outputs: Dict[int, List[int]] = {}
+        self.rank: Dict[int, float] = {}
+        self.by_label: Dict[Morphism, Set[int]] = {}
+        self._next_wire = 0
+        self._next_box = 0
+        self.inputs: List[int] = [self._new_wire(t) for t in input_types]
+        self.outputs: List[int] = list(self.inputs)
+
+    def _new_wire(self, wire_type: str) -> int:
+        wire = self._next_wire
+        self._next_wire += 1
+        self.wire_type[wire] = wire_type
+        self.producer[wire] = None
+        self.consumer[wire] = None
+        return wire
+
+    def __len__(self) -> int:
+        """Number of boxes."""
+        return len(self.label)
+
+    @property
+    def input_types(self) -> List[str]:
+        return [self.wire_type[w] for w in self.inputs]
+
+    @property
+    def output_types(self) -> List[str]:
+        return [self.wire_type[w] for w in self.outputs]
+
+    ################################################################################
+    # Construction
+    ################################################################################
+
+    def add_box(self, label: Morphism, inputs: Sequence[int], output_types: Sequence[str],
+                rank: Optional[float] = None) -> List[int]:
+        """
+        Add a box consuming wires of the diagram that are not consumed yet.
+
+        :param label: The morphism the box stands for.
+        :param inputs: The wires plugged into the box, in order.
+        :param output_types: Object types of the new output wires.
+        :param rank: Position in the topological order (after every box so far by default).
+        :return: The output wires of the box.
+        """
+        box = self._next_box
+        self._next_box += 1
+        for port, wire in enumerate(inputs):
+            if self.consumer[wire] is not None:
+                raise ValueError(f"Wire {wire} is already consumed.")
+            self.consumer[wire] = (box, port)
+        outputs = [self._new_wire(t) for t in output_types]
+        for port, wire in enumerate(outputs):
+            self.producer[wire] = (box, port)
+        self.label[box] = label
+        self.box_inputs[box] = list(inputs)
+        self.box_outputs[box] = outputs
+        self.rank[box] = float(box) if rank is None else rank
+        self.by_label.setdefault(label, set()).add(box)
+        return outputs
+
+    def then_box(self, label: Morphism, input_types: Sequence[str], output_types: Sequence[str],
+                 offset: int = 0):
+        """
+        Append a box to the outputs of the diagram: it consumes len(input_types) outputs from
+        position offset on, and its outputs take their place.
+        """
+        wires = self.outputs[offset:offset + len(input_types)]
+        if [self.wire_type[w] for w in wires] != list(input_types):
+            raise ValueError(f"Cannot plug {label.name}: expected {list(input_types)}, "
+                             f"got {[self.wire_type[w] for w in wires]}.")
+        outputs = self.add_box(label, wires, output_types)
+        self.outputs[offset:offset + len(input_types)] = outputs
+        return self
+
+    def remove_box(self, box: int):
+        """Remove a box; its wires stay in the diagram, unplugged on the box side."""
+        for wire in self.box_inputs.pop(box):
+            self.consumer[wire] = None
+        for wire in self.box_outputs.pop(box):
+            self.producer[wire] = None
+        boxes = self.by_label[self.label[box]]
+        boxes.discard(box)
+        if not boxes:
+            del self.by_label[self.label[box]]
+        del self.label[box]
+        del self.rank[box]
+
+    def _embed(self, other: "StringDiagram", inputs: Sequence[int], outputs: Optional[Sequence[int]] = None,
+               ranks: Optional[Tuple[float, float]] = None) -> Tuple[List[int], List[int]]:
+        """
+        Copy the boxes of another diagram into this one, gluing its inputs to the given wires
+        (which must not be consumed) and, if given, its outputs to the given wires (which must
+        not be produced). An input of the other diagram that is also one of its outputs is
+        merged with the corresponding output wire.
+
+        :param ranks: Open interval the ranks of the copied boxes are spread over.
+        :return: The new boxes and the wires its outputs ended up on.
+        """
+        wire_map: Dict[int, int] = dict(zip(other.inputs, inputs))
+        order = other.topological_order()
+        lo, hi = ranks if ranks is not None else (None, None)
+        boxes = []
+        for i, box in enumerate(order):
+            rank = None if lo is None else lo + (hi - lo) * (i + 1) / (len(order) + 1)
+            box_outputs = self.add_box(other.label[box], [wire_map[w] for w in other.box_inputs[box]],
+                                       [other.wire_type[w] for w in other.box_outputs[box]], rank)
+            wire_map.update(zip(other.box_outputs[box], box_outputs))
+            boxes.append(self._next_box - 1)
+        ends = [wire_map[w] for w in other.outputs]
+        if outputs is not None:
+            ends = [self._merge(end, target) for end, target in zip(ends, outputs)]
+        return boxes, ends
+
+    def _merge(self, wire: int, target: int) -> int:
+        """
+        Identify a wire with an unproduced target wire: the producer of wire feeds target instead.
+        A wire without producer flows straight through, so it takes over the consumer of target.
+
+        :return: The wire that is kept.
+        """
+        if wire == target:
+            return wire
+        source = self.producer[wire]
+        if source is None:
+            # An input wire of the diagram flowing straight through: keep it, drop the target
+            consumer = self.consumer[target]
+            if consumer is not None:
+                self.box_inputs[consumer[0]][consumer[1]] = wire
+            else:
+                self.outputs = [wire if w == target else w for w in self.outputs]
+            self.consumer[wire] = consumer
+            self._drop_wire(target)
+            return wire
+        box, port = source
+        self.box_outputs[box][port] = target
+        self.producer[target] = source
+        self._drop_wire(wire)
+        return target
+
+    def _drop_wire(self, wire: int):
+        del self.wire_type[wire]
+        del self.producer[wire]
+        del self.consumer[wire]
+
+    def then(self, other: "StringDiagram") -> "StringDiagram":
+        """Sequential composition in place: plug the outputs of this diagram into the inputs of other."""
+        if self.output_types != other.input_types:
+            raise ValueError(f"Cannot compose diagrams: {self.output_types} ≠ {other.input_types}.")
+        _, self.outputs = self._embed(other, self.outputs)
+        return self
+
+    def tensor(self, other: "StringDiagram") -> "StringDiagram":
+        """Parallel composition in place: place other to the right of this diagram."""
+        inputs = [self._new_wire(t) for t in other.input_types]
+        self.inputs.extend(inputs)
+        _, outputs = self._embed(other, inputs)
+        self.outputs.extend(outputs)
+        return self
+
+    def copy(self) -> "StringDiagram":
+        result = StringDiagram(self.input_types)
+        _, result.outputs = result._embed(self, result.inputs)
+        return result
+
+    ################################################################################
+    # Order
+    ################################################################################
+
+    def topological_order(self) -> List[int]:
+        """Boxes sorted by rank, which is a topological order of the diagram."""
+        return sorted(self.label, key=self.rank.__getitem__)
+
+    def rerank(self):
+        """Recompute the ranks as a topological order (Kahn's algorithm)."""
+        missing = {box: sum(self.producer[w] is not None for w in ins) for box, ins in self.box_inputs.items()}
+        ready = sorted((box for box, count in missing.items() if count == 0), key=self.rank.__getitem__)
+        order = []
+        while ready:
+            box = ready.pop()
+            order.append(box)
+            for wire in self.box_outputs[box]:
+                consumer = self.consumer[wire]
+                if consumer is not None:
+                    missing[consumer[0]] -= 1
+                    if missing[consumer[0]] == 0:
+                        ready.append(consumer[0])
+        if len(order) != len(self.label):
+            raise ValueError("The string diagram has a cycle.")
+        self.rank = {box: float(i) for i, box in enumerate(order)}
+
+    def successors(self, box: int) -> List[int]:
+        return [self.consumer[w][0] for w in self.box_outputs[box] if self.consumer[w] is not None]
+
+    def predecessors(self, box: int) -> List[int]:
+        return [self.producer[w][0] for w in self.box_inputs[box] if self.producer[w] is not None]
+
+    ################################################################################
+    # Morphisms
+    ################################################################################
+
+    @classmethod
+    def from_morphism(cls, category, morph: Morphism) -> "StringDiagram":
+        """
+        The string diagram of a morphism of a monoidal category: composites recorded by compose
+        become sequential compositions, tensor products built through the category's term store
+        become parallel compositions, and any other morphism is a single box. The unit object
+        has no wires, and where a composite regroups wires (e.g. a box on A⊗B followed by the
+        tensor of boxes on A and B) a box labelled by the identity of the shared object is inserted.
+        """
+        def types(obj: str) -> List[str]:
+            return [] if obj == category.unit_object else [obj]
+
+        # Input and output wire types of every subterm, by an iterative post-order so that
+        # long composites do not hit the recursion limit
+        boundary: Dict[Morphism, Tuple[List[str], List[str]]] = {}
+        factors: Dict[Morphism, Optional[Tuple[str, Morphism, Morphism]]] = {}
+        stack = [(morph, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if current in boundary:
+                continue
+            if current not in factors:
+                factors[current] = category.factors(current)
+            parts = factors[current]
+            if parts is None:
+                boundary[current] = (types(current.source), types(current.target))
+            elif not expanded:
+                stack.append((current, True))
+                stack.extend((part, False) for part in parts[1:])
+            else:
+                kind, first, second = parts
+                if kind == "⊗":
+                    boundary[current] = (boundary[first][0] + boundary[second][0],
+                                         boundary[first][1] + boundary[second][1])
+                else:
+                    boundary[current] = (boundary[first][0], boundary[second][1])
+
+        # Add the boxes to one diagram in order, each once: a task either plugs a subterm into
+        # wires (pushing the wires of its outputs on values) or continues a composite
+        diagram = cls(boundary[morph][0])
+        values: List[List[int]] = []
+        tasks = [("plug", morph, diagram.inputs)]
+        while tasks:
+            task = tasks.pop()
+            if task[0] == "join":
+                second_outputs = values.pop()
+                values.append(values.pop() + second_outputs)
+                continue
+            if task[0] == "then":
+                _, first, second = task
+                wires = values.pop()
+                if boundary[first][1] != boundary[second][0]:
+                    regroup = Morphism(f"id_{first.target}", first.target, first.target)
+                    wires = diagram.add_box(regroup, wires, boundary[second][0])
+                tasks.append(("plug", second, wires))
+                continue
+            _, current, wires = task
+            parts = factors[current]
+            if parts is None:
+                found = [diagram.wire_type[w] for w in wires]
+                if found != boundary[current][0]:
+                    raise ValueError(f"Cannot plug {current.name}: expected {boundary[current][0]}, got {found}.")
+                values.append(diagram.add_box(current, wires, boundary[current][1]))
+            elif parts[0] == "⊗":
+                _, first, second = parts
+                k = len(boundary[first][0])
+                tasks.extend([("join",), ("plug", second, wires[k:]), ("plug", first, wires[:k])])
+            else:
+                _, first, second = parts
+                tasks.extend([("then", first, second), ("plug", first, wires)])
+        diagram.outputs = values.pop()
+        return diagram
+
+    def __repr__(self):
+        return f"StringDiagram({len(self.label)} boxes, {self.input_types} → {self.output_types})"
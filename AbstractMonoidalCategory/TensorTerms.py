@@ -0,0 +1,171 @@
+# CategoryTheory/AbstractMonoidalCategory/TensorTerms.py
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from AbstractCategory.Morphism import Morphism
+
+# Node kinds of the term store
+OBJECT = "object"
+MORPHISM = "morphism"
+
+
+class TensorTermStore:
+    """
+    A hash-consed store of tensor expressions over objects and morphisms.
+
+    Every expression is interned as an integer node id: a leaf wraps an object name or a
+    Morphism, and an inner node is the tensor of two child ids. Building the same expression
+    again returns the same id, so A⊗(B⊗C) is represented once however often it is built.
+    Values are obtained by applying the user tensor functions to the values of the children,
+    memoized in an LRU cache keyed by node id, so repeated products return the very same
+    string or Morphism instance instead of rebuilding it. Only cached values are remembered
+    as products (see node_of and factors), so that maxsize also bounds the values kept alive.
+    """
+
+    def __init__(self,
+                 tensor_objects_func: Callable[[str, str], str],
+                 tensor_morphisms_func: Optional[Callable[[Morphism, Morphism], Morphism]] = None,
+                 maxsize: Optional[int] = 1 << 16):
+        """
+        :param tensor_objects_func: Function to compute tensor product of two objects.
+        :param tensor_morphisms_func: Function to compute tensor product of two morphisms.
+        :param maxsize: Maximum number of memoized tensor values (None for unbounded).
+        """
+        self.functions = {OBJECT: tensor_objects_func, MORPHISM: tensor_morphisms_func}
+        self.maxsize = maxsize
+        # Node table: kind, children (None for leaves) and the wrapped value of leaves
+        self.kinds: List[str] = []
+        self.children: List[Optional[Tuple[int, int]]] = []
+        self.leaves: List[Any] = []
+        self._nodes: Dict[Tuple[Hashable, ...], int] = {}
+        # The node that produced every cached value, so values can be fed back in
+        self._node_of_value: Dict[Tuple[str, Hashable], int] = {}
+        self._values: "OrderedDict[int, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def _intern(self, key: Tuple[Hashable, ...], kind: str, children: Optional[Tuple[int, int]], leaf: Any) -> int:
+        node = self._nodes.get(key)
+        if node is None:
+            node = len(self.kinds)
+            self._nodes[key] = node
+            self.kinds.append(kind)
+            self.children.append(children)
+            self.leaves.append(leaf)
+        return node
+
+    def leaf(self, value: Any, kind: str = OBJECT) -> int:
+        """
+        Intern an object name (or Morphism if kind is MORPHISM) as a leaf.
+
+        :return: The node id of the leaf.
+        """
+        return self._intern((kind, value), kind, None, value)
+
+    def tensor_nodes(self, left: int, right: int) -> int:
+        """
+        Intern the tensor of two nodes of the same kind.
+
+        :return: The node id of left ⊗ right.
+        """
+        kind = self.kinds[left]
+        if self.kinds[right] != kind:
+            raise ValueError("Cannot tensor an object with a morphism.")
+        return self._intern(("⊗", left, right), kind, (left, right), None)
+
+    def node_of(self, value: Any, kind: str = OBJECT) -> int:
+        """The node a cached value was produced by, or a leaf for any other value."""
+        node = self._node_of_value.get((kind, value))
+        return self.leaf(value, kind) if node is None else node
+
+    def value(self, node: int) -> Any:
+        """
+        The value of a node: the wrapped value of a leaf, or the user tensor function applied
+        to the values of its children (memoized with LRU eviction).
+        """
+        children = self.children[node]
+        if children is None:
+            return self.leaves[node]
+        if node in self._values:
+            self.hits += 1
+            self._values.move_to_end(node)
+            return self._values[node]
+        self.misses += 1
+        # Evaluate iteratively so deep left- or right-nested terms do not hit the recursion limit;
+        # values of this evaluation are kept locally so eviction cannot drop a pending child
+        computed: Dict[int, Any] = {}
+
+        def known(child: int) -> bool:
+            return self.children[child] is None or child in computed or child in self._values
+
+        def get(child: int) -> Any:
+            if self.children[child] is None:
+                return self.leaves[child]
+            return computed[child] if child in computed else self._values[child]
+
+        stack = [node]
+        while stack:
+            top = stack[-1]
+            pending = [child for child in self.children[top] if not known(child)]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            if top not in computed:
+                left, right = self.children[top]
+                computed[top] = self.functions[self.kinds[top]](get(left), get(right))
+                self._remember(top, computed[top])
+        return computed[node]
+
+    def _remember(self, node: int, result: Any):
+        self._values[node] = result
+        key = (self.kinds[node], result)
+        # Values that are already leaves (e.g. A for I⊗A) keep resolving to their leaf
+        if key not in self._nodes:
+            self._node_of_value.setdefault(key, node)
+        if self.maxsize is not None:
+            while len(self._values) > self.maxsize:
+                evicted, value = self._values.popitem(last=False)
+                key = (self.kinds[evicted], value)
+                if self._node_of_value.get(key) == evicted:
+                    del self._node_of_value[key]
+
+    def _tensor_values(self, kind: str, left: Any, right: Any) -> Any:
+        # Fast path: both operands and their product already interned and cached
+        lookup = self._node_of_value.get
+        left_node = lookup((kind, left))
+        if left_node is None:
+            left_node = self.leaf(left, kind)
+        right_node = lookup((kind, right))
+        if right_node is None:
+            right_node = self.leaf(right, kind)
+        node = self._nodes.get(("⊗", left_node, right_node))
+        if node is not None and node in self._values:
+            self.hits += 1
+            self._values.move_to_end(node)
+            return self._values[node]
+        return self.value(self.tensor_nodes(left_node, right_node))
+
+    def tensor_objects(self, obj1: str, obj2: str) -> str:
+        """Memoized, hash-consed tensor product of two objects."""
+        return self._tensor_values(OBJECT, obj1, obj2)
+
+    def tensor_morphisms(self, morph1: Morphism, morph2: Morphism) -> Morphism:
+        """Memoized, hash-consed tensor product of two morphisms."""
+        return self._tensor_values(MORPHISM, morph1, morph2)
+
+    def factors(self, value: Any, kind: str = OBJECT) -> Optional[Tuple[Any, Any]]:
+        """The two factors a cached value was produced from by the store, or None."""
+        node = self._node_of_value.get((kind, value))
+        if node is None:
+            return None
+        left, right = self.children[node]
+        return self.value(left), self.value(right)
+
+    def cache_info(self) -> Dict[str, Optional[int]]:
+        """Statistics of the term store and its value cache."""
+        return {"nodes": len(self.kinds), "cached": len(self._values), "maxsize": self.maxsize,
+                "hits": self.hits, "misses": self.misses}
@@ -1,7 +1,18 @@
 # CategoryTheory/AbstractMonoidalCategory/__init__.py
 
 from .AbstractMonoidalCategory import AbstractMonoidalCategory
+from .Coherence import CoherenceChecker
+from .Normalizer import CoherenceNormalizer
+from .Rewrite import RewriteRule, Rewriter
+from .StringDiagram import StringDiagram
+from .TensorTerms import TensorTermStore
 
 __all__ = [
-    "AbstractMonoidalCategory"
+    "AbstractMonoidalCategory",
+    "TensorTermStore",
+    "CoherenceChecker",
+    "CoherenceNormalizer",
+    "StringDiagram",
+    "RewriteRule",
+    "Rewriter"
 ]
@@ -1,10 +1,12 @@
 # CategoryTheory/AbstractPullback/AbstractPullback.py
 
-from typing import Dict, List, Optional, Callable
+from typing import Dict, Iterator, List, Optional, Callable, Tuple
+import numpy as np
 from AbstractLimit.AbstractLimit import AbstractLimit
 from AbstractCategory.Morphism import Morphism
 from AbstractCategory.AbstractCategory import AbstractCategory
 from Diagram.Diagram import Diagram
+from FinSet.FinSetCategory import FinSetCategory
 
 class Pullback(AbstractLimit):
     """
@@ -43,6 +45,14 @@ class Pullback(AbstractLimit):
 
         :return: The name of the pullback object, or None if not computed.
         """
+        if self._is_finset():
+            # Concrete pullback {(x, y) | f(x) = g(y)} computed as an equi-join
+            self.limit_object, p1, p2 = self.category.pullback_projections(self.morphism1, self.morphism2)
+            self.cone_morphisms = {"X": p1, "Y": p2}
+            self.is_computed = True
+            print(f"Computed pullback object: {self.limit_object} with {self.category.size(self.limit_object)} elements")
+            return self.limit_object
+
         # For demonstration, assume the pullback object is predefined
         # In a real implementation, this would involve constructing the pullback
         self.limit_object = "PullbackObject"
@@ -54,6 +64,21 @@ class Pullback(AbstractLimit):
         print(f"Computed pullback object: {self.limit_object}")
         return self.limit_object
     
+    def iter_limit(self, chunk_size: int = 1 << 20) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Streams the pullback of two FinSet morphisms in chunks, without registering it.
+
+        :param chunk_size: Number of elements of X joined per chunk.
+        :return: An iterator of (x indices, y indices) chunks.
+        """
+        if not self._is_finset():
+            raise TypeError("Streaming pullbacks require a FinSetCategory.")
+        return self.category.iter_pullback(self.morphism1, self.morphism2, chunk_size)
+
+    def _is_finset(self) -> bool:
+        """Whether the cospan lives in a FinSetCategory, so the pullback can be computed."""
+        return isinstance(self.category, FinSetCategory)
+
     def verify_universal_property(self, other_cone: Dict[str, Morphism]) -> bool:
         """
         Verifies that the computed pullback satisfies the universal property.
@@ -74,17 +99,22 @@ class Pullback(AbstractLimit):
         eta_prime_X = other_cone["X"]
         eta_prime_Y = other_cone["Y"]
 
-        # Check if f ∘ u = η'_X and g ∘ u = η'_Y hold
-        # Here, we cannot actually compute u since there are no specific category operations
-        # So, we assume the existence of a unique u and return True
+        if self._is_finset():
+            print("Verifying universal property of the pullback.")
+            u = self.category.pullback_mediating_map(self.morphism1, self.morphism2, eta_prime_X, eta_prime_Y)
+            if u is None:
+                print(f"{eta_prime_X.name} and {eta_prime_Y.name} do not form a cone over the cospan.")
+                return False
+            # u is unique because the elements of the pullback are distinct pairs
+            return (np.array_equal(self.cone_morphisms["X"].index_map[u], eta_prime_X.index_map) and
+                    np.array_equal(self.cone_morphisms["Y"].index_map[u], eta_prime_Y.index_map))
 
+        # Search the unique u: C → P with η_X ∘ u = η'_X and η_Y ∘ u = η'_Y (the leg to Z is forced)
         print("Verifying universal property of the pullback.")
-        print(f"Assuming existence of unique morphism u: C → {self.limit_object} such that:")
-        print(f"  {self.morphism1.name} ∘ u = {eta_prime_X.name}")
-        print(f"  {self.morphism2.name} ∘ u = {eta_prime_Y.name}")
-        
-        # Return True, indicating verification passed
-        return True
+        return self._verify_cone([self.morphism1.source, self.morphism2.source, self.morphism1.target],
+                                 [(0, 2, self.morphism1), (1, 2, self.morphism2)],
+                                 [self.cone_morphisms.get("X"), self.cone_morphisms.get("Y"), None],
+                                 [eta_prime_X, eta_prime_Y, None])
     
     def visualize(self, filename: str = "pullback_diagram", format: str = "png"):
         """
@@ -5,6 +5,7 @@ from AbstractColimit.AbstractColimit import AbstractColimit
 from AbstractCategory.Morphism import Morphism
 from AbstractCategory.AbstractCategory import AbstractCategory
 from Diagram.Diagram import Diagram
+from FinSet.FinSetCategory import FinSetCategory
 
 class Pushout(AbstractColimit):
     """
@@ -43,6 +44,14 @@ class Pushout(AbstractColimit):
 
         :return: The name of the pushout object, or None if not computed.
         """
+        if isinstance(self.category, FinSetCategory):
+            # Concrete pushout: X ⊔ Y modulo f(z) ~ g(z), via the finite colimit engine
+            self.colimit_object, i_X, i_Y = self.category.pushout_injections(self.morphism1, self.morphism2)
+            self.cocone_morphisms = {"X": i_X, "Y": i_Y}
+            self.is_computed = True
+            print(f"Computed pushout object: {self.colimit_object} with {self.category.size(self.colimit_object)} elements")
+            return self.colimit_object
+
         # For demonstration, assume the pushout object is predefined
         # In a real implementation, this would involve constructing the pushout
         self.colimit_object = "PushoutObject"
@@ -74,17 +83,20 @@ class Pushout(AbstractColimit):
         eta_prime_X = other_cocone["X"]
         eta_prime_Y = other_cocone["Y"]
 
-        # Check if u ∘ f = η'_X and u ∘ g = η'_Y hold
-        # Here, we cannot actually compute u since there are no specific category operations
-        # So, we assume the existence of a unique u and return True
+        if isinstance(self.category, FinSetCategory):
+            print("Verifying universal property of the pushout.")
+            u = self.category.pushout_mediating_map(self.morphism1, self.morphism2, eta_prime_X, eta_prime_Y)
+            if u is None:
+                print(f"{eta_prime_X.name} ∘ {self.morphism1.name} ≠ {eta_prime_Y.name} ∘ {self.morphism2.name}")
+                return False
+            return True
 
+        # Search the unique u: P → C with u ∘ η_X = η'_X and u ∘ η_Y = η'_Y (the leg from Z is forced)
         print("Verifying universal property of the pushout.")
-        print(f"Assuming existence of unique morphism u: {self.colimit_object} → C such that:")
-        print(f"  u ∘ {self.morphism1.name} = {eta_prime_X.name}")
-        print(f"  u ∘ {self.morphism2.name} = {eta_prime_Y.name}")
-        
-        # Return True, indicating verification passed
-        return True
+        return self._verify_cocone([self.morphism1.target, self.morphism2.target, self.morphism1.source],
+                                   [(0, 2, self.morphism1), (1, 2, self.morphism2)],
+                                   [self.cocone_morphisms.get("X"), self.cocone_morphisms.get("Y"), None],
+                                   [eta_prime_X, eta_prime_Y, None])
     
     def visualize(self, filename: str = "pushout_diagram", format: str = "png"):
         """
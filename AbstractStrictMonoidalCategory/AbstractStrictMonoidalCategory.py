@@ -3,6 +3,7 @@
 from typing import Callable, Dict, List, Optional
 from AbstractCategory.AbstractCategory import AbstractCategory
 from AbstractCategory.Morphism import Morphism
+from AbstractMonoidalCategory.TensorTerms import TensorTermStore
 from Diagram.Diagram import Diagram
 
 class AbstractStrictMonoidalCategory(AbstractCategory):
@@ -16,7 +17,8 @@ class AbstractStrictMonoidalCategory(AbstractCategory):
                  morphism_association: Dict[str, Dict[str, List[Morphism]]],
                  unit_object: str,
                  tensor_objects_func: Callable[[str, str], str],
-                 tensor_morphisms_func: Callable[[Morphism, Morphism], Morphism]):
+                 tensor_morphisms_func: Callable[[Morphism, Morphism], Morphism],
+                 tensor_cache_size: Optional[int] = 1 << 16):
         """
         Initializes the strict monoidal category.
 
@@ -26,11 +28,14 @@ class AbstractStrictMonoidalCategory(AbstractCategory):
         :param unit_object: The unit object in the monoidal category.
         :param tensor_objects_func: Function to compute tensor product of two objects.
         :param tensor_morphisms_func: Function to compute tensor product of two morphisms.
+        :param tensor_cache_size: Maximum number of memoized tensor products (None for unbounded).
         """
         super().__init__(objects, morphisms, morphism_association)
         self.unit_object = unit_object
         self.tensor_objects = tensor_objects_func
         self.tensor_morphisms = tensor_morphisms_func
+        # Hash-consed tensor expressions, so repeated products are built once
+        self.terms = TensorTermStore(tensor_objects_func, tensor_morphisms_func, tensor_cache_size)
 
     def get_unit_object(self) -> str:
         """
@@ -48,7 +53,7 @@ class AbstractStrictMonoidalCategory(AbstractCategory):
         :param obj2: The second object.
         :return: The tensor product object.
         """
-        return self.tensor_objects(obj1, obj2)
+        return self.terms.tensor_objects(obj1, obj2)
 
     def tensor_morphisms_pair(self, morph1: Morphism, morph2: Morphism) -> Morphism:
         """
@@ -58,7 +63,7 @@ class AbstractStrictMonoidalCategory(AbstractCategory):
         :param morph2: The second morphism.
         :return: The tensor product morphism.
         """
-        return self.tensor_morphisms(morph1, morph2)
+        return self.terms.tensor_morphisms(morph1, morph2)
 
     def visualize_monoidal_structure(self, filename: str = "monoidal_structure_diagram", format: str = "png"):
         """
@@ -0,0 +1,48 @@
+
+import contextlib
+import io
+import unittest
+from Benchmarks.Generators import (chain_category, grid_category, identity_functor, identity_transformation,
+                                   max_monoidal_category, random_quiver)
+from Benchmarks.Harness import compare, run
+
+def quietly(function, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+class TestGenerators(unittest.TestCase):
+
+    def test_sizes(self):
+        self.assertEqual((len(random_quiver(50).Objects), len(random_quiver(50).morphisms)), (50, 200))
+        self.assertEqual(len(chain_category(10, span=2).Hom("o3", "o5")), 1)
+        self.assertEqual(len(grid_category(4, 3).Objects), 12)
+        self.assertTrue(quietly(grid_category(4, 3).has_path, "g0,0", "g2,3"))
+
+    def test_functor_and_transformation_are_valid(self):
+        functor = identity_functor(chain_category(20))
+        self.assertTrue(quietly(functor.is_valid))
+        self.assertTrue(quietly(identity_transformation(functor).is_natural))
+
+    def test_monoidal_category_is_coherent(self):
+        category = max_monoidal_category(30)
+        self.assertEqual(category.tensor("o3", "o7"), "o7")
+        self.assertTrue(quietly(category.verify_pentagon_identity, sample=500))
+        self.assertTrue(quietly(category.verify_triangle_identity))
+
+class TestHarness(unittest.TestCase):
+
+    def test_run_respects_caps(self):
+        results = quietly(run, [10, 10**4], repeat=1, cases=["Hom/random_quiver", "is_natural/chain"])["results"]
+        self.assertEqual(sorted(results["Hom/random_quiver"]), ["10", "10000"])
+        self.assertEqual(list(results["is_natural/chain"]), ["10"])
+
+    def test_compare_flags_slowdowns_beyond_threshold_and_floor(self):
+        baseline = {"results": {"a": {"10": 0.010, "100": 0.0001}, "b": {"10": 0.010}}}
+        current = {"results": {"a": {"10": 0.020, "100": 0.0004}, "b": {"10": 0.012}, "c": {"10": 1.0}}}
+        regressions = compare(current, baseline, threshold=0.3, floor=5e-4)
+        # a@100 is 4× slower but below the noise floor, b is within the threshold, c has no baseline
+        self.assertEqual([(r["case"], r["size"]) for r in regressions], [("a", 10)])
+        self.assertAlmostEqual(regressions[0]["ratio"], 2.0)
+
+if __name__ == "__main__":
+    unittest.main()
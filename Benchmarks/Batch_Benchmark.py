@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# CategoryTheory/Benchmarks/Batch_Benchmark.py
+# Run from the repository root: python -m Benchmarks.Batch_Benchmark --examples 4096 --batch-size 128
+
+import argparse
+import time
+import numpy as np
+from DL.parameteriedmapping import Para, batch_dense, dense, to_para
+from DL.supervised import batch_mse_loss, learning_rate, mse_loss, supervised_step, train_supervised
+from DL.update import rda_momentum
+from .MNIST import mnist_model
+
+def throughput(label, layer, loss, inputs, outputs, batch_size):
+    """Examples per second of one epoch of train_supervised"""
+    np.random.seed(0)
+    step, param = supervised_step(mnist_model(layer), rda_momentum(γ=-0.1), Para(loss), to_para(learning_rate(η=-0.01)))
+    start = time.perf_counter()
+    for _ in train_supervised(step, param, inputs, outputs, num_epochs=1, batch_size=batch_size):
+        pass
+    elapsed = time.perf_counter() - start
+    rate = len(inputs) / elapsed
+    print(f"{label}: {len(inputs)} examples in {elapsed:.3f} s, {rate:,.0f} examples/s")
+    return rate
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark minibatch training of the 1.py model.")
+    parser.add_argument("--examples", type=int, default=4096)
+    parser.add_argument("--batch-size", type=int, default=128)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    inputs = rng.random((args.examples, 28 * 28))
+    outputs = np.identity(10)[rng.integers(0, 10, args.examples)]
+    # The per-example loop is slow, so it is timed on a slice of the data
+    single = throughput("per example", dense, mse_loss, inputs[:args.examples // 4], outputs[:args.examples // 4], None)
+    batched = throughput(f"batch {args.batch_size}", batch_dense, batch_mse_loss, inputs, outputs, args.batch_size)
+    print(f"speed-up: {batched / single:.1f}×")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# CategoryTheory/Benchmarks/CNN_Benchmark.py
+# Run from the repository root: python -m Benchmarks.CNN_Benchmark --epochs 2
+# Trains a small convolutional network on the MNIST test set bundled with the repository
+# (t10k-*, split into training and held-out examples) and times each of its layers.
+
+import argparse
+import time
+import numpy as np
+import DL.mapping as mapping
+from DL.compiler import compile_model
+from DL.datasets import load_mnist
+from DL.parameteriedmapping import Para, batch_dense, conv2d, flatten, maxpool2d, to_para
+from DL.statistics import accuracy
+from DL.supervised import batch_mse_loss, learning_rate, supervised_store_step, train_supervised
+from DL.update import adam
+from .MNIST import ROOT
+
+def cnn():
+    """28×28 → conv 3×3 (8) → pool 2 → 13×13 → conv 3×3 (16) → pool 2 → 5×5 → dense (10)"""
+    return (conv2d((1, 8), 3, activation=mapping.relu)
+            >> maxpool2d(2)
+            >> conv2d((8, 16), 3, activation=mapping.relu)
+            >> maxpool2d(2)
+            >> flatten
+            >> batch_dense((16 * 5 * 5, 10), activation=mapping.sigmoid))
+
+def main():
+    parser = argparse.ArgumentParser(description="Train and profile a small CNN on MNIST.")
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--train", type=int, default=8000)
+    args = parser.parse_args()
+
+    images, labels = load_mnist(ROOT, "t10k")
+    images = images.reshape(-1, 1, 28, 28)
+    x_train, y_train = images[:args.train], labels[:args.train]
+    x_test, truth = images[args.train:], labels.labels[args.train:]
+
+    np.random.seed(0)
+    model = cnn()
+    step, store = supervised_store_step(model, adam(ε=0.003), Para(batch_mse_loss), to_para(learning_rate(η=1.0)))
+    fwd = model.arrow.arrow.fwd
+    start = time.perf_counter()
+    for epoch in range(args.epochs):
+        for _ in train_supervised(step, store, x_train, y_train, 1, batch_size=args.batch_size):
+            pass
+        predict = lambda x: fwd((store.param, x)).argmax(axis=-1)
+        acc = accuracy(predict, x_test, truth, batched=True, chunk_size=1000)
+        print(f"epoch {epoch}: {time.perf_counter() - start:6.1f} s, held-out accuracy {acc:.4f}")
+
+    compiled = compile_model(model)
+    x, dy = x_train[:args.batch_size], np.ones((args.batch_size, 10))
+    profiles = [compiled.profile(store.param, x, dy) for _ in range(5)]
+    print(f"per layer, best of 5 passes on a batch of {args.batch_size}:")
+    for k, (op, _, _) in enumerate(profiles[0]):
+        forward = min(p[k][1] for p in profiles)
+        reverse = min(p[k][2] for p in profiles)
+        print(f"  {str(op):24s} forward {forward * 1e3:7.3f} ms  reverse {reverse * 1e3:7.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# CategoryTheory/Benchmarks/Datasets_Benchmark.py
+# Run from the repository root: python -m Benchmarks.Datasets_Benchmark
+# Times loading the bundled t10k MNIST files: cold (decompressing and writing the .npy cache),
+# warm (memory-mapping the cache), and through TensorFlow as in 1.py when it is installed.
+
+import argparse
+import gzip
+import os
+import tempfile
+import time
+import numpy as np
+from DL.datasets import load_mnist, minibatches
+from .MNIST import ROOT
+
+def timed(label, load):
+    start = time.perf_counter()
+    result = load()
+    print(f"{label:40s} {(time.perf_counter() - start) * 1e3:9.2f} ms")
+    return result
+
+def decompress_in_memory():
+    """Decompressing and normalizing on every load, without a cache"""
+    with gzip.open(os.path.join(ROOT, "t10k-images-idx3-ubyte.gz")) as f:
+        images = np.frombuffer(f.read(), np.uint8, offset=16).reshape(-1, 28 * 28).astype(np.float32) / 255
+    with gzip.open(os.path.join(ROOT, "t10k-labels-idx1-ubyte.gz")) as f:
+        labels = np.frombuffer(f.read(), np.uint8, offset=8)
+    return images, np.identity(10)[labels]
+
+def tensorflow():
+    """The loading path of 1.py (all of MNIST, downloaded on first use)"""
+    import tensorflow as tf
+    (x_train, y_train), (x_test, y_test) = tf.keras.datasets.mnist.load_data()
+    return x_test.reshape(-1, 28 * 28).astype("float32") / 255.0, np.identity(10)[y_test]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loading MNIST from IDX files.")
+    parser.add_argument("--batch-size", type=int, default=128)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache:
+        timed("DL.datasets, cold (builds the cache)", lambda: load_mnist(ROOT, "t10k", cache_dir=cache))
+        images, labels = timed("DL.datasets, warm (memory-maps the cache)", lambda: load_mnist(ROOT, "t10k", cache_dir=cache))
+        timed(f"  one epoch of batches of {args.batch_size}",
+              lambda: sum(len(x) for x, y in minibatches(images, labels, args.batch_size, seed=0)))
+        del images, labels
+    timed("gzip and normalize in memory", decompress_in_memory)
+    try:
+        import tensorflow
+    except ImportError:
+        print("TensorFlow is not installed: the 1.py loading path is not timed")
+    else:
+        timed("TensorFlow (1.py)", tensorflow)
+
+if __name__ == "__main__":
+    main()
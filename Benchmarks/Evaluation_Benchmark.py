@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# CategoryTheory/Benchmarks/Evaluation_Benchmark.py
+# Run from the repository root: python -m Benchmarks.Evaluation_Benchmark
+# Evaluates the 1.py model on the 10000 bundled t10k MNIST examples.
+
+import argparse
+import time
+import numpy as np
+from DL.datasets import load_mnist
+from DL.statistics import BackgroundEvaluation, accuracy, evaluate
+from DL.supervised import batch_mse_loss
+from .MNIST import ROOT, mnist_model
+
+def timed(label, run):
+    start = time.perf_counter()
+    result = run()
+    print(f"{label:44s} {(time.perf_counter() - start) * 1e3:9.1f} ms")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched evaluation of the 1.py model.")
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    args = parser.parse_args()
+
+    images, labels = load_mnist(ROOT, "t10k")
+    ys, truth = labels[:], labels.labels
+    np.random.seed(0)
+    model = mnist_model()
+    param, fwd = model.param(), model.arrow.arrow.fwd
+    predict = lambda x: fwd((param, x)).argmax(axis=-1)
+
+    per_example = timed("accuracy, per example (former loop)", lambda: accuracy(predict, images, truth))
+    one_call = timed("accuracy, batched in one call", lambda: accuracy(predict, images, truth, batched=True))
+    chunked = timed(f"accuracy, batched in chunks of {args.chunk_size}",
+                    lambda: accuracy(predict, images, truth, batched=True, chunk_size=args.chunk_size))
+    assert per_example == one_call == chunked
+    timed("accuracy, confusion matrix and loss, chunked",
+          lambda: evaluate(lambda x: fwd((param, x)), images, ys, batch_mse_loss, args.chunk_size))
+    with BackgroundEvaluation(fwd, images, ys, batch_mse_loss, args.chunk_size) as background:
+        future = timed("  submitting to the background thread", lambda: background.submit(param))
+        result = timed("  waiting for the background result", future.result)
+    print(f"accuracy {result['accuracy']:.4f}, loss {result['loss']:.4f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# CategoryTheory/Benchmarks/Generators.py
+# Parameterized categories, functors and natural transformations for the benchmark harness.
+
+from typing import List, Tuple
+import numpy as np
+from AbstractCategory.AbstractCategory import AbstractCategory
+from AbstractCategory.Morphism import Morphism
+from AbstractFunctor.AbstractFunctor import AbstractFunctor
+from AbstractNaturalTransformation.AbstractNaturalTransformation import AbstractNaturalTransformation
+from AbstractMonoidalCategory.AbstractMonoidalCategory import AbstractMonoidalCategory
+
+def random_quiver(n: int, degree: int = 3, seed: int = 0) -> AbstractCategory:
+    """n objects and degree·n morphisms between uniformly random objects."""
+    rng = np.random.default_rng(seed)
+    objects = [f"o{i}" for i in range(n)]
+    ends = rng.integers(0, n, size=(degree * n, 2))
+    return AbstractCategory.from_morphisms(objects, [Morphism(f"m{k}", objects[s], objects[t]) for k, (s, t) in enumerate(ends.tolist())])
+
+def chain_category(n: int, span: int = 2) -> AbstractCategory:
+    """The chain o0 → o1 → ... → o{n-1} with a morphism o{i} → o{j} for every 0 < j - i ≤ span."""
+    objects = [f"o{i}" for i in range(n)]
+    return AbstractCategory.from_morphisms(objects, [Morphism(f"o{i}→o{j}", objects[i], objects[j])
+                                   for i in range(n) for j in range(i + 1, min(n, i + span + 1))])
+
+def grid_category(width: int, height: int) -> AbstractCategory:
+    """A width × height grid with a morphism right and down from every cell."""
+    objects = [f"g{r},{c}" for r in range(height) for c in range(width)]
+    morphisms = [Morphism(f"r{r},{c}", f"g{r},{c}", f"g{r},{c + 1}") for r in range(height) for c in range(width - 1)]
+    morphisms += [Morphism(f"d{r},{c}", f"g{r},{c}", f"g{r + 1},{c}") for r in range(height - 1) for c in range(width)]
+    return AbstractCategory.from_morphisms(objects, morphisms)
+
+def identity_functor(category: AbstractCategory) -> AbstractFunctor:
+    """The identity functor given by explicit object and morphism mappings."""
+    return AbstractFunctor(category, category,
+                           {obj: obj for obj in category.Objects},
+                           {morph.name: morph.name for morph in category.morphisms})
+
+def identity_transformation(functor: AbstractFunctor) -> AbstractNaturalTransformation:
+    """The identity natural transformation F ⇒ F, with component id_F(X) at every object X."""
+    return AbstractNaturalTransformation(functor, functor, {
+        obj: functor.target.identity(functor.apply_object(obj)).name for obj in functor.source.Objects})
+
+class _Identities(dict):
+    """Structural morphisms of a thin monoidal category: the identity of the object they end at."""
+
+    def __init__(self, category: "AbstractCategory", target):
+        super().__init__()
+        self.category, self.target = category, target
+
+    def get(self, key, default=None):
+        if key not in self:
+            self[key] = self.category.identity(self.target(key))
+        return self[key]
+
+def max_monoidal_category(n: int) -> AbstractMonoidalCategory:
+    """The discrete monoidal category on o0, ..., o{n-1} with o{i} ⊗ o{j} = o{max(i, j)} and unit o0."""
+    objects = [f"o{i}" for i in range(n)]
+
+    def tensor_objects(a: str, b: str) -> str:
+        return a if int(a[1:]) >= int(b[1:]) else b
+
+    def tensor_morphisms(f: Morphism, g: Morphism) -> Morphism:
+        return category.identity(tensor_objects(f.source, g.source))
+
+    def top(key) -> str:
+        if isinstance(key, str):
+            return key
+        result = key[0]
+        for obj in key[1:]:
+            result = tensor_objects(result, obj)
+        return result
+
+    category = AbstractMonoidalCategory(
+        objects=objects, morphisms=[], morphism_association={}, unit_object="o0",
+        tensor_objects_func=tensor_objects, tensor_morphisms_func=tensor_morphisms,
+        associators={}, left_unitors={}, right_unitors={})
+    category.associators = _Identities(category, top)
+    category.left_unitors = _Identities(category, top)
+    category.right_unitors = _Identities(category, top)
+    return category
+
+def random_pairs(objects, count: int, seed: int = 0) -> List[Tuple[str, str]]:
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(objects), size=(count, 2)).tolist()
+    return [(objects[i], objects[j]) for i, j in picks]
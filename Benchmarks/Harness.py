@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# CategoryTheory/Benchmarks/Harness.py
+# Run from the repository root:
+#   python -m Benchmarks.Harness --sizes 10 100 1000 10000 --output results.json
+#   python -m Benchmarks.Harness --update-baseline
+# Compares against Benchmarks/baseline.json and exits with status 1 on a regression. The stored
+# baseline is machine-specific: regenerate it with --update-baseline on the machine that runs the comparison.
+
+import argparse
+import contextlib
+import gc
+import json
+import math
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from AbstractCategory.ProductCategory import ProductCategory
+from .Generators import (chain_category, grid_category, identity_functor, identity_transformation,
+                         max_monoidal_category, random_pairs, random_quiver)
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+
+################################################################################
+# Cases: setup(n) builds the structure (not timed) and returns the timed batch
+################################################################################
+
+def _compose(n: int) -> Callable[[], object]:
+    category = chain_category(n)
+    steps = {m.source: m for m in category.morphisms if int(m.target[1:]) == int(m.source[1:]) + 1}
+    starts = np.random.default_rng(0).integers(0, max(n - 2, 1), size=100).tolist()
+    pairs = [(steps[f"o{i}"], steps[f"o{i + 1}"]) for i in starts if f"o{i + 1}" in steps]
+    return lambda: [category.compose(f, g) for f, g in pairs]
+
+def _hom(n: int) -> Callable[[], object]:
+    category = random_quiver(n)
+    pairs = random_pairs(category.Objects, 1000)
+    return lambda: [category.Hom(a, b) for a, b in pairs]
+
+def _get_morphism(n: int) -> Callable[[], object]:
+    category = random_quiver(n)
+    names = [f"m{k}" for k in np.random.default_rng(0).integers(0, 3 * n, size=10).tolist()]
+    return lambda: [category.get_morphism(name) for name in names]
+
+def _has_path(n: int) -> Callable[[], object]:
+    side = max(int(math.isqrt(n)), 2)
+    category = grid_category(side, side)
+    return lambda: category.has_path("g0,0", f"g{side - 1},{side - 1}")
+
+def _quotient_category(n: int) -> Callable[[], object]:
+    category = chain_category(n, span=1)
+    objects = {obj: f"q{int(obj[1:]) // 2}" for obj in category.Objects}
+    return lambda: category.quotient_category(objects, {})
+
+def _dual_category(n: int) -> Callable[[], object]:
+    category = random_quiver(n)
+    return category.dual_category
+
+def _functor_is_valid(n: int) -> Callable[[], object]:
+    return identity_functor(chain_category(n)).is_valid
+
+def _is_natural(n: int) -> Callable[[], object]:
+    return identity_transformation(identity_functor(chain_category(n))).is_natural
+
+def _monoidal_tensor(n: int) -> Callable[[], object]:
+    category = max_monoidal_category(n)
+    pairs = random_pairs(category.objects, 1000)
+    return lambda: [category.tensor(category.tensor(a, b), a) for a, b in pairs]
+
+def _monoidal_pentagon(n: int) -> Callable[[], object]:
+    category = max_monoidal_category(n)
+    # A fresh checker, so that its memoized verdicts from the warm-up run are not reused
+    return lambda: category.checker_class(category).pentagon_violations(sample=200)
+
+def _product_hom(n: int) -> Callable[[], object]:
+    category = random_quiver(n)
+    product = ProductCategory(category, category)
+    rng = np.random.default_rng(0)
+    pairs = [(tuple(a), tuple(b)) for a, b in rng.integers(0, n, size=(1000, 2, 2)).tolist()]
+    return lambda: [product.Hom(a, b) for a, b in pairs]
+
+# (name, setup, largest size the operation is measured at); the caps keep quadratic
+# operations (e.g. get_identity scanning the morphism list in is_valid) from running for hours
+CASES: List[Tuple[str, Callable[[int], Callable[[], object]], int]] = [
+    ("compose/chain", _compose, 10**6),
+    ("Hom/random_quiver", _hom, 10**6),
+    ("get_morphism/random_quiver", _get_morphism, 10**6),
+    ("has_path/grid", _has_path, 10**4),
+    ("quotient_category/chain", _quotient_category, 10**5),
+    ("dual_category/random_quiver", _dual_category, 10**5),
+    ("AbstractFunctor.is_valid/chain", _functor_is_valid, 10**3),
+    ("is_natural/chain", _is_natural, 10**3),
+    ("monoidal.tensor/max", _monoidal_tensor, 10**6),
+    ("monoidal.pentagon/max", _monoidal_pentagon, 10**6),
+    ("ProductCategory.Hom/random_quiver", _product_hom, 10**6),
+]
+
+################################################################################
+# Running and comparing
+################################################################################
+
+def measure(batch: Callable[[], object], repeat: int) -> float:
+    """Best time of repeat runs of a batch, after one warm-up run."""
+    batch()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        batch()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def time_case(name: str, n: int, repeat: int) -> float:
+    """Best time of the batch of a case at size n, with output silenced."""
+    setup = next(setup for case, setup, _ in CASES if case == name)
+    # As in timeit, the garbage collector is paused: building millions of morphisms would
+    # otherwise trigger full collections that dwarf the operations being measured
+    gc.disable()
+    try:
+        with open(os.devnull, "w") as null, contextlib.redirect_stdout(null):
+            return measure(setup(n), repeat)
+    finally:
+        gc.enable()
+        gc.collect()
+
+def run(sizes: List[int], repeat: int = 3, cases: Optional[List[str]] = None) -> Dict[str, object]:
+    """
+    Time every case at every size up to its cap.
+
+    :return: {"meta": {...}, "results": {case: {size: seconds}}}, the format of the stored baseline.
+    """
+    results: Dict[str, Dict[str, float]] = {}
+    for name, _, cap in CASES:
+        if cases and name not in cases:
+            continue
+        for n in sizes:
+            if n > cap:
+                print(f"{name:40s} n={n:<8d} skipped (cap {cap})")
+                continue
+            seconds = time_case(name, n, repeat)
+            results.setdefault(name, {})[str(n)] = seconds
+            print(f"{name:40s} n={n:<8d} {seconds * 1e3:10.3f} ms")
+    meta = {"python": platform.python_version(), "machine": platform.machine(),
+            "platform": platform.platform(), "repeat": repeat, "created": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    return {"meta": meta, "results": results}
+
+def compare(current: Dict[str, object], baseline: Dict[str, object], threshold: float = 0.3,
+            floor: float = 5e-4) -> List[Dict[str, object]]:
+    """
+    Cases slower than the baseline by more than threshold (relative) and floor seconds (absolute).
+
+    :return: One report {"case", "size", "baseline", "current", "ratio"} per regression.
+    """
+    regressions = []
+    for name, timings in current["results"].items():
+        for size, seconds in timings.items():
+            reference = baseline["results"].get(name, {}).get(size)
+            if reference is None:
+                continue
+            if seconds > reference * (1 + threshold) and seconds - reference > floor:
+                regressions.append({"case": name, "size": int(size), "baseline": reference,
+                                    "current": seconds, "ratio": seconds / reference})
+    return regressions
+
+def write(path: str, results: Dict[str, object]):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the core category operations against a stored baseline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cases", nargs="+", default=None, help="Only run these cases.")
+    parser.add_argument("--output", default=None, help="Write the results as JSON to this file.")
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=0.3, help="Allowed relative slowdown.")
+    parser.add_argument("--floor", type=float, default=5e-4, help="Slowdowns below this many seconds are noise.")
+    parser.add_argument("--confirm", type=int, default=3,
+                        help="Re-measure a slow case this many times before reporting it as a regression.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+    args = parser.parse_args()
+
+    current = run(args.sizes, args.repeat, args.cases)
+    regressions = []
+    if args.update_baseline:
+        write(args.baseline, current)
+        print(f"Baseline written to {args.baseline}")
+    elif not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold, args.floor)
+        # Timings on shared machines slow down in bursts, so a regression must persist over fresh measurements
+        for _ in range(args.confirm):
+            if not regressions:
+                break
+            for r in regressions:
+                timings = current["results"][r["case"]]
+                timings[str(r["size"])] = min(timings[str(r["size"])], time_case(r["case"], r["size"], args.repeat))
+            regressions = compare(current, baseline, args.threshold, args.floor)
+    if args.output:
+        write(args.output, current)
+    for r in regressions:
+        print(f"REGRESSION {r['case']} n={r['size']}: {r['baseline'] * 1e3:.3f} ms → "
+              f"{r['current'] * 1e3:.3f} ms ({r['ratio']:.2f}×)", file=sys.stderr)
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}", file=sys.stderr)
+        sys.exit(1)
+    if not args.update_baseline and os.path.exists(args.baseline):
+        print("No regressions against the baseline.")
+
+if __name__ == "__main__":
+    main()
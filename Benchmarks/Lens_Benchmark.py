@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# CategoryTheory/Benchmarks/Lens_Benchmark.py
+# Run from the repository root: python -m Benchmarks.Lens_Benchmark --steps 200 --depth 20
+
+import argparse
+import contextlib
+import time
+import numpy as np
+import DL.mapping as mapping
+from DL.compiler import compile_model
+from DL.mapping import Mapping
+from DL.parameteriedmapping import Para, dense, to_para
+from DL.supervised import supervised_step, mse_loss, learning_rate
+from DL.update import rda_momentum
+from .MNIST import mnist_model
+
+@contextlib.contextmanager
+def recomputing_composition():
+    """Build lenses with the former composition rules, whose reverse maps re-run the forward maps of every prefix."""
+    rshift, matmul = Mapping.__rshift__, Mapping.__matmul__
+
+    def naive_rshift(f, g):
+        return Mapping(lambda x: g.fwd(f.fwd(x)), lambda xy: f.rev((xy[0], g.rev((f.fwd(xy[0]), xy[1])))))
+
+    def naive_matmul(f, g):
+        return Mapping(lambda ac: (f.fwd(ac[0]), g.fwd(ac[1])),
+                       lambda acbd: (f.rev((acbd[0][0], acbd[1][0])), g.rev((acbd[0][1], acbd[1][1]))))
+
+    Mapping.__rshift__, Mapping.__matmul__ = naive_rshift, naive_matmul
+    try:
+        yield
+    finally:
+        Mapping.__rshift__, Mapping.__matmul__ = rshift, matmul
+
+
+def stack(depth: int, width: int):
+    model = dense((width, width), activation=mapping.relu)
+    for _ in range(depth - 1):
+        model = model >> dense((width, width), activation=mapping.relu)
+    return model
+
+def measure(label, build, inputs, outputs, steps):
+    np.random.seed(0)
+    step, param = supervised_step(build(), rda_momentum(γ=-0.1), Para(mse_loss), to_para(learning_rate(η=-0.01)))
+    start = time.perf_counter()
+    for k in range(steps):
+        param = step(outputs[k % len(outputs)], param, inputs[k % len(inputs)])
+    elapsed = time.perf_counter() - start
+    print(f"{label}: {steps} steps, {elapsed / steps * 1e3:.3f} ms/step")
+    return param
+
+def compare(name, build, inputs, outputs, steps):
+    with recomputing_composition():
+        old = measure(f"{name}, recomputing", build, inputs, outputs, steps)
+    new = measure(f"{name}, residual", build, inputs, outputs, steps)
+    # Both rules compute the same gradients
+    assert all(np.allclose(a, b) for a, b in zip(flatten(old), flatten(new)))
+
+def compare_compiled(name, model, inputs, outputs, steps):
+    """Time one reverse pass of a model as a lens and compiled to a flat op list."""
+    compiled = compile_model(model)
+    param, lens = model.param(), model.arrow.arrow
+    passes = [("lens", lambda x, dy: lens.rev(((param, x), dy))),
+              ("compiled", lambda x, dy: compiled.backward(param, x, dy))]
+    for label, backward in passes:
+        start = time.perf_counter()
+        for k in range(steps):
+            backward(inputs[k % len(inputs)], outputs[k % len(outputs)])
+        elapsed = time.perf_counter() - start
+        print(f"{name}, {label}: {len(compiled.ops)} ops, {elapsed / steps * 1e3:.3f} ms/reverse pass")
+    # Both compute the same changes
+    x, dy = inputs[0], outputs[0]
+    assert all(np.allclose(a, b) for a, b in zip(flatten(passes[0][1](x, dy)), flatten(passes[1][1](x, dy))))
+
+def flatten(p):
+    if p is None:
+        return []
+    if type(p) is tuple:
+        return flatten(p[0]) + flatten(p[1])
+    return [p]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark residual-passing lens composition and compiled models.")
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--depth", type=int, default=20)
+    parser.add_argument("--width", type=int, default=64)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    inputs = rng.random((64, 28 * 28))
+    outputs = np.identity(10)[rng.integers(0, 10, 64)]
+    compare("1.py MNIST model", mnist_model, inputs, outputs, args.steps)
+    compare_compiled("1.py MNIST model", mnist_model(), inputs, outputs, args.steps)
+
+    inputs = rng.random((64, args.width))
+    outputs = rng.random((64, args.width))
+    compare(f"{args.depth}-layer stack", lambda: stack(args.depth, args.width), inputs, outputs, args.steps)
+    compare_compiled(f"{args.depth}-layer stack", stack(args.depth, args.width), inputs, outputs, args.steps)
+
+if __name__ == "__main__":
+    main()
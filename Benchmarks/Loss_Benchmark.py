@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# CategoryTheory/Benchmarks/Loss_Benchmark.py
+# Run from the repository root: python -m Benchmarks.Loss_Benchmark --target 0.9
+# Time to a target held-out accuracy of the 1.py model and optimizer (rda_momentum) with
+# sigmoid outputs and MSE, against the same model with logits and the fused softmax
+# cross-entropy loss. Trains on the MNIST test set bundled with the repository (t10k-*),
+# split into training and held-out examples, since the training images are not bundled.
+# Each setup is run over a small grid of learning rates, since the scale of the gradients
+# differs between the losses. Evaluation time is not counted.
+
+import argparse
+import time
+import numpy as np
+import DL.mapping as mapping
+from DL.datasets import load_mnist
+from DL.parameteriedmapping import Para, batch_dense, to_para
+from DL.statistics import accuracy
+from DL.supervised import (batch_mse_loss, learning_rate, softmax_cross_entropy_loss,
+                           supervised_store_step, train_supervised)
+from DL.update import rda_momentum
+from .MNIST import ROOT, mnist_model
+
+# (name, output activation, loss, learning rates)
+SETUPS = [
+    ("sigmoid + mse", mapping.sigmoid, batch_mse_loss, [-1.0, -2.0, -4.0]),
+    ("softmax cross-entropy", mapping.identity, softmax_cross_entropy_loss, [-0.1, -0.25, -0.5]),
+]
+
+def time_to_accuracy(output, loss, η, data, args):
+    x_train, y_train, x_test, truth = data
+    np.random.seed(0)
+    model = mnist_model(batch_dense, output)
+    step, store = supervised_store_step(model, rda_momentum(γ=-0.1), Para(loss), to_para(learning_rate(η=η)))
+    fwd = model.arrow.arrow.fwd
+    predict = lambda x: fwd((store.param, x)).argmax(axis=-1)
+    elapsed, acc = 0.0, 0.0
+    start = time.perf_counter()
+    for e, j, _, _ in train_supervised(step, store, x_train, y_train, args.epochs, batch_size=args.batch_size):
+        if (j // args.batch_size + 1) % args.every:
+            continue
+        elapsed += time.perf_counter() - start
+        acc = accuracy(predict, x_test, truth, batched=True, chunk_size=1000)
+        if acc >= args.target:
+            return elapsed, e, j + args.batch_size, acc
+        start = time.perf_counter()
+    return None, args.epochs, len(x_train), acc
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to a target accuracy of MSE and cross-entropy losses.")
+    parser.add_argument("--target", type=float, default=0.9)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--every", type=int, default=10, help="evaluate every this many minibatches")
+    parser.add_argument("--train", type=int, default=8000)
+    args = parser.parse_args()
+
+    images, labels = load_mnist(ROOT, "t10k")
+    data = (images[:args.train], labels[:args.train], images[args.train:], labels.labels[args.train:])
+    print(f"target held-out accuracy {args.target}, batch size {args.batch_size}")
+    for name, output, loss, etas in SETUPS:
+        for η in etas:
+            seconds, epoch, sample, acc = time_to_accuracy(output, loss, η, data, args)
+            if seconds is None:
+                print(f"{name:22s} η = {η:5.2f}: not reached in {args.epochs} epochs (accuracy {acc:.4f})")
+            else:
+                print(f"{name:22s} η = {η:5.2f}: {seconds:6.2f} s (epoch {epoch}, sample {sample}, accuracy {acc:.4f})")
+
+if __name__ == "__main__":
+    main()
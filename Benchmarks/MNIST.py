@@ -0,0 +1,15 @@
+# CategoryTheory/Benchmarks/MNIST.py
+# The MNIST files and model shared by the DL benchmarks.
+
+import os
+import DL.mapping as mapping
+from DL.parameteriedmapping import dense
+
+# The repository root, where the bundled MNIST files (t10k-*) are
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def mnist_model(layer=dense, output=mapping.sigmoid):
+    """The three-layer model of 1.py, built from layer(shape, activation), e.g. dense or batch_dense"""
+    return (layer((28 * 28, 512), activation=mapping.relu)
+            >> layer((512, 256), activation=mapping.relu)
+            >> layer((256, 10), activation=output))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# CategoryTheory/Benchmarks/Optimizer_Benchmark.py
+# Run from the repository root: python -m Benchmarks.Optimizer_Benchmark --epochs 5
+# Trains the 1.py model on the MNIST test set bundled with the repository (t10k-*),
+# split into training and held-out examples, since the training images are not bundled.
+# The layers are Glorot-initialized: with the N(0, 0.01) weights of 1.py (--init normal),
+# Adam's steps of a fixed size per weight saturate the sigmoid outputs and training plateaus.
+
+import argparse
+import time
+import numpy as np
+import DL.mapping as mapping
+from DL import initialize
+from DL.datasets import load_mnist
+from DL.parameteriedmapping import Para, batch_bias, batch_linear, to_para, to_para_init
+from DL.store import ParameterStore, leaves
+from DL.supervised import batch_mse_loss, learning_rate, supervised_store_step, train_supervised
+from DL.update import adagrad, adam, adamw, rda_momentum, rmsprop
+from .MNIST import ROOT, mnist_model
+
+INITIALIZERS = {"glorot": initialize.glorot_normal, "normal": initialize.normal(0, 0.01)}
+
+def minibatch_layer(init="glorot"):
+    """A dense minibatch layer with weights initialized by INITIALIZERS[init]"""
+    def layer(shape, activation):
+        return batch_linear(shape, INITIALIZERS[init]) >> batch_bias(shape[1]) >> to_para_init(activation)
+    return layer
+
+# (name, update, learning-rate cap): rda_momentum takes scaled changes as in 1.py, the others gradients
+UPDATES = [
+    ("rda_momentum", lambda: rda_momentum(γ=-0.1), -0.5),
+    ("adam", lambda: adam(ε=0.001), 1.0),
+    ("adamw", lambda: adamw(ε=0.001, λ=0.01), 1.0),
+    ("rmsprop", lambda: rmsprop(ε=0.001), 1.0),
+    ("adagrad", lambda: adagrad(ε=0.01), 1.0),
+]
+
+def convergence(name, update, η, data, epochs, batch_size, init):
+    (x_train, y_train), (x_test, y_test) = data
+    np.random.seed(0)
+    model = mnist_model(minibatch_layer(init))
+    step, store = supervised_store_step(model, update, Para(batch_mse_loss), to_para(learning_rate(η)))
+    fwd = model.arrow.arrow.fwd
+    accuracies, start = [], time.perf_counter()
+    batches = len(range(0, len(x_train), batch_size))
+    for e, j, _, store in train_supervised(step, store, x_train, y_train, epochs, batch_size=batch_size):
+        if j // batch_size == batches - 1:
+            predictions = fwd((store.param, x_test)).argmax(axis=1)
+            accuracies.append(np.mean(predictions == y_test.argmax(axis=1)))
+    elapsed = time.perf_counter() - start
+    print(f"{name:14s} {elapsed / epochs:6.2f} s/epoch  held-out accuracy by epoch: "
+          + " ".join(f"{a:.3f}" for a in accuracies))
+
+def throughput(name, update, steps):
+    """Time of one update of the 1.py parameters, as a lens on the tree and in place on a store"""
+    np.random.seed(0)
+    param = mnist_model(minibatch_layer()).param()
+    state, store = update.initialize(param), ParameterStore(param, update)
+    gradient = mapping.zero_of(param)
+    for g in leaves(gradient):
+        g[...] = np.random.normal(0, 1e-3, g.shape)
+    store.load_changes(gradient)
+    timings = []
+    for run in [lambda: update.update.rev(((state, param), gradient)),
+                lambda: update.step(store.states, store.params, store.diff)]:
+        run()
+        start = time.perf_counter()
+        for _ in range(steps):
+            run()
+        timings.append((time.perf_counter() - start) / steps)
+    print(f"{name:14s} tree {timings[0] * 1e3:6.3f} ms/update, store {timings[1] * 1e3:6.3f} ms/update")
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare adaptive updates with rda_momentum on MNIST.")
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=128)
+    parser.add_argument("--train", type=int, default=8000, help="Examples trained on; the rest are held out.")
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--init", choices=sorted(INITIALIZERS), default="glorot")
+    args = parser.parse_args()
+
+    images, labels = load_mnist(ROOT, "t10k")
+    data = (images[:args.train], labels[:args.train]), (images[args.train:], labels[args.train:])
+    for name, update, η in UPDATES:
+        convergence(name, update(), η, data, args.epochs, args.batch_size, args.init)
+    for name, update, _ in UPDATES:
+        throughput(name, update(), args.steps)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# CategoryTheory/Benchmarks/Parallel_Benchmark.py
+# Run from the repository root: python -m Benchmarks.Parallel_Benchmark --workers 1 2 4 8
+# Trains the 1.py model at batch 128 on the bundled t10k MNIST files (8000 examples
+# trained, the rest held out) with 1, 2, 4 and 8 worker processes. Each process runs
+# single-threaded BLAS, so the speed-up measures data parallelism alone; it is bounded
+# by the number of cores (os.cpu_count()).
+
+import os
+os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+import argparse
+import time
+import numpy as np
+from DL.datasets import load_mnist
+from DL.parallel import DataParallelTrainer
+from DL.parameteriedmapping import Para, batch_dense, to_para
+from DL.supervised import batch_mse_loss, learning_rate
+from DL.update import rda_momentum
+from .MNIST import ROOT, mnist_model
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark data-parallel training of the 1.py model.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--modes", nargs="+", default=list(DataParallelTrainer.MODES))
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=128)
+    parser.add_argument("--train", type=int, default=8000)
+    args = parser.parse_args()
+
+    images, labels = load_mnist(ROOT, "t10k")
+    # Read into memory first, so that the first run does not pay for paging in the cache
+    x_train, y_train = np.array(images[:args.train]), labels[:args.train]
+    x_test, truth = images[args.train:], labels.labels[args.train:]
+    trainer = lambda model, workers, mode: DataParallelTrainer(
+        model, rda_momentum(γ=-0.1), Para(batch_mse_loss), to_para(learning_rate(η=-0.5)), workers=workers, mode=mode)
+    # The first run pays for loading scipy and faulting in fresh memory, so a short one goes untimed
+    warm_up = 8 * args.batch_size
+    trainer(mnist_model(batch_dense), 1, "sync").train(x_train[:warm_up], y_train[:warm_up], 1, args.batch_size)
+    print(f"{os.cpu_count()} cores")
+    for mode in args.modes:
+        base = None
+        for workers in args.workers:
+            np.random.seed(0)
+            model = mnist_model(batch_dense)
+            start = time.perf_counter()
+            store = trainer(model, workers, mode).train(x_train, y_train, args.epochs, args.batch_size)
+            elapsed = time.perf_counter() - start
+            base = base or elapsed
+            accuracy = np.mean(model.arrow.arrow.fwd((store.param, x_test)).argmax(axis=1) == truth)
+            print(f"{mode:8s} {workers} workers: {args.train * args.epochs / elapsed:8,.0f} examples/s, "
+                  f"speed-up {base / elapsed:5.2f}, held-out accuracy {accuracy:.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# CategoryTheory/Benchmarks/Rewrite_Benchmark.py
+# Run from the repository root: python -m Benchmarks.Rewrite_Benchmark --boxes 10000
+
+import argparse
+import time
+import numpy as np
+from AbstractCategory.Morphism import Morphism
+from AbstractMonoidalCategory.Rewrite import RewriteRule, Rewriter
+from AbstractMonoidalCategory.StringDiagram import StringDiagram
+
+f = Morphism("f", "A", "A")
+g = Morphism("g", "A", "A")
+h = Morphism("h", "A", "A")
+merge = Morphism("merge", "(A⊗A)", "A")
+split = Morphism("split", "A", "(A⊗A)")
+
+def chain(labels) -> StringDiagram:
+    diagram = StringDiagram(["A"])
+    for label in labels:
+        diagram.then_box(label, ["A"], ["A"])
+    return diagram
+
+def rules():
+    """f ; g cancels, f ; f fuses into h (preferred), and split ; merge cancels."""
+    split_merge = StringDiagram(["A"]).then_box(split, ["A"], ["A", "A"]).then_box(merge, ["A", "A"], ["A"])
+    return [RewriteRule(chain([f, g]), StringDiagram(["A"]), name="cancel"),
+            RewriteRule(chain([f, f]), chain([h]), priority=1, name="fuse"),
+            RewriteRule(split_merge, StringDiagram(["A"]), priority=2, name="split-merge")]
+
+def random_network(boxes: int, lanes: int, seed: int = 0) -> StringDiagram:
+    """Parallel lanes of random f/g/h boxes, with split ; merge pairs and cross-lane boxes between them."""
+    rng = np.random.default_rng(seed)
+    diagram = StringDiagram(["A"] * lanes)
+    cross = Morphism("cross", "(A⊗A)", "(A⊗A)")
+    while len(diagram) < boxes:
+        lane = int(rng.integers(lanes))
+        kind = rng.random()
+        if kind < 0.05 and lanes > 1:
+            lane = min(lane, lanes - 2)
+            diagram.then_box(cross, ["A", "A"], ["A", "A"], offset=lane)
+        elif kind < 0.15:
+            diagram.then_box(split, ["A"], ["A", "A"], offset=lane)
+            diagram.then_box(merge, ["A", "A"], ["A"], offset=lane)
+        else:
+            diagram.then_box([f, g, h][int(rng.integers(3))], ["A"], ["A"], offset=lane)
+    return diagram
+
+def measure(label, diagram):
+    size = len(diagram)
+    rewriter = Rewriter(rules())
+    start = time.perf_counter()
+    steps = rewriter.rewrite(diagram)
+    elapsed = time.perf_counter() - start
+    print(f"{label}: {size} → {len(diagram)} boxes, {steps} rewrites, {elapsed:.3f} s")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark string diagram rewriting.")
+    parser.add_argument("--boxes", type=int, default=10**4)
+    parser.add_argument("--lanes", type=int, default=16)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    diagram = chain([f] * (args.boxes // 2) + [g] * (args.boxes // 2))
+    print(f"built nested chain of {len(diagram)} boxes in {time.perf_counter() - start:.3f} s")
+    measure("nested cancellations", diagram)
+    measure("fusion chain", chain([f] * args.boxes))
+
+    start = time.perf_counter()
+    diagram = random_network(args.boxes, args.lanes)
+    print(f"built random network of {len(diagram)} boxes on {args.lanes} lanes in {time.perf_counter() - start:.3f} s")
+    measure("random network", diagram)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# CategoryTheory/Benchmarks/Store_Benchmark.py
+# Run from the repository root: python -m Benchmarks.Store_Benchmark --steps 200
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import DL.mapping as mapping
+from DL.store import ParameterStore, leaves
+from DL.update import rda_momentum
+from .MNIST import mnist_model
+
+def per_step(label, run, steps):
+    """Time and peak allocation of one update"""
+    run()
+    start = time.perf_counter()
+    for _ in range(steps):
+        run()
+    elapsed = (time.perf_counter() - start) / steps
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:32s} {elapsed * 1e3:8.3f} ms/update, {peak / 1024:10.1f} KiB allocated")
+
+def checkpoint(label, write, read, path):
+    start = time.perf_counter()
+    write(path)
+    written = time.perf_counter() - start
+    start = time.perf_counter()
+    read(path)
+    print(f"{label:32s} write {written * 1e3:7.3f} ms, read {(time.perf_counter() - start) * 1e3:7.3f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark in-place updates on a flat parameter store.")
+    parser.add_argument("--steps", type=int, default=200)
+    args = parser.parse_args()
+
+    np.random.seed(0)
+    update = rda_momentum(γ=-0.1)
+    param = mnist_model().param()
+    state = update.initialize(param)
+    pdiff = mapping.zero_of(param)
+    for change in leaves(pdiff):
+        change[...] = np.random.normal(0, 1e-4, change.shape)
+    store = ParameterStore(param, update)
+    print(f"{store.params.size:,} parameters, {store.states.size:,} state values")
+
+    def tree_update():
+        nonlocal state, param
+        state, param = update.update.rev(((state, param), pdiff))
+
+    per_step("tree of arrays (lens rev)", tree_update, args.steps)
+    per_step("store, changes copied in", lambda: store.update(pdiff), args.steps)
+    per_step("store, changes already in diff", lambda: store.update_rule.step(store.states, store.params, store.diff),
+             args.steps)
+
+    with tempfile.TemporaryDirectory() as directory:
+        arrays = {str(k): a for k, a in enumerate(leaves((state, param)))}
+        checkpoint("tree of arrays (npz)", lambda path: np.savez(path, **arrays),
+                   lambda path: [a for a in np.load(path).values()], os.path.join(directory, "tree.npz"))
+        checkpoint("store (one npy)", store.save, store.restore, os.path.join(directory, "store.npy"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+
+import unittest
+from AbstractCategory.AbstractCategory import AbstractCategory
+from AbstractCategory.Completeness import CompletenessAnalyzer
+from AbstractCategory.Morphism import Morphism
+from AbstractCategory.Universal import UniversalPropertyVerifier
+from AbstractColimit.Coproduct import Coproduct
+from AbstractLimit.Product import Product
+from AbstractPullback.AbstractPullback import Pullback
+from AbstractPushout.AbstractPushout import Pushout
+
+class TestCompleteness(unittest.TestCase):
+
+    def setUp(self):
+        """The lattice a ≤ b, c ≤ d as a thin category"""
+        self.bd = Morphism("bd", "b", "d")
+        self.cd = Morphism("cd", "c", "d")
+        self.lattice = AbstractCategory.from_morphisms(["a", "b", "c", "d"], [
+            Morphism("ab", "a", "b"), Morphism("ac", "a", "c"), self.bd, self.cd, Morphism("ad", "a", "d")])
+
+    def test_terminal_and_initial_objects(self):
+        analyzer = CompletenessAnalyzer(self.lattice)
+        self.assertEqual(analyzer.terminal_objects(), ["d"])
+        self.assertEqual(analyzer.initial_objects(), ["a"])
+        self.assertEqual(self.lattice.initial_objects(), ["a"])
+        self.assertEqual(self.lattice.terminal_objects(), ["d"])
+        # Both APIs go by hom-set sizes: without morphisms into c, c is still not initial
+        C = AbstractCategory.from_morphisms(["a", "b", "c"], [Morphism("ab", "a", "b")])
+        self.assertEqual(C.initial_objects(), CompletenessAnalyzer(C).initial_objects())
+        self.assertEqual((C.initial_objects(), C.terminal_objects(), C.zero_objects()), ([], [], []))
+        point = AbstractCategory.from_morphisms(["*"], [])
+        self.assertEqual(point.zero_objects(), ["*"])
+
+    def test_lattice_is_complete_and_cocomplete(self):
+        self.assertTrue(self.lattice.has_all_small_limits())
+        self.assertTrue(self.lattice.has_all_small_colimits())
+        # The pullback of b → d ← c is their meet
+        analyzer = CompletenessAnalyzer(self.lattice)
+        shape = ((1, 2, 3), ((0, 2, analyzer.index(self.bd)), (1, 2, analyzer.index(self.cd))))
+        apex, _ = analyzer.limit(shape)
+        self.assertEqual(analyzer.objects[apex], "a")
+
+    def test_missing_meet_is_reported(self):
+        C = AbstractCategory.from_morphisms(["b", "c", "d"], [self.bd, self.cd])
+        self.assertEqual(C.limit_failures(), [{"diagram": "cospan", "morphisms": ("bd", "cd")}])
+        self.assertFalse(C.is_complete_category())
+        # Joins exist, but there is no initial object
+        self.assertEqual(C.colimit_failures(), [{"diagram": "initial object", "morphisms": ()}])
+
+    def test_parallel_pair_without_equalizer(self):
+        C = AbstractCategory.from_morphisms(["X", "Y"], [Morphism("f", "X", "Y"), Morphism("g", "X", "Y")])
+        failures = C.limit_failures()
+        self.assertIn({"diagram": "terminal object", "morphisms": ()}, failures)
+        self.assertIn({"diagram": "parallel pair", "morphisms": ("f", "g")}, failures)
+        self.assertIn({"diagram": "parallel pair", "morphisms": ("f", "g")}, C.colimit_failures())
+
+def total_order(n):
+    objects = [f"o{i}" for i in range(n)]
+    return AbstractCategory.from_morphisms(objects, [Morphism(f"o{i}≤o{j}", f"o{i}", f"o{j}") for i in range(n) for j in range(i + 1, n)])
+
+class TestUniversalProperty(unittest.TestCase):
+
+    def setUp(self):
+        """The lattice z ≤ a ≤ b, c ≤ d as a thin category"""
+        self.m = {name: Morphism(name, name[0], name[1]) for name in ["za", "zb", "zc", "zd", "ab", "ac", "ad", "bd", "cd"]}
+        self.C = AbstractCategory.from_morphisms(["z", "a", "b", "c", "d"], list(self.m.values()))
+
+    def cone(self, limit, apex, legs):
+        limit.limit_object, limit.cone_morphisms, limit.is_computed = apex, legs, True
+        return limit
+
+    def test_pullback_is_the_meet(self):
+        m = self.m
+        pullback = self.cone(Pullback(self.C, m["bd"], m["cd"]), "a", {"X": m["ab"], "Y": m["ac"]})
+        self.assertTrue(pullback.verify_universal_property({"X": m["zb"], "Y": m["zc"]}))
+        # Legs into b and c from a must be ab and ac
+        self.assertFalse(pullback.verify_universal_property({"X": m["ac"], "Y": m["ac"]}))
+        # A cone at z commutes but a's cone does not factor through it
+        lower = self.cone(Pullback(self.C, m["bd"], m["cd"]), "z", {"X": m["zb"], "Y": m["zc"]})
+        self.assertTrue(lower.verify_universal_property({"X": m["zb"], "Y": m["zc"]}))
+        self.assertFalse(lower.verify_universal_property({"X": m["ab"], "Y": m["ac"]}))
+
+    def test_pushout_is_the_join(self):
+        m = self.m
+        pushout = Pushout(self.C, m["ab"], m["ac"])
+        pushout.colimit_object, pushout.cocone_morphisms, pushout.is_computed = "d", {"X": m["bd"], "Y": m["cd"]}, True
+        self.assertTrue(pushout.verify_universal_property({"X": m["bd"], "Y": m["cd"]}))
+
+    def test_every_cone_is_checked(self):
+        verifier = UniversalPropertyVerifier.of(self.C)
+        m = self.m
+        nodes, arrows = ["b", "c", "d"], [(0, 2, m["bd"]), (1, 2, m["cd"])]
+        self.assertIsNone(verifier.verify(nodes, arrows, "a", [m["ab"], m["ac"], None]))
+        self.assertIn("no mediating morphism", verifier.verify(nodes, arrows, "z", [m["zb"], m["zc"], None]))
+        # Verdicts are memoized on the shared verifier
+        self.assertIs(UniversalPropertyVerifier.of(self.C), verifier)
+        self.assertEqual(len(verifier._verdicts), 2)
+
+    def test_mediating_morphism_must_be_unique(self):
+        p, c = Morphism("p", "P", "X"), Morphism("c", "C", "X")
+        C = AbstractCategory.from_morphisms(["P", "X", "C"], [p, c, Morphism("u1", "C", "P"), Morphism("u2", "C", "P")])
+        product = Product(C, ["X"])
+        product.limit_object, product.cone_morphisms, product.is_computed = "P", {"X": p}, True
+        self.assertFalse(product.verify_universal_property({"X": c}))
+        self.assertIn("2 mediating morphisms", UniversalPropertyVerifier.of(C).verify(["X"], [], "P", [p], [[c]]))
+
+    def test_product_and_coproduct_use_declared_morphisms(self):
+        # The meet and join of b and c in the lattice a ≤ b, c ≤ d
+        m = [Morphism("π_b", "a", "b"), Morphism("π_c", "a", "c"), Morphism("ι_b", "b", "d"), Morphism("ι_c", "c", "d")]
+        C = AbstractCategory.from_morphisms(["a", "b", "c", "d"], m + [Morphism("ad", "a", "d")])
+        product, coproduct = Product(C, ["b", "c"]), Coproduct(C, ["b", "c"])
+        self.assertEqual(product.compute_limit(), "a")
+        self.assertEqual(product.cone_morphisms, {"b": m[0], "c": m[1]})
+        self.assertTrue(product.verify_universal_property())
+        self.assertEqual(coproduct.compute_colimit(), "d")
+        self.assertTrue(coproduct.verify_universal_property())
+        # Without them there is nothing to name the product by
+        with self.assertRaisesRegex(ValueError, "π_d"):
+            Product(C, ["b", "d"]).compute_limit()
+        with self.assertRaisesRegex(ValueError, "ι_a"):
+            Coproduct(C, ["a", "b"]).compute_colimit()
+
+    def test_parallel_cone_search(self):
+        C = total_order(60)
+        sequential, parallel = UniversalPropertyVerifier(C), UniversalPropertyVerifier(C, workers=2)
+        f, g = C.Hom("o10", "o40")[0], C.Hom("o25", "o40")[0]
+        shape = sequential.shape(["o10", "o25", "o40"], [(0, 2, f), (1, 2, g)])
+        self.assertEqual(parallel.all_cones(shape), sequential.all_cones(shape))
+        # Only apexes below o10 can carry cones
+        self.assertEqual(sequential.candidate_apexes(shape), list(range(11)))
+        apex, _ = sequential.limit(shape)
+        self.assertEqual(sequential.objects[apex], "o10")
+
+if __name__ == '__main__':
+    unittest.main()
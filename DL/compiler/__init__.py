@@ -0,0 +1 @@
+from DL.compiler.compiler import *
\ No newline at end of file
@@ -0,0 +1,224 @@
+import time
+import numpy as np
+
+from DL import mapping
+from DL.mapping import Mapping
+from DL.parameteriedmapping import Para, ParaInit
+
+################################################################
+# Tracing
+#
+# A model is traced on a symbolic input: the point (P, A) with every array of
+# P and the input A replaced by a buffer slot. Values are then trees of slots,
+# i.e. nested tuples of slot numbers, with None for the unit object.
+# Composites (see Mapping.parts) are traced through their parts, and the
+# structural lenses below only rearrange trees, so they vanish at compile time.
+# Every other lens becomes an Op reading a tree of slots and writing one slot.
+
+# Structural lenses: trees of slots → trees of slots
+STRUCTURAL = {
+    id(mapping.identity): lambda t: t,
+    id(mapping.assocL): lambda t: (t[0][0], (t[0][1], t[1])),
+    id(mapping.assocR): lambda t: ((t[0], t[1][0]), t[1][1]),
+    id(mapping.fst): lambda t: t[0],
+    id(mapping.snd): lambda t: t[1],
+}
+
+def lens_name(lens: Mapping):
+    """ The name of a lens of DL.mapping, or of the function that built it (e.g. conv2d), or "lens" """
+    for name, value in vars(mapping).items():
+        if value is lens:
+            return name
+    # Lenses built by a function, e.g. mapping.conv2d(stride, padding), have a local forward map
+    factory, _, local = lens.forward.__qualname__.partition(".<locals>.")
+    if local and factory != "Mapping.__init__":
+        return factory
+    return "lens"
+
+class Op:
+    """ A primitive lens applied to a tree of buffer slots, writing one slot """
+    def __init__(self, lens: Mapping, inputs, output: int):
+        self.lens = lens
+        self.inputs = inputs
+        self.output = output
+
+    def __str__(self):
+        inputs = self.inputs if type(self.inputs) is tuple else "({})".format(self.inputs)
+        return "{} = {}{}".format(self.output, lens_name(self.lens), inputs)
+
+def _trace(lens: Mapping, t, ops, slots):
+    structural = STRUCTURAL.get(id(lens))
+    if structural is not None:
+        try:
+            return structural(t)
+        except (TypeError, IndexError):
+            raise ValueError("Cannot trace {} on slots {}".format(lens_name(lens), t))
+    if lens.parts is not None:
+        kind, f, g = lens.parts
+        if kind == ">>":
+            return _trace(g, _trace(f, t, ops, slots), ops, slots)
+        if type(t) is not tuple:
+            raise ValueError("Cannot trace a tensor product on slot {}".format(t))
+        return _trace(f, t[0], ops, slots), _trace(g, t[1], ops, slots)
+    ops.append(Op(lens, t, slots[0]))
+    slots[0] += 1
+    return ops[-1].output
+
+def _slots_of(p, slots):
+    """ The tree of slots for a point, numbering its arrays from slots[0] on """
+    if p is None:
+        return None
+    if type(p) is tuple:
+        return _slots_of(p[0], slots), _slots_of(p[1], slots)
+    slots[0] += 1
+    return slots[0] - 1
+
+################################################################
+# Running
+
+def _gather(buffer, t):
+    if t is None:
+        return None
+    if type(t) is tuple:
+        return _gather(buffer, t[0]), _gather(buffer, t[1])
+    return buffer[t]
+
+def _reader(t):
+    """ _gather specialised to the tree t, so that running an op does not walk its tree """
+    if t is None:
+        return lambda buffer: None
+    if type(t) is tuple:
+        first, second = _reader(t[0]), _reader(t[1])
+        return lambda buffer: (first(buffer), second(buffer))
+    return lambda buffer: buffer[t]
+
+def _scatter(buffer, t, v):
+    if t is None or v is None:
+        return
+    if type(t) is tuple:
+        _scatter(buffer, t[0], v[0])
+        _scatter(buffer, t[1], v[1])
+    else:
+        buffer[t] = v
+
+def _accumulate(grads, t, dv):
+    """ Add a change dv, shaped like the tree t, into the change buffer """
+    if t is None or dv is None:
+        return
+    if type(t) is tuple:
+        _accumulate(grads, t[0], dv[0])
+        _accumulate(grads, t[1], dv[1])
+    elif grads[t] is None:
+        grads[t] = dv
+    else:
+        grads[t] = grads[t] + dv
+
+def _timed(record, k, stage, f, *args):
+    """ f(*args), reporting its duration to record(k, stage, seconds) if record is given """
+    if record is None:
+        return f(*args)
+    start = time.perf_counter()
+    result = f(*args)
+    record(k, stage, time.perf_counter() - start)
+    return result
+
+class CompiledLens:
+    """ A parametrised lens P × A → B compiled to a flat list of primitive ops
+
+        The buffer holds one slot per array of the parameters, one for the
+        input and one per op output. forward and backward have the meaning of
+        arrow.fwd and arrow.rev of the traced Para, with the point (P, A)
+        passed as two arguments.
+    """
+    def __init__(self, arrow: Mapping, param):
+        slots = [0]
+        self.params = _slots_of(param, slots)
+        self.input = slots[0]
+        slots[0] += 1
+        self.ops = []
+        self.output = _trace(arrow, (self.params, self.input), self.ops, slots)
+        self.size = slots[0]
+        self._inputs = [_reader(op.inputs) for op in self.ops]
+
+    def _load(self, params, x):
+        buffer = [None] * self.size
+        _scatter(buffer, self.params, params)
+        buffer[self.input] = x
+        return buffer
+
+    def forward(self, params, x):
+        """ The output of the model at parameters params and input x """
+        buffer = self._load(params, x)
+        for op, read in zip(self.ops, self._inputs):
+            buffer[op.output] = op.lens.fwd(read(buffer))
+        return _gather(buffer, self.output)
+
+    def backward(self, params, x, dy):
+        """ The changes (dparams, dx) of parameters and input for a change dy of the output """
+        grads = self._pass(params, x, dy)
+        return self._changes(grads, self.params, params), self._changes(grads, self.input, x)
+
+    def profile(self, params, x, dy):
+        """ Time every op of one forward and reverse pass, as backward runs them
+
+            :return: A list of (op, forward seconds, reverse seconds), in op order.
+        """
+        seconds = {"forward": [0.0] * len(self.ops), "reverse": [0.0] * len(self.ops)}
+
+        def record(k, stage, t):
+            seconds[stage][k] = t
+
+        self._pass(params, x, dy, record)
+        return list(zip(self.ops, seconds["forward"], seconds["reverse"]))
+
+    def _pass(self, params, x, dy, record=None):
+        """ One forward and reverse pass, returning the changes of every slot
+
+            :param record: Called as record(k, stage, seconds) with the time op k took
+                           in stage "forward" or "reverse", if given.
+        """
+        buffer = self._load(params, x)
+        residuals = []
+        for k, (op, read) in enumerate(zip(self.ops, self._inputs)):
+            buffer[op.output], r = _timed(record, k, "forward", op.lens.forward, read(buffer))
+            residuals.append(r)
+        grads = [None] * self.size
+        _accumulate(grads, self.output, dy)
+        for k in reversed(range(len(self.ops))):
+            op = self.ops[k]
+            # Reverse maps are linear in the change, so ops whose output has no change are skipped
+            if grads[op.output] is not None:
+                change = _timed(record, k, "reverse", op.lens.backward, residuals[k], grads[op.output])
+                _accumulate(grads, op.inputs, change)
+        return grads
+
+    def _changes(self, grads, t, p):
+        """ The tree of changes for the slots t, with zero for slots that received none """
+        if t is None:
+            return None
+        if type(t) is tuple:
+            return self._changes(grads, t[0], p[0]), self._changes(grads, t[1], p[1])
+        return grads[t] if grads[t] is not None else mapping.zero_of(p)
+
+    def __str__(self):
+        lines = ["params {} input {}".format(self.params, self.input)]
+        lines += [str(op) for op in self.ops]
+        lines.append("output {}".format(self.output))
+        return "\n".join(lines)
+
+def compile_model(model: ParaInit, param=None):
+    """ Compile a model to a CompiledLens
+
+        :param model: A ParaInit, or a Para if param is given.
+        :param param: A point of the parameter space fixing its structure,
+                      by default model.param().
+        :return: A CompiledLens computing model.arrow.arrow.
+    """
+    if type(model) is ParaInit:
+        arrow = model.arrow.arrow
+        param = model.param() if param is None else param
+    elif type(model) is Para and param is not None:
+        arrow = model.arrow
+    else:
+        raise ValueError("compile_model takes a ParaInit, or a Para together with its parameters")
+    return CompiledLens(arrow, param)
@@ -0,0 +1,146 @@
+""" Datasets in the IDX format of MNIST, loaded as memory-mapped arrays """
+import gzip
+import hashlib
+import os
+import numpy as np
+
+# IDX type codes (third byte of the magic number); values are big-endian
+IDX_TYPES = {
+    0x08: np.dtype(np.uint8),
+    0x09: np.dtype(np.int8),
+    0x0B: np.dtype(">i2"),
+    0x0C: np.dtype(">i4"),
+    0x0D: np.dtype(">f4"),
+    0x0E: np.dtype(">f8"),
+}
+
+def _open(path):
+    """ A file object for a gzip-compressed or raw file """
+    with open(path, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+    return gzip.open(path, "rb") if compressed else open(path, "rb")
+
+def _header(f):
+    """ Read the magic number and dimensions: the dtype, shape and header size """
+    magic = f.read(4)
+    if len(magic) != 4 or magic[0] != 0 or magic[1] != 0 or magic[2] not in IDX_TYPES:
+        raise ValueError("Not an IDX file: magic number {}".format(magic.hex()))
+    ndim = magic[3]
+    shape = tuple(int(d) for d in np.frombuffer(f.read(4 * ndim), dtype=">i4"))
+    return IDX_TYPES[magic[2]], shape, 4 + 4 * ndim
+
+def read_idx(path):
+    """ The array stored in an IDX file, gzip-compressed or raw
+
+        Raw files are memory-mapped (read-only, not copied); compressed files
+        are decompressed into memory.
+    """
+    with _open(path) as f:
+        dtype, shape, offset = _header(f)
+        if isinstance(f, gzip.GzipFile):
+            data = f.read()
+            if len(data) != dtype.itemsize * int(np.prod(shape)):
+                raise ValueError("{}: expected {} values of shape {}".format(path, int(np.prod(shape)), shape))
+            return np.frombuffer(data, dtype=dtype).reshape(shape)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+
+def default_cache_dir():
+    """ The directory of dataset caches: $XDG_CACHE_HOME/CategoryTheory, by default in ~/.cache """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "CategoryTheory")
+
+def _cache_path(path, suffix, cache_dir):
+    path = os.path.abspath(path)
+    name = os.path.basename(path)
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if cache_dir is None:
+        # One subdirectory per data directory, so that equally named files do not share a cache
+        digest = hashlib.sha1(os.path.dirname(path).encode()).hexdigest()[:16]
+        cache_dir = os.path.join(default_cache_dir(), digest)
+    return os.path.join(cache_dir, name + suffix + ".npy")
+
+def _cached(path, suffix, convert, cache_dir):
+    """ convert(read_idx(path)), cached as a .npy file and memory-mapped """
+    cache = _cache_path(path, suffix, cache_dir)
+    if not os.path.exists(cache) or os.path.getmtime(cache) < os.path.getmtime(path):
+        array = convert(read_idx(path))
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        # Written under a temporary name first, so that an interrupted write leaves no cache behind
+        partial = cache[:-4] + ".partial.npy"
+        np.save(partial, array)
+        os.replace(partial, cache)
+    return np.load(cache, mmap_mode="r")
+
+def load_images(path, cache_dir=None, flatten=True):
+    """ The images of an IDX file as float32 values in [0, 1]
+
+        The normalized images are cached in cache_dir (by default a directory
+        under default_cache_dir()) as a .npy file, so that later loads
+        memory-map them without conversion.
+
+        :param flatten: Return shape (n, rows * columns) instead of (n, rows, columns).
+        :return: A read-only memory-mapped array.
+    """
+    images = _cached(path, ".float32", lambda raw: np.divide(raw, 255, dtype=np.float32), cache_dir)
+    return images.reshape(len(images), -1) if flatten else images
+
+def load_labels(path, cache_dir=None, classes=10):
+    """ The labels of an IDX file, one-hot encoded on access (see OneHot) """
+    return OneHot(_cached(path, "", lambda raw: np.asarray(raw, dtype=np.uint8), cache_dir), classes)
+
+class OneHot:
+    """ One-hot vectors of integer labels, built only for the labels indexed
+
+        ys[i] is a vector of length classes for an integer i, and an array of
+        shape (len(i), classes) for a slice or an array of indices, so a
+        OneHot can be passed as labels to train_supervised.
+    """
+    def __init__(self, labels, classes: int):
+        self.labels = labels
+        self.classes = classes
+        self.shape = (len(labels), classes)
+        self._identity = np.identity(classes, dtype=np.float32)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, i):
+        return self._identity[self.labels[i]]
+
+    def __array__(self, dtype=None, copy=None):
+        return self[:] if dtype is None else self[:].astype(dtype)
+
+def load_mnist(directory, kind="train", cache_dir=None):
+    """ The MNIST images and labels of a kind ("train" or "t10k") in directory
+
+        The files are named as distributed, e.g. t10k-images-idx3-ubyte.gz;
+        the raw (uncompressed) files are used if present.
+    """
+    def find(name):
+        for candidate in [name, name + ".gz"]:
+            path = os.path.join(directory, candidate)
+            if os.path.exists(path):
+                return path
+        raise ValueError("No {} or {}.gz in {}".format(name, name, directory))
+
+    images = load_images(find("{}-images-idx3-ubyte".format(kind)), cache_dir)
+    labels = load_labels(find("{}-labels-idx1-ubyte".format(kind)), cache_dir)
+    if len(images) != len(labels):
+        raise ValueError("{} images but {} labels".format(len(images), len(labels)))
+    return images, labels
+
+def minibatches(xs, ys, batch_size: int, shuffle=True, seed=None):
+    """ Stream (x, y) minibatches of a dataset, as slices of a shuffled index array
+
+        Batches of memory-mapped arrays are read from disk only when yielded.
+    """
+    n = len(xs)
+    if not shuffle:
+        for j in range(0, n, batch_size):
+            yield xs[j:j + batch_size], ys[j:j + batch_size]
+        return
+    permutation = np.random.default_rng(seed).permutation(n)
+    for j in range(0, n, batch_size):
+        i = permutation[j:j + batch_size]
+        yield xs[i], ys[i]
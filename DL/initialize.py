@@ -16,3 +16,9 @@ def glorot_normal(shape):
     (b, a) = shape
     stddev = np.sqrt(2.0 / (a + b))
     return np.random.normal(0, stddev, shape)
+
+# He et al. (2015), for layers followed by a ReLU; shape (out, in, ...) as for
+# linear layers and convolution kernels, with fan-in in × (kernel size)
+def he_normal(shape):
+    fan_in = int(np.prod(shape[1:]))
+    return np.random.normal(0, np.sqrt(2.0 / fan_in), shape)
@@ -42,3 +42,13 @@ def mse_rev(args):
 mse = Displacement(
     displacement=Mapping(identity.fwd, mse_rev),
     inverse=Mapping(identity.fwd, mse_rev)) # self-inverse
+
+# Minibatch MSE displacement: the change of the (batch, features) output is
+# averaged over the batch, so that parameter changes are mean changes.
+def batch_mse_rev(args):
+    yhat, ytrue = args
+    return (yhat - ytrue) / len(yhat)
+
+batch_mse = Displacement(
+    displacement=Mapping(identity.fwd, batch_mse_rev),
+    inverse=mse.inverse)
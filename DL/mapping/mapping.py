@@ -1,14 +1,32 @@
 import numpy as np
-import scipy.special as special
+from numpy.lib.stride_tricks import sliding_window_view
 
 class Mapping:
     """ Monomorphic lenses, stored as a pair of maps
             fwd : A → B
             rev : A × B' → A'
+        together with their residual-passing form
+            forward  : A → B × R
+            backward : R × B' → A'
+        where the residual R holds whatever the reverse map needs from the
+        forward pass. By default R = A, i.e. backward(x, dy) = rev((x, dy)).
+        Composites record how they were built in parts, (">>", f, g) or
+        ("@", f, g), so that they can be traced (see DL.compiler); primitive
+        lenses have parts None.
     """
-    def __init__(self, fwd, rev):
+    def __init__(self, fwd, rev, forward=None, backward=None, parts=None):
         self.fwd = fwd
         self.rev = rev
+        self.forward = forward if forward is not None else lambda x: (fwd(x), x)
+        self.backward = backward if backward is not None else lambda r, dy: rev((r, dy))
+        self.parts = parts
+
+    @staticmethod
+    def from_residual(forward, backward):
+        """ A lens given by its residual-passing maps; rev runs forward once to get the residual """
+        return Mapping(lambda x: forward(x)[0],
+                       lambda xy: backward(forward(xy[0])[1], xy[1]),
+                       forward, backward)
 
     # Tensor
     # f : A -> B
@@ -16,15 +34,32 @@ class Mapping:
     def __matmul__(f, g):
         """ Tensor product of lenses """
         fwd = lambda ac: (f.fwd(ac[0]), g.fwd(ac[1]))
-        rev = lambda acbd: (f.rev((acbd[0][0], acbd[1][0])), g.rev((acbd[0][1], acbd[1][1])))
-        return Mapping(fwd, rev)
+
+        def forward(ac):
+            b, r = f.forward(ac[0])
+            d, s = g.forward(ac[1])
+            return (b, d), (r, s)
+
+        backward = lambda rs, bd: (f.backward(rs[0], bd[0]), g.backward(rs[1], bd[1]))
+        rev = lambda acbd: backward(forward(acbd[0])[1], acbd[1])
+        return Mapping(fwd, rev, forward, backward, ("@", f, g))
 
     # Composition
     def __rshift__(f, g):
-        """ Composition of lenses in diagrammatic order (f; g) """
+        """ Composition of lenses in diagrammatic order (f; g)
+            The residual of f; g is the pair of residuals of f and g, so the reverse
+            map runs every forward map once instead of once per enclosing composite.
+        """
         fwd = lambda x: g.fwd(f.fwd(x))
-        rev = lambda xy: f.rev((  xy[0], g.rev(( f.fwd(xy[0]), xy[1] )) ))
-        return Mapping(fwd, rev)
+
+        def forward(x):
+            y, r = f.forward(x)
+            z, s = g.forward(y)
+            return z, (r, s)
+
+        backward = lambda rs, dz: f.backward(rs[0], g.backward(rs[1], dz))
+        rev = lambda xy: backward(forward(xy[0])[1], xy[1])
+        return Mapping(fwd, rev, forward, backward, (">>", f, g))
 
 ################################################################
 # Basic lenses
@@ -91,13 +126,19 @@ def zero_of(x):
 # Neural Network layers and activation functions
 
 def linear_fwd(mx):
-    """ Forward map of a linear layer """
+    """ Forward map of a linear layer, also on a batch of inputs (one per row)
+
+        Only the forward map is batched, e.g. to evaluate a trained dense model
+        on a whole dataset; use batch_linear to train on minibatches.
+    """
     m, x = mx
-    return m @ x
+    return x @ m.T
 
 def linear_rev(mxy):
-    """ Reverse map of a linear layer """
+    """ Reverse map of a linear layer, on a single input """
     (m, x), y = mxy
+    if np.ndim(x) != 1:
+        raise ValueError("linear takes one input vector in reverse, got shape {}; use batch_linear".format(np.shape(x)))
     return (np.outer(y, x), m.T @ y)
 
 linear = Mapping(linear_fwd, linear_rev)
@@ -105,12 +146,19 @@ linear = Mapping(linear_fwd, linear_rev)
 ################################################################
 # Activation functions as lenses
 
+_expit = None
+
 def sigmoid_fwd(z):
-    return special.expit(z)
+    global _expit
+    if _expit is None:
+        # scipy is only loaded once a sigmoid is evaluated
+        from scipy.special import expit as _expit
+    return _expit(z)
 
 def sigmoid_rev(xy):
     x, dy = xy
-    return sigmoid_fwd(x) * (1 - sigmoid_fwd(x)) * dy
+    s = sigmoid_fwd(x)
+    return s * (1 - s) * dy
 
 def relu_fwd(x):
     return np.maximum(x, 0)
@@ -119,5 +167,129 @@ def relu_rev(args):
     x, dy = args
     return (x > 0) * dy
 
-sigmoid = Mapping(sigmoid_fwd, sigmoid_rev)
+def sigmoid_forward(z):
+    s = sigmoid_fwd(z)
+    return s, s
+
+def sigmoid_backward(s, dy):
+    return s * (1 - s) * dy
+
+sigmoid = Mapping(sigmoid_fwd, sigmoid_rev, sigmoid_forward, sigmoid_backward)
 relu = Mapping(relu_fwd, relu_rev)
+
+################################################################
+# Minibatch lenses
+# Points are (batch, features) arrays; parameter changes are summed over the
+# batch, so a batched loss that averages over the batch yields mean gradients.
+
+# The forward map of linear already acts on batches
+batch_linear_fwd = linear_fwd
+
+def batch_linear_rev(mxy):
+    """ Reverse map of a batched linear layer """
+    (m, x), y = mxy
+    return (y.T @ x, y @ m)
+
+batch_linear = Mapping(batch_linear_fwd, batch_linear_rev)
+
+def unbroadcast(dx, shape):
+    """ Sum a change over the axes along which a point of the given shape was broadcast """
+    while dx.ndim > len(shape):
+        dx = dx.sum(axis=0)
+    for axis, size in enumerate(shape):
+        if size == 1 and dx.shape[axis] != 1:
+            dx = dx.sum(axis=axis, keepdims=True)
+    return dx
+
+def batch_add_rev(xyz):
+    (x, y), dz = xyz
+    return unbroadcast(dz, np.shape(x)), unbroadcast(dz, np.shape(y))
+
+# Addition with broadcasting, e.g. of a bias vector to every row of a batch
+batch_add = Mapping(lambda x: x[0] + x[1], batch_add_rev)
+
+# Activations act pointwise, so they are their own batched variants
+batch_relu = relu
+batch_sigmoid = sigmoid
+
+################################################################
+# Convolutional lenses
+# Points are minibatches of images of shape (batch, channels, height, width).
+# Windows are strided views of the input (im2col without a copy until the
+# matrix product), and reverse maps add changes back window by window.
+
+def _windows(x, size: int, stride: int):
+    """ The (size × size) windows of x at the given stride: (n, c, oh, ow, size, size) """
+    return sliding_window_view(x, (size, size), axis=(2, 3))[:, :, ::stride, ::stride]
+
+def _add_windows(dx, dwindows, stride: int):
+    """ Add changes of the windows (n, c, oh, ow, k, k) into the change dx of the images """
+    oh, ow, k = dwindows.shape[2], dwindows.shape[3], dwindows.shape[4]
+    for i in range(k):
+        for j in range(k):
+            dx[:, :, i:i + stride * oh:stride, j:j + stride * ow:stride] += dwindows[:, :, :, :, i, j]
+    return dx
+
+def conv2d(stride: int = 1, padding: int = 0):
+    """ Convolution lens (W, X) ↦ W ⋆ X of kernels W : (out, in, k, k) and images X : (n, in, h, w) """
+    def forward(wx):
+        w, x = wx
+        if padding:
+            x = np.pad(x, ((0, 0), (0, 0), (padding, padding), (padding, padding)))
+        windows = _windows(x, w.shape[2], stride)
+        # (n, oh, ow, out) → (n, out, oh, ow)
+        y = np.tensordot(windows, w, axes=([1, 4, 5], [1, 2, 3])).transpose(0, 3, 1, 2)
+        return y, (w, x.shape, windows)
+
+    def backward(r, dy):
+        w, shape, windows = r
+        dw = np.tensordot(dy, windows, axes=([0, 2, 3], [0, 2, 3]))
+        # (n, oh, ow, in, k, k) → (n, in, oh, ow, k, k)
+        dwindows = np.tensordot(dy, w, axes=([1], [0])).transpose(0, 3, 1, 2, 4, 5)
+        dx = _add_windows(np.zeros(shape), dwindows, stride)
+        if padding:
+            dx = dx[:, :, padding:-padding, padding:-padding]
+        return dw, dx
+
+    return Mapping.from_residual(forward, backward)
+
+def maxpool2d(size: int, stride: int = None):
+    """ Max pooling lens over (size × size) windows, by default not overlapping """
+    stride = stride or size
+
+    def forward(x):
+        windows = _windows(x, size, stride)
+        flat = windows.reshape(windows.shape[:4] + (size * size,))
+        index = flat.argmax(axis=-1)
+        y = np.take_along_axis(flat, index[..., None], axis=-1)[..., 0]
+        return y, (x.shape, index)
+
+    def backward(r, dy):
+        shape, index = r
+        dwindows = np.zeros(index.shape + (size * size,))
+        np.put_along_axis(dwindows, index[..., None], dy[..., None], axis=-1)
+        return _add_windows(np.zeros(shape), dwindows.reshape(index.shape + (size, size)), stride)
+
+    return Mapping.from_residual(forward, backward)
+
+def avgpool2d(size: int, stride: int = None):
+    """ Average pooling lens over (size × size) windows, by default not overlapping """
+    stride = stride or size
+
+    def forward(x):
+        return _windows(x, size, stride).mean(axis=(4, 5)), x.shape
+
+    def backward(shape, dy):
+        dwindows = np.broadcast_to((dy / (size * size))[..., None, None], dy.shape + (size, size))
+        return _add_windows(np.zeros(shape), dwindows, stride)
+
+    return Mapping.from_residual(forward, backward)
+
+def flatten_forward(x):
+    return x.reshape(len(x), -1), x.shape
+
+def flatten_backward(shape, dy):
+    return dy.reshape(shape)
+
+# Flatten each image of a minibatch into a row, e.g. before a batch_dense layer
+flatten = Mapping.from_residual(flatten_forward, flatten_backward)
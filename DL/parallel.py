@@ -0,0 +1,150 @@
+""" Data-parallel training on a ParameterStore in shared memory """
+import multiprocessing
+import numpy as np
+
+from DL.parameteriedmapping import Para, ParaInit
+from DL.store import ParameterStore
+from DL.update import Update
+
+# Shared with the forked worker processes
+_WORKER = None
+
+def shared_allocator(context):
+    """ An allocate function for ParameterStore placing arrays in shared memory
+
+        Processes forked afterwards see (and write) the same memory.
+    """
+    def allocate(n, dtype):
+        dtype = np.dtype(dtype)
+        raw = context.RawArray("b", max(n * dtype.itemsize, 1))
+        return np.frombuffer(raw, dtype=dtype, count=n)
+    return allocate
+
+class DataParallelTrainer:
+    """ Minibatch training of a model by several processes sharing one ParameterStore
+
+        Every worker process holds a replica of the model (inherited by fork)
+        and computes changes of the parameters on its part of the data. In
+            mode "sync" every minibatch is split across the workers, whose
+                changes are summed (an all-reduce, each worker summing one
+                slice) before one update; the result does not depend on the
+                number of workers up to rounding.
+            mode "hogwild" each worker trains on its own minibatches and
+                updates the shared parameters without locking.
+        The data order is drawn from seed alone, so runs are reproducible
+        (exactly in mode "sync").
+    """
+    MODES = ("sync", "hogwild")
+
+    def __init__(self, model: ParaInit, update: Update, loss: Para, cap: Para,
+                 workers: int = 2, mode: str = "sync", seed: int = 0):
+        """
+        :param model: The model, built from minibatch layers (e.g. batch_dense).
+        :param update: An Update with an in-place step.
+        :param loss: A minibatch loss averaging over the batch, e.g. Para(batch_mse_loss).
+        :param cap: The learning-rate cap, as for supervised_step.
+        """
+        if mode not in self.MODES:
+            raise ValueError("Unknown mode {}, expected one of {}".format(mode, self.MODES))
+        if workers < 1:
+            raise ValueError("workers must be positive")
+        if update.step is None:
+            raise ValueError("The update has no in-place step")
+        self.workers = workers
+        self.mode = mode
+        self.seed = seed
+        self.learner = model.arrow >> (loss >> cap)
+        self.context = multiprocessing.get_context("fork") \
+            if "fork" in multiprocessing.get_all_start_methods() else None
+        if self.context is None:
+            self.workers = 1
+        allocate = shared_allocator(self.context) if self.workers > 1 else np.empty
+        self.store = ParameterStore(model.param(), update, allocate=allocate)
+        n = self.store.params.size
+        # One row of changes per worker, reduced into store.diff
+        self.changes = allocate(self.workers * n, np.float64).reshape(self.workers, n)
+
+    def _changes(self, x, y):
+        """ The change of the parameters for a minibatch, as a tree """
+        (((_, _), p_diff), _) = self.learner.arrow.rev(((((None, y), self.store.param), x), None))
+        return p_diff
+
+    def _order(self, epoch, n):
+        return np.random.default_rng((self.seed, epoch)).permutation(n)
+
+    def _run_sync(self, k, xs, ys, num_epochs, batch_size, barrier):
+        store, n = self.store, len(xs)
+        size = store.params.size
+        lo, hi = k * size // self.workers, (k + 1) * size // self.workers
+        for epoch in range(num_epochs):
+            permutation = self._order(epoch, n)
+            for j in range(0, n, batch_size):
+                batch = permutation[j:j + batch_size]
+                shard = batch[k::self.workers]
+                if len(shard):
+                    store.load_changes(self._changes(xs[shard], ys[shard]), out=self.changes[k])
+                    # The loss averages over the shard; weight it by its share of the batch
+                    self.changes[k] *= len(shard) / len(batch)
+                else:
+                    self.changes[k] = 0
+                if barrier is not None:
+                    barrier.wait()
+                np.sum(self.changes[:, lo:hi], axis=0, out=store.diff[lo:hi])
+                if barrier is not None:
+                    barrier.wait()
+                if k == 0:
+                    store.update()
+                if barrier is not None:
+                    barrier.wait()
+
+    def _run_hogwild(self, k, xs, ys, num_epochs, batch_size):
+        store, n = self.store, len(xs)
+        for epoch in range(num_epochs):
+            permutation = self._order(epoch, n)
+            for b, j in enumerate(range(0, n, batch_size)):
+                if b % self.workers != k:
+                    continue
+                batch = permutation[j:j + batch_size]
+                store.load_changes(self._changes(xs[batch], ys[batch]), out=self.changes[k])
+                store.update_rule.step(store.states, store.params, self.changes[k])
+
+    def _run(self, k, xs, ys, num_epochs, batch_size, barrier):
+        if self.mode == "sync":
+            self._run_sync(k, xs, ys, num_epochs, batch_size, barrier)
+        else:
+            self._run_hogwild(k, xs, ys, num_epochs, batch_size)
+
+    def train(self, train_x, train_y, num_epochs=1, batch_size=128):
+        """ Train on a dataset, updating store in place
+
+            :return: The ParameterStore, whose param are the parameters of the model.
+        """
+        n, m = np.shape(train_x)[0], np.shape(train_y)[0]
+        if n != m:
+            raise ValueError("Mismatch in dimension 0: {} training examples but {} labels".format(n, m))
+        if self.workers == 1:
+            self._run(0, train_x, train_y, num_epochs, batch_size, None)
+            return self.store
+
+        global _WORKER
+        _WORKER = (self, train_x, train_y, num_epochs, batch_size, self.context.Barrier(self.workers))
+        processes = [self.context.Process(target=_work, args=(k,)) for k in range(self.workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        _WORKER = None
+        failed = [k for k, process in enumerate(processes) if process.exitcode != 0]
+        if failed:
+            raise RuntimeError("Training failed in worker(s) {}".format(failed))
+        return self.store
+
+def _work(k):
+    """ Worker: train replica k, releasing the others from the barrier if it fails """
+    trainer, xs, ys, num_epochs, batch_size, barrier = _WORKER
+    np.random.seed(trainer.seed + k)
+    try:
+        trainer._run(k, xs, ys, num_epochs, batch_size, barrier)
+    except BaseException:
+        barrier.abort()
+        raise
@@ -65,3 +65,43 @@ def bias(n: int, initialize=np.zeros):
 # NOTE: this morphism is a composite of the morphisms "linear", "add", and "activation".
 def dense(shape: tuple, activation: mapping.Mapping):
     return linear(shape) >> bias(shape[1]) >> to_para_init(activation)
+
+################################################################
+# Minibatch layers: the same parameters as above, applied to (batch, features) inputs
+################################################################
+
+def batch_linear(shape, initialize=initialize.normal(0, 0.01)):
+    a, b = shape
+    p = lambda: initialize((b, a))
+    return ParaInit(p, Para(mapping.batch_linear))
+
+def batch_bias(n: int, initialize=np.zeros):
+    return ParaInit(lambda: initialize((n,)), Para(mapping.batch_add))
+
+def batch_dense(shape: tuple, activation: mapping.Mapping):
+    return batch_linear(shape) >> batch_bias(shape[1]) >> to_para_init(activation)
+
+################################################################
+# Convolutional layers, on minibatches of images (batch, channels, height, width)
+################################################################
+
+def convolution(channels: tuple, kernel: int, stride=1, padding=0, initialize=initialize.he_normal):
+    a, b = channels
+    p = lambda: initialize((b, a, kernel, kernel))
+    return ParaInit(p, Para(mapping.conv2d(stride, padding)))
+
+def channel_bias(n: int, initialize=np.zeros):
+    # One bias per channel, broadcast over the pixels
+    return ParaInit(lambda: initialize((n, 1, 1)), Para(mapping.batch_add))
+
+# A convolutional layer: the composite of "convolution", "channel_bias", and "activation"
+def conv2d(channels: tuple, kernel: int, activation: mapping.Mapping, stride=1, padding=0):
+    return convolution(channels, kernel, stride, padding) >> channel_bias(channels[1]) >> to_para_init(activation)
+
+def maxpool2d(size: int, stride=None):
+    return to_para_init(mapping.maxpool2d(size, stride))
+
+def avgpool2d(size: int, stride=None):
+    return to_para_init(mapping.avgpool2d(size, stride))
+
+flatten = to_para_init(mapping.flatten)
@@ -1,8 +1,14 @@
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 # Measure the accuracy of a function (f : A → B) on a dataset of pairs [(A, B)]
-def accuracy(f, xs, ys):
+# With batched=True, f maps a batch of inputs (one per row) to a batch of
+# outputs, and is called once per chunk of chunk_size rows (by default once).
+def accuracy(f, xs, ys, batched=False, chunk_size=None):
     n = len(xs)
+    if batched:
+        chunks = zip(outputs(f, xs, chunk_size), _chunks(ys, n, chunk_size))
+        return sum(np.sum(_matches(yhat, y)) for yhat, y in chunks) / n
     s = 0
     for i in range(0, n):
         yhat = f(xs[i])
@@ -10,3 +16,114 @@ def accuracy(f, xs, ys):
         if np.all(yhat == ytrue):
             s += 1
     return s / n
+
+def _chunks(xs, n, chunk_size=None):
+    """ The consecutive chunks of chunk_size rows (by default all) of a dataset """
+    chunk_size = chunk_size or n
+    for lo in range(0, n, chunk_size):
+        yield xs[lo:lo + chunk_size]
+
+def _matches(yhat, ytrue):
+    """ Whether each row of a batch of outputs equals the expected one """
+    equal = np.asarray(yhat) == np.asarray(ytrue)
+    return equal.reshape(len(equal), -1).all(axis=1)
+
+def outputs(f, xs, chunk_size=None):
+    """ Stream the outputs of a batched function on consecutive chunks of a dataset """
+    for chunk in _chunks(xs, len(xs), chunk_size):
+        yield f(chunk)
+
+def confusion_matrix(f, xs, labels, classes: int, chunk_size=None):
+    """ Counts of (true label, predicted label) pairs of a batched classifier
+
+        :param f: Maps a batch of inputs to class scores (one row each), or to labels.
+        :param labels: The integer labels of the dataset.
+        :return: An array c of shape (classes, classes), c[i, j] counting the
+                 examples of label i predicted as j.
+    """
+    counts = np.zeros(classes * classes, dtype=np.int64)
+    for scores, truth in zip(outputs(f, xs, chunk_size), _chunks(labels, len(xs), chunk_size)):
+        predicted = scores.argmax(axis=1) if np.ndim(scores) == 2 else scores
+        counts += np.bincount(np.asarray(truth) * classes + predicted, minlength=classes * classes)
+    return counts.reshape(classes, classes)
+
+def _total_loss(loss, y, yhat, summed):
+    """ The loss of a chunk summed over its rows """
+    value = loss.fwd((y, yhat))[0]
+    return value if summed else value * len(y)
+
+def mean_loss(f, xs, ys, loss, chunk_size=None, summed=False):
+    """ The mean loss of a batched function on a dataset
+
+        :param loss: A loss lens whose forward map averages the loss of the rows
+                     of a batch, e.g. DL.supervised.batch_mse_loss or
+                     softmax_cross_entropy_loss.
+        :param summed: The forward map of the loss sums over the rows instead,
+                       as DL.supervised.mse_loss does.
+    """
+    chunks = zip(outputs(f, xs, chunk_size), _chunks(ys, len(xs), chunk_size))
+    return sum(_total_loss(loss, y, yhat, summed) for yhat, y in chunks) / len(xs)
+
+def evaluate(f, xs, ys, loss=None, chunk_size=None, summed=False):
+    """ Accuracy, confusion matrix and (with a loss lens) mean loss of a batched
+        classifier on a dataset of one-hot labels, in one pass over the dataset
+
+        :param loss, summed: As for mean_loss.
+        :return: A dict with keys "accuracy", "confusion" and, with a loss, "loss".
+    """
+    n, classes = np.shape(ys)
+    counts = np.zeros(classes * classes, dtype=np.int64)
+    total = 0.0
+    for scores, y in zip(outputs(f, xs, chunk_size), _chunks(ys, n, chunk_size)):
+        y = np.asarray(y)
+        counts += np.bincount(y.argmax(axis=1) * classes + scores.argmax(axis=1), minlength=classes * classes)
+        if loss is not None:
+            total += _total_loss(loss, y, scores, summed)
+    confusion = counts.reshape(classes, classes)
+    result = {"accuracy": np.trace(confusion) / n, "confusion": confusion}
+    if loss is not None:
+        result["loss"] = total / n
+    return result
+
+def snapshot(p):
+    """ A copy of a point, e.g. of parameters that training goes on updating in place """
+    if p is None:
+        return None
+    elif type(p) is tuple:
+        return snapshot(p[0]), snapshot(p[1])
+    else:
+        return np.array(p)
+
+class BackgroundEvaluation:
+    """ Evaluate a model on a dataset in a background thread while training goes on
+
+        submit(param) copies the parameters and returns a Future of
+        evaluate(x ↦ fwd((param, x)), xs, ys, loss, chunk_size, summed). NumPy releases
+        the GIL in matrix products, so evaluation overlaps with training.
+    """
+    def __init__(self, fwd, xs, ys, loss=None, chunk_size=1024, summed=False):
+        """
+        :param fwd: The forward map P × A → B of a model, e.g. model.arrow.arrow.fwd.
+        """
+        self.fwd = fwd
+        self.xs = xs
+        self.ys = ys
+        self.loss = loss
+        self.chunk_size = chunk_size
+        self.summed = summed
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def submit(self, param):
+        param = snapshot(param)
+        return self._executor.submit(evaluate, lambda x: self.fwd((param, x)), self.xs, self.ys,
+                                     self.loss, self.chunk_size, self.summed)
+
+    def close(self):
+        """ Wait for the submitted evaluations and stop the thread """
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
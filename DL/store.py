@@ -0,0 +1,102 @@
+""" Parameters and optimizer state packed into one contiguous array """
+import numpy as np
+
+def leaves(p):
+    """ The arrays of a point, in order, skipping the unit object """
+    if p is None:
+        return []
+    elif type(p) is tuple:
+        return leaves(p[0]) + leaves(p[1])
+    else:
+        return [p]
+
+def _views(p, flat, offset, path, views):
+    """ Rebuild the tree p with each array replaced by a view of flat, from offset on """
+    if p is None:
+        return None, offset
+    elif type(p) is tuple:
+        v0, offset = _views(p[0], flat, offset, path + "0", views)
+        v1, offset = _views(p[1], flat, offset, path + "1", views)
+        return (v0, v1), offset
+    else:
+        view = flat[offset:offset + p.size].reshape(p.shape)
+        views[path] = view
+        return view, offset + p.size
+
+class ParameterStore:
+    """ The parameters P and optimizer state S(P) of a model in one array
+
+        buffer = [params | state] is a single contiguous float array, and
+            param, state : trees of views into it, shaped like P and S(P)
+            params, states : the flat slices holding P and S(P)
+        so that an update rule acting on arrays (Update.step) updates every
+        layer with one vectorized call, and a checkpoint is a single array.
+        The change buffer diff (with tree of views diffs) is scratch space
+        for the changes of P, and is not part of the checkpoint.
+
+        views maps names to the views of each array: "param." or "state."
+        followed by the path to the array in the tree, one digit per tuple
+        component. For a dense layer with parameters (None, (bias, weights))
+        these are e.g. param.10 (bias) and param.11 (weights); in a composite
+        f >> g the parameters of g come first (see ParaInit).
+    """
+    def __init__(self, param, update=None, dtype=np.float64, allocate=np.empty):
+        """
+        :param param: The initial parameters, e.g. model.param().
+        :param update: An Update, whose initialize gives the initial state.
+        :param dtype: The float type of the buffer.
+        :param allocate: Allocates the buffer and diff given a size and dtype,
+                         e.g. in shared memory (see DL.parallel).
+        """
+        state = update.initialize(param) if update is not None else None
+        n = sum(a.size for a in leaves(param))
+        m = sum(a.size for a in leaves(state))
+        self.buffer = allocate(n + m, dtype)
+        self.params = self.buffer[:n]
+        self.states = self.buffer[n:]
+        self.views = {}
+        param_views, state_views = {}, {}
+        self.param, _ = _views(param, self.params, 0, "", param_views)
+        self.state, _ = _views(state, self.states, 0, "", state_views)
+        self.views.update({"param." + k: v for k, v in param_views.items()})
+        self.views.update({"state." + k: v for k, v in state_views.items()})
+        for view, value in zip(leaves(self.param) + leaves(self.state), leaves(param) + leaves(state)):
+            view[...] = value
+        self.diff = allocate(n, dtype)
+        self.diff[...] = 0
+        self.diffs, _ = _views(param, self.diff, 0, "", {})
+        self.update_rule = update
+
+    def load_changes(self, pdiff, out=None):
+        """ Copy a tree of changes of P into the change buffer, or the flat array out """
+        if out is None:
+            for view, change in zip(leaves(self.diffs), leaves(pdiff)):
+                np.copyto(view, change)
+            return
+        offset = 0
+        for change in leaves(pdiff):
+            np.copyto(out[offset:offset + change.size].reshape(change.shape), change)
+            offset += change.size
+
+    def update(self, pdiff=None):
+        """ Apply the update rule in place to all parameters at once
+
+            :param pdiff: A tree of changes of P, or None if diff already holds them.
+        """
+        if self.update_rule is None or self.update_rule.step is None:
+            raise ValueError("The update of this store has no in-place step")
+        if pdiff is not None:
+            self.load_changes(pdiff)
+        self.update_rule.step(self.states, self.params, self.diff)
+
+    def save(self, path):
+        """ Write parameters and state as one array (.npy) """
+        np.save(path, self.buffer)
+
+    def restore(self, path):
+        """ Read a checkpoint written by save into the buffer, keeping all views valid """
+        checkpoint = np.load(path, mmap_mode="r")
+        if checkpoint.shape != self.buffer.shape:
+            raise ValueError("Checkpoint of {} values does not fit a store of {}".format(
+                checkpoint.shape[0], self.buffer.shape[0]))
+        self.buffer[...] = checkpoint
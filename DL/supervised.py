@@ -6,6 +6,7 @@ import DL.mapping as mapping
 from DL.mapping import Mapping, identity
 from DL.parameteriedmapping import Para, ParaInit
 from DL.update import Update, apply_update
+from DL.store import ParameterStore
 
 # Loss : (B × B → L, B × B × L' → B' × B')
 # LR : (L → I, L × I' → L')
@@ -50,6 +51,89 @@ def mse_rev(args):
 
 mse_loss = Mapping(mse_fwd, mse_rev)
 
+# Minibatch MSE: y and yhat are (batch, features) arrays, and the loss is the
+# mean over the batch, so that parameter changes summed over the batch by the
+# batched lenses are mean changes and η does not depend on the batch size.
+def batch_mse_fwd(args):
+    y, yhat = args
+    loss = np.sum(0.5 * (y - yhat)**2) / len(y)
+    return np.array([loss])
+
+def batch_mse_rev(args):
+    (y, yhat), loss = args
+    assert type(loss) is np.ndarray
+    scale = loss / len(y)
+    return scale * (y - yhat), scale * (yhat - y)
+
+batch_mse_loss = Mapping(batch_mse_fwd, batch_mse_rev)
+
+################################################################
+# Loss library
+# The losses below take a batch of targets y and of predictions (rows of the
+# last axis; a single example is one row) and average over the rows, as
+# batch_mse_loss does. The classification losses take logits z, the inputs
+# of the output activation, and fuse that activation into the loss: their
+# reverse map is e.g. softmax(z) - y, without a Jacobian of the softmax.
+# Their forward maps keep what the reverse map needs as the residual.
+
+def _rows(y):
+    """ The number of rows of a batch (1 for a single example) """
+    return int(np.prod(np.shape(y)[:-1]))
+
+def logsumexp(z):
+    """ log Σ exp(z) over the last axis, computed as m + log Σ exp(z - m) for m = max z """
+    m = np.max(z, axis=-1, keepdims=True)
+    return (m + np.log(np.sum(np.exp(z - m), axis=-1, keepdims=True)))[..., 0]
+
+def log_softmax(z):
+    return z - logsumexp(z)[..., None]
+
+def softmax(z):
+    return np.exp(log_softmax(z))
+
+def softmax_cross_entropy_forward(args):
+    y, z = args
+    log_p = log_softmax(z)
+    loss = -np.sum(y * log_p) / _rows(y)
+    return np.array([loss]), (y, log_p)
+
+def softmax_cross_entropy_backward(r, loss):
+    y, log_p = r
+    scale = loss / _rows(y)
+    return -scale * log_p, scale * (np.exp(log_p) * np.sum(y, axis=-1, keepdims=True) - y)
+
+# Cross-entropy of softmax(z) against target distributions y (e.g. one-hot labels)
+softmax_cross_entropy_loss = Mapping.from_residual(softmax_cross_entropy_forward, softmax_cross_entropy_backward)
+
+def binary_cross_entropy_forward(args):
+    y, z = args
+    # -y log σ(z) - (1 - y) log(1 - σ(z)) = max(z, 0) - y z + log(1 + exp(-|z|))
+    loss = np.sum(np.maximum(z, 0) - y * z + np.log1p(np.exp(-np.abs(z)))) / _rows(y)
+    return np.array([loss]), (y, z)
+
+def binary_cross_entropy_backward(r, loss):
+    y, z = r
+    scale = loss / _rows(y)
+    return -scale * z, scale * (mapping.sigmoid_fwd(z) - y)
+
+# Cross-entropy of sigmoid(z) against targets y in [0, 1], per output (multi-label)
+binary_cross_entropy_loss = Mapping.from_residual(binary_cross_entropy_forward, binary_cross_entropy_backward)
+
+def huber_loss(δ: float = 1.0):
+    """ Huber loss: 0.5 r² for residuals |r| ≤ δ and δ (|r| - 0.5 δ) beyond """
+    def forward(args):
+        y, yhat = args
+        r = yhat - y
+        a = np.abs(r)
+        loss = np.sum(np.where(a <= δ, 0.5 * r**2, δ * (a - 0.5 * δ))) / _rows(y)
+        return np.array([loss]), r
+
+    def backward(r, loss):
+        dyhat = (loss / _rows(r)) * np.clip(r, -δ, δ)
+        return -dyhat, dyhat
+
+    return Mapping.from_residual(forward, backward)
+
 # Returns a function of type P × A × B → P
 def supervised_step(model: ParaInit, update: Update, loss: Para, cap: Para):
     assert type(model) is ParaInit
@@ -63,9 +147,26 @@ def supervised_step(model: ParaInit, update: Update, loss: Para, cap: Para):
 
     return step, model_with_update.param()
 
+# As supervised_step, but the parameters and optimizer state live in a
+# ParameterStore that step updates in place (with update.step) and returns.
+# The parameters of the model are store.param.
+def supervised_store_step(model: ParaInit, update: Update, loss: Para, cap: Para):
+    assert type(model) is ParaInit
+    learner = model.arrow >> (loss >> cap)
+    store = ParameterStore(model.param(), update)
+
+    def step(b, store, a):
+        (((_, _), p_diff), _) = learner.arrow.rev( ((((None, b), store.param), a), None) )
+        store.update(p_diff)
+        return store
+
+    return step, store
+
 # step : (S(P) × P) × A × B → (S(P) × P)
 # initial_parameters : S(P) × P
-def train_supervised(step, initial_parameters, train_x, train_y, num_epochs=1, shuffle_data=True):
+# With a batch_size, step is called on minibatches (e.g. built from batch_dense
+# and batch_mse_loss), and i is the array of example indices in the batch.
+def train_supervised(step, initial_parameters, train_x, train_y, num_epochs=1, shuffle_data=True, batch_size=None):
     # Check we have the same number of features and labels
     n = np.shape(train_x)[0]
     m = np.shape(train_y)[0]
@@ -81,6 +182,13 @@ def train_supervised(step, initial_parameters, train_x, train_y, num_epochs=1, s
         if shuffle_data:
             np.random.shuffle(permutation)
 
+        if batch_size is not None:
+            for j in range(0, n, batch_size):
+                i = permutation[j:j + batch_size]
+                param = step(ys[i], param, xs[i])
+                yield (epoch, j, i, param)
+            continue
+
         # A single loop of "generalised SGD" over each training example
         for j in range(0, n):
             i = permutation[j] # for shuffling
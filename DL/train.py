@@ -1,9 +1,13 @@
 import numpy as np
 from DL.learner import Learner
 import DL.mapping as mapping
+# Evaluation lives in DL.statistics, and is re-exported here
+from DL.statistics import accuracy
 
 # Train a model using the given update, displacement, and inverse displacement maps
-def train(learner: Learner, train_x, train_y, num_epochs=1, shuffle_data=True):
+# With a batch_size, the learner is run on minibatches (see DL.learner.batch_mse),
+# and i is the array of example indices in the batch.
+def train(learner: Learner, train_x, train_y, num_epochs=1, shuffle_data=True, batch_size=None):
     n = np.shape(train_x)[0]
     m = np.shape(train_y)[0]
     if n != m:
@@ -22,20 +26,16 @@ def train(learner: Learner, train_x, train_y, num_epochs=1, shuffle_data=True):
         if shuffle_data:
             np.random.shuffle(permutation)
 
+        if batch_size is not None:
+            for j in range(0, n, batch_size):
+                i = permutation[j:j + batch_size]
+                param, _ = step.rev(((param, xs[i]), ys[i]))
+                yield (epoch, j, i, param)
+            continue
+
         # A single loop of "generalised SGD" over each training example
         for j in range(0, n):
             i = permutation[j] # for shuffling
             x, y = xs[i], ys[i]
             param, _ = step.rev(((param, x), y))
             yield (epoch, j, i, param)
-
-# Measure the accuracy of a function (f : A → B) on a dataset of pairs [(A, B)]
-def accuracy(f, xs, ys):
-    n = len(xs)
-    s = 0
-    for i in range(0, n):
-        yhat = f(xs[i])
-        ytrue = ys[i]
-        if np.all(yhat == ytrue):
-            s += 1
-    return s / n
@@ -14,6 +14,10 @@ class Update:
     # P → S(P) -- choose an initial S(P) based on initial params
     initialize: Any = mapping.unit_of
 
+    # In-place form on arrays: step(s, p, pdiff) updates the arrays s and p and
+    # may overwrite pdiff. It updates a whole ParameterStore (DL.store) at once.
+    step: Any = None
+
 # This is like applying a 2-cell in Para, but we also deal with the
 # initialization machinery of ParaInit.
 def apply_update(para_init: para.ParaInit, update: Update):
@@ -42,7 +46,10 @@ def rda_update_rev(args):
 
 # The RDA update is just addition of parameters; to recover gradient descent we
 # place the learning rate as the "cap" of the learner.
-rda = Update(update=Mapping(rda_update_fwd, rda_update_rev), initialize=mapping.unit_of)
+def rda_step(sp, p, pdiff):
+    np.add(p, pdiff, out=p)
+
+rda = Update(update=Mapping(rda_update_fwd, rda_update_rev), initialize=mapping.unit_of, step=rda_step)
 
 def rda_momentum_update(γ):
     def rda_momentum_rev(args):
@@ -63,8 +70,15 @@ def rda_momentum_update(γ):
 
     return Mapping(mapping.snd.fwd, rda_momentum_rev)
 
+def rda_momentum_step(γ):
+    def step(v, p, pdiff):
+        np.multiply(v, γ, out=v)
+        np.add(v, pdiff, out=v)
+        np.add(p, v, out=p)
+    return step
+
 def rda_momentum(γ):
-    return Update(update=rda_momentum_update(γ), initialize=mapping.zero_of)
+    return Update(update=rda_momentum_update(γ), initialize=mapping.zero_of, step=rda_momentum_step(γ))
 
 ################################################################################
 # Old-style updates
@@ -95,8 +109,14 @@ def gd_update(ε):
         return p
     return Mapping(update_fwd, update_rev)
 
+def gd_step(ε):
+    def step(sp, p, pdiff):
+        np.multiply(pdiff, ε, out=pdiff)
+        np.subtract(p, pdiff, out=p)
+    return step
+
 def gd(ε):
-    return Update(update=gd_update(ε), initialize=mapping.unit_of)
+    return Update(update=gd_update(ε), initialize=mapping.unit_of, step=gd_step(ε))
 
 def momentum_update(ε, γ):
     """ Momentum gradient descent, with learning rate ε and momentum γ """
@@ -118,6 +138,155 @@ def momentum_update(ε, γ):
 
     return Mapping(mapping.snd.fwd, momentum_rev)
 
+def momentum_step(ε, γ):
+    def step(v, p, pdiff):
+        np.multiply(v, γ, out=v)
+        np.multiply(pdiff, ε, out=pdiff)
+        np.add(v, pdiff, out=v)
+        np.subtract(p, v, out=p)
+    return step
+
 def momentum(ε, γ):
-    return Update(update=momentum_update(ε, γ), initialize=mapping.zero_of)
+    return Update(update=momentum_update(ε, γ), initialize=mapping.zero_of, step=momentum_step(ε, γ))
+
+
+################################################################################
+# Adaptive updates
+# Like gd, these expect pdiff to be the gradient (a learning-rate cap of 1).
+# S(P) is a set of buffers allocated once by initialize and updated in place,
+# as are the parameters of a ParameterStore; the temporaries of each step live
+# in a scratch buffer reused across steps, so a step allocates nothing.
+#
+# Each rule is a kernel acting on arrays, used by the lens on every array of a
+# tree of parameters and by step on the flat arrays of a ParameterStore.
+################################################################################
+
+def _scratch(buffers, p):
+    """ A scratch array shaped like p, allocated on first use """
+    key = (p.shape, p.dtype)
+    if key not in buffers:
+        buffers[key] = np.empty_like(p)
+    return buffers[key]
+
+def adaptive_update(kernel, count=False):
+    """ The update lens of a kernel(state, p, pdiff, scratch, t) acting in place
+
+        :param count: Whether the state starts with a step counter t, an array
+                      of shape (1,), followed by the tree of state of the arrays.
+    """
+    buffers = {}
+
+    def rev_arrays(s, p, pdiff, t):
+        # s is the tuple of state trees, each shaped like p
+        if p is None:
+            return None
+        elif type(p) is tuple:
+            return (rev_arrays(tuple(x[0] for x in s), p[0], pdiff[0], t),
+                    rev_arrays(tuple(x[1] for x in s), p[1], pdiff[1], t))
+        else:
+            p_new = p.copy()
+            kernel(s, p_new, pdiff, _scratch(buffers, p), t)
+            return p_new
+
+    def rev(args):
+        (sp, p), pdiff = args
+        if count:
+            t, moments = sp
+            t += 1
+            return sp, rev_arrays(moments, p, pdiff, t[0])
+        return sp, rev_arrays((sp,), p, pdiff, None)
+
+    return Mapping(mapping.snd.fwd, rev)
+
+def adaptive_step(kernel, moments: int, count=False):
+    """ The in-place step of a kernel on the flat arrays of a ParameterStore
+
+        The flat state is [t |] followed by the given number of moment arrays.
+    """
+    buffers = {}
+
+    def step(s, p, pdiff):
+        if count:
+            s[0] += 1
+            t, s = s[0], s[1:]
+        else:
+            t = None
+        n = p.size
+        kernel(tuple(s[k * n:(k + 1) * n] for k in range(moments)), p, pdiff, _scratch(buffers, p), t)
+
+    return step
+
+def _moving_average(a, x, β):
+    """ a ← β a + (1 - β) x, in place, as x + β (a - x) """
+    np.subtract(a, x, out=a)
+    np.multiply(a, β, out=a)
+    np.add(a, x, out=a)
+
+def adam_kernel(ε, β1, β2, δ, λ):
+    def kernel(s, p, g, scratch, t):
+        m, v = s
+        _moving_average(m, g, β1)
+        np.multiply(g, g, out=scratch)
+        _moving_average(v, scratch, β2)
+        # Bias-corrected step ε m̂ / (√v̂ + δ)
+        np.sqrt(v, out=scratch)
+        np.multiply(scratch, 1 / np.sqrt(1 - β2 ** t), out=scratch)
+        np.add(scratch, δ, out=scratch)
+        np.divide(m, scratch, out=scratch)
+        np.multiply(scratch, ε / (1 - β1 ** t), out=scratch)
+        if λ:
+            # Decoupled weight decay
+            np.multiply(p, 1 - ε * λ, out=p)
+        np.subtract(p, scratch, out=p)
+    return kernel
+
+def _moments_of(n):
+    def initialize(p):
+        return (np.zeros(1), tuple(mapping.zero_of(p) for _ in range(n)))
+    return initialize
+
+def adam(ε=0.001, β1=0.9, β2=0.999, δ=1e-8):
+    """ Adam, with learning rate ε, moment decays β1, β2 and stabilizer δ """
+    kernel = adam_kernel(ε, β1, β2, δ, 0)
+    return Update(update=adaptive_update(kernel, count=True), initialize=_moments_of(2),
+                  step=adaptive_step(kernel, 2, count=True))
+
+def adamw(ε=0.001, β1=0.9, β2=0.999, δ=1e-8, λ=0.01):
+    """ Adam with weight decay λ decoupled from the gradient """
+    kernel = adam_kernel(ε, β1, β2, δ, λ)
+    return Update(update=adaptive_update(kernel, count=True), initialize=_moments_of(2),
+                  step=adaptive_step(kernel, 2, count=True))
+
+def rmsprop_kernel(ε, ρ, δ):
+    def kernel(s, p, g, scratch, t):
+        v, = s
+        np.multiply(g, g, out=scratch)
+        _moving_average(v, scratch, ρ)
+        np.sqrt(v, out=scratch)
+        np.add(scratch, δ, out=scratch)
+        np.divide(g, scratch, out=scratch)
+        np.multiply(scratch, ε, out=scratch)
+        np.subtract(p, scratch, out=p)
+    return kernel
+
+def rmsprop(ε=0.001, ρ=0.9, δ=1e-8):
+    """ RMSProp, with learning rate ε, decay ρ of the squared gradients and stabilizer δ """
+    kernel = rmsprop_kernel(ε, ρ, δ)
+    return Update(update=adaptive_update(kernel), initialize=mapping.zero_of, step=adaptive_step(kernel, 1))
+
+def adagrad_kernel(ε, δ):
+    def kernel(s, p, g, scratch, t):
+        G, = s
+        np.multiply(g, g, out=scratch)
+        np.add(G, scratch, out=G)
+        np.sqrt(G, out=scratch)
+        np.add(scratch, δ, out=scratch)
+        np.divide(g, scratch, out=scratch)
+        np.multiply(scratch, ε, out=scratch)
+        np.subtract(p, scratch, out=p)
+    return kernel
 
+def adagrad(ε=0.01, δ=1e-8):
+    """ AdaGrad, with learning rate ε and stabilizer δ """
+    kernel = adagrad_kernel(ε, δ)
+    return Update(update=adaptive_update(kernel), initialize=mapping.zero_of, step=adaptive_step(kernel, 1))
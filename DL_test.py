@@ -0,0 +1,467 @@
+
+import gzip
+import os
+import tempfile
+import tracemalloc
+import unittest
+from unittest import mock
+import numpy as np
+import DL.mapping as mapping
+from DL.mapping import Mapping
+from DL.parameteriedmapping import Para, batch_dense, conv2d, dense, flatten, maxpool2d, to_para
+from DL.supervised import supervised_step, supervised_store_step, mse_loss, batch_mse_loss, learning_rate, train_supervised
+from DL.supervised import (binary_cross_entropy_loss, huber_loss, logsumexp, softmax,
+                           softmax_cross_entropy_loss)
+from DL.update import adagrad, adam, adamw, gd, momentum, rda, rda_momentum, rmsprop
+from DL.compiler import compile_model
+from DL.store import ParameterStore, leaves
+from DL.datasets import OneHot, default_cache_dir, load_labels, load_mnist, minibatches, read_idx
+from DL.parallel import DataParallelTrainer
+from DL.statistics import BackgroundEvaluation, accuracy, confusion_matrix, evaluate, mean_loss
+
+def counting(calls, name):
+    """The lens x ↦ 2x, counting its forward evaluations"""
+    def fwd(x):
+        calls[name] = calls.get(name, 0) + 1
+        return 2 * x
+    return Mapping(fwd, lambda xy: 2 * xy[1])
+
+def numerical_gradient(f, x, eps=1e-6):
+    grad = np.zeros_like(x)
+    for i in np.ndindex(x.shape):
+        dx = np.zeros_like(x)
+        dx[i] = eps
+        grad[i] = (f(x + dx) - f(x - dx)) / (2 * eps)
+    return grad
+
+class TestResidualLenses(unittest.TestCase):
+
+    def test_each_forward_runs_once_per_reverse_pass(self):
+        calls = {}
+        lens = counting(calls, 0)
+        for k in range(1, 20):
+            lens = lens >> counting(calls, k)
+        dx = lens.rev((np.ones(3), np.ones(3)))
+        self.assertEqual(calls, {k: 1 for k in range(20)})
+        np.testing.assert_allclose(dx, 2.0 ** 20)
+        calls.clear()
+        pair = counting(calls, "left") @ counting(calls, "right")
+        (da, dc) = (pair >> mapping.identity).rev(((np.ones(2), np.ones(2)), (np.ones(2), np.ones(2))))
+        self.assertEqual(calls, {"left": 1, "right": 1})
+        np.testing.assert_allclose(da, 2.0)
+
+    def test_dense_gradients(self):
+        np.random.seed(0)
+        model = dense((4, 3), activation=mapping.sigmoid) >> dense((3, 2), activation=mapping.relu)
+        p, x, dy = model.param(), np.random.random(4), np.random.random(2)
+        lens = model.arrow.arrow
+        dp, dx = lens.rev(((p, x), dy))
+        np.testing.assert_allclose(dx, numerical_gradient(lambda v: lens.fwd((p, v)) @ dy, x), atol=1e-6)
+        # p = (second layer, first layer), each (activation unit, (bias, weights))
+        weights = p[1][1][1]
+        numeric = numerical_gradient(lambda w: lens.fwd(((p[0], (None, (p[1][1][0], w))), x)) @ dy, weights)
+        np.testing.assert_allclose(dp[1][1][1], numeric, atol=1e-6)
+
+    def test_training_step_runs(self):
+        np.random.seed(0)
+        model = dense((5, 4), activation=mapping.relu) >> dense((4, 2), activation=mapping.sigmoid)
+        step, param = supervised_step(model, rda_momentum(γ=-0.1), Para(mse_loss), to_para(learning_rate(η=-0.5)))
+        x, y = np.random.random(5), np.array([1.0, 0.0])
+        loss = lambda p: np.sum((model.arrow.arrow.fwd((p[1], x)) - y) ** 2)
+        before = loss(param)
+        for _ in range(50):
+            param = step(y, param, x)
+        self.assertLess(loss(param), before)
+
+class TestMinibatchLenses(unittest.TestCase):
+
+    def test_batched_gradients_are_sums_of_per_example_gradients(self):
+        np.random.seed(0)
+        model = dense((4, 3), activation=mapping.sigmoid) >> dense((3, 2), activation=mapping.relu)
+        batched = batch_dense((4, 3), activation=mapping.sigmoid) >> batch_dense((3, 2), activation=mapping.relu)
+        p, xs, dys = model.param(), np.random.random((5, 4)), np.random.random((5, 2))
+        dp, dxs = batched.arrow.arrow.rev(((p, xs), dys))
+        singles = [model.arrow.arrow.rev(((p, x), dy)) for x, dy in zip(xs, dys)]
+        np.testing.assert_allclose(batched.arrow.arrow.fwd((p, xs)),
+                                   [model.arrow.arrow.fwd((p, x)) for x in xs])
+        np.testing.assert_allclose(dxs, [dx for _, dx in singles])
+        # p = (second layer, first layer), each (activation unit, (bias, weights))
+        for layer in range(2):
+            for k in range(2):
+                np.testing.assert_allclose(dp[layer][1][k], sum(q[layer][1][k] for q, _ in singles))
+        # The reverse map of the unbatched linear lens takes single inputs only
+        with self.assertRaises(ValueError):
+            model.arrow.arrow.rev(((p, xs), dys))
+
+    def test_train_supervised_yields_shuffled_batches(self):
+        np.random.seed(0)
+        model = batch_dense((5, 4), activation=mapping.relu) >> batch_dense((4, 2), activation=mapping.sigmoid)
+        step, param = supervised_step(model, rda_momentum(γ=-0.1), Para(batch_mse_loss), to_para(learning_rate(η=-2.0)))
+        xs = np.random.random((50, 5))
+        ys = np.identity(2)[(xs[:, 0] > 0.5).astype(int)]
+        loss = lambda p: np.sum((model.arrow.arrow.fwd((p[1], xs)) - ys) ** 2)
+        before = loss(param)
+        batches = list(train_supervised(step, param, xs, ys, num_epochs=100, batch_size=16))
+        self.assertEqual([j for _, j, _, _ in batches[:4]], [0, 16, 32, 48])
+        self.assertEqual(sorted(np.concatenate([i for e, _, i, _ in batches if e == 0])), list(range(50)))
+        self.assertLess(loss(batches[-1][3]), before / 2)
+
+class TestConvolutionalLenses(unittest.TestCase):
+
+    def check_gradients(self, lens, x, atol=1e-6):
+        y = lens.fwd(x)
+        dy = np.random.random(y.shape)
+        np.testing.assert_allclose(lens.rev((x, dy)), numerical_gradient(lambda v: np.sum(lens.fwd(v) * dy), x),
+                                   atol=atol)
+
+    def test_conv2d_matches_a_direct_convolution(self):
+        np.random.seed(0)
+        w, x = np.random.random((4, 3, 3, 3)), np.random.random((2, 3, 7, 7))
+        for stride, padding in [(1, 0), (2, 1)]:
+            lens = mapping.conv2d(stride, padding)
+            y = lens.fwd((w, x))
+            padded = np.pad(x, ((0, 0), (0, 0), (padding, padding), (padding, padding)))
+            oh = (padded.shape[2] - 3) // stride + 1
+            self.assertEqual(y.shape, (2, 4, oh, oh))
+            i, j = oh - 1, 1
+            window = padded[1, :, i * stride:i * stride + 3, j * stride:j * stride + 3]
+            np.testing.assert_allclose(y[1, :, i, j], np.tensordot(w, window, axes=3))
+            dy = np.random.random(y.shape)
+            dw, dx = lens.rev(((w, x), dy))
+            np.testing.assert_allclose(dw, numerical_gradient(lambda v: np.sum(lens.fwd((v, x)) * dy), w), atol=1e-6)
+            np.testing.assert_allclose(dx, numerical_gradient(lambda v: np.sum(lens.fwd((w, v)) * dy), x), atol=1e-6)
+
+    def test_pooling_and_flatten_gradients(self):
+        np.random.seed(0)
+        x = np.random.random((2, 3, 6, 6))
+        self.assertEqual(mapping.maxpool2d(2).fwd(x).shape, (2, 3, 3, 3))
+        np.testing.assert_allclose(mapping.avgpool2d(3).fwd(x)[0, 0, 0, 0], x[0, 0, :3, :3].mean())
+        for lens in [mapping.maxpool2d(2), mapping.maxpool2d(3, stride=1), mapping.avgpool2d(2),
+                     mapping.avgpool2d(3, stride=2), mapping.flatten]:
+            self.check_gradients(lens, x)
+
+    def test_cnn_trains_and_compiles(self):
+        np.random.seed(0)
+        model = (conv2d((1, 4), 3, activation=mapping.relu) >> maxpool2d(2) >> flatten
+                 >> batch_dense((4 * 3 * 3, 2), activation=mapping.sigmoid))
+        # Bright left or right halves
+        xs = np.random.random((40, 1, 8, 8)) * 0.1
+        side = np.arange(40) % 2
+        xs[side == 0, :, :, :4] += 1
+        xs[side == 1, :, :, 4:] += 1
+        ys = np.identity(2)[side]
+        step, store = supervised_store_step(model, adam(ε=0.01), Para(batch_mse_loss), to_para(learning_rate(η=1.0)))
+        loss = lambda p: np.sum((model.arrow.arrow.fwd((p, xs)) - ys) ** 2)
+        before = loss(store.param)
+        for _ in train_supervised(step, store, xs, ys, num_epochs=30, batch_size=8):
+            pass
+        self.assertLess(loss(store.param), before / 2)
+        compiled = compile_model(model, store.param)
+        self.assertEqual([str(op).split(" = ")[1].split("(")[0] for op in compiled.ops],
+                         ["conv2d", "batch_add", "relu", "maxpool2d", "flatten", "batch_linear", "batch_add", "sigmoid"])
+        np.testing.assert_allclose(compiled.forward(store.param, xs), model.arrow.arrow.fwd((store.param, xs)))
+        profile = compiled.profile(store.param, xs, np.ones((40, 2)))
+        self.assertEqual([op for op, _, _ in profile], compiled.ops)
+        self.assertTrue(all(f >= 0 and r >= 0 for _, f, r in profile))
+
+class TestLosses(unittest.TestCase):
+
+    def test_gradients_match_numerical_gradients(self):
+        np.random.seed(0)
+        labels = np.identity(5)[np.random.randint(5, size=4)]
+        targets, z, η = np.random.random((4, 5)), 3 * np.random.randn(4, 5), np.array([0.5])
+        for loss, y in [(softmax_cross_entropy_loss, labels), (binary_cross_entropy_loss, targets),
+                        (huber_loss(0.5), targets), (batch_mse_loss, targets)]:
+            dy, dz = loss.rev(((y, z), η))
+            np.testing.assert_allclose(dz, η * numerical_gradient(lambda v: loss.fwd((y, v))[0], z), atol=1e-6)
+            np.testing.assert_allclose(dy, η * numerical_gradient(lambda v: loss.fwd((v, z))[0], y), atol=1e-6)
+
+    def test_losses_are_stable_and_agree_with_their_definitions(self):
+        np.random.seed(0)
+        y, z = np.identity(3)[[0, 2]], np.random.randn(2, 3)
+        p = np.exp(z) / np.exp(z).sum(axis=1, keepdims=True)
+        np.testing.assert_allclose(softmax(z), p)
+        self.assertAlmostEqual(softmax_cross_entropy_loss.fwd((y, z))[0], -np.mean(np.log(p[y == 1])))
+        s = 1 / (1 + np.exp(-z))
+        self.assertAlmostEqual(binary_cross_entropy_loss.fwd((y, z))[0],
+                               -np.sum(y * np.log(s) + (1 - y) * np.log(1 - s)) / 2)
+        # Within δ, Huber is MSE
+        self.assertAlmostEqual(huber_loss(10.0).fwd((y, z))[0], batch_mse_loss.fwd((y, z))[0])
+        # Large logits
+        self.assertAlmostEqual(logsumexp(np.array([1000.0, 1000.0])), 1000 + np.log(2))
+        big = np.array([[1000.0, -1000.0, 0.0]])
+        for loss in [softmax_cross_entropy_loss, binary_cross_entropy_loss]:
+            value = loss.fwd((np.identity(3)[[0]], big))
+            self.assertTrue(np.all(np.isfinite(value)))
+            self.assertTrue(all(np.all(np.isfinite(d)) for d in loss.rev(((np.identity(3)[[0]], big), np.ones(1)))))
+
+    def test_training_with_cross_entropy(self):
+        np.random.seed(0)
+        model = batch_dense((5, 4), activation=mapping.relu) >> batch_dense((4, 2), activation=mapping.identity)
+        step, param = supervised_step(model, rda_momentum(γ=-0.1), Para(softmax_cross_entropy_loss),
+                                      to_para(learning_rate(η=-0.5)))
+        xs = np.random.random((50, 5))
+        ys = np.identity(2)[(xs[:, 0] > 0.5).astype(int)]
+        loss = lambda p: softmax_cross_entropy_loss.fwd((ys, model.arrow.arrow.fwd((p[1], xs))))[0]
+        before = loss(param)
+        for _, _, _, param in train_supervised(step, param, xs, ys, num_epochs=100, batch_size=16):
+            pass
+        self.assertLess(loss(param), before / 2)
+
+class TestCompiler(unittest.TestCase):
+
+    def test_dense_models_compile_to_primitive_ops(self):
+        np.random.seed(0)
+        model = dense((4, 3), activation=mapping.sigmoid) >> dense((3, 2), activation=mapping.relu)
+        compiled = compile_model(model)
+        # The assocL, identity and snd shuffles of Para composition leave no ops behind
+        self.assertEqual([str(op) for op in compiled.ops],
+                         ["5 = linear(3, 4)", "6 = add(2, 5)", "7 = sigmoid(6)",
+                          "8 = linear(1, 7)", "9 = add(0, 8)", "10 = relu(9)"])
+        p, x, dy = model.param(), np.random.random(4), np.random.random(2)
+        lens = model.arrow.arrow
+        np.testing.assert_allclose(compiled.forward(p, x), lens.fwd((p, x)))
+        (dp, dx), (dq, dz) = compiled.backward(p, x, dy), lens.rev(((p, x), dy))
+        np.testing.assert_allclose(dx, dz)
+        for layer in range(2):
+            self.assertIsNone(dp[layer][0])
+            for k in range(2):
+                np.testing.assert_allclose(dp[layer][1][k], dq[layer][1][k])
+
+    def test_batched_models_and_errors(self):
+        np.random.seed(0)
+        model = batch_dense((4, 3), activation=mapping.relu) >> batch_dense((3, 2), activation=mapping.sigmoid)
+        p, xs = model.param(), np.random.random((5, 4))
+        np.testing.assert_allclose(compile_model(model).forward(p, xs), model.arrow.arrow.fwd((p, xs)))
+        with self.assertRaises(ValueError):
+            compile_model(model.arrow)
+        with self.assertRaises(ValueError):
+            compile_model(Para(mapping.assocL), param=np.zeros(2))
+
+class TestParameterStore(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(0)
+        self.model = dense((4, 3), activation=mapping.relu) >> dense((3, 2), activation=mapping.sigmoid)
+
+    def test_in_place_steps_match_update_lenses(self):
+        for update in [rda, rda_momentum(γ=-0.1), gd(ε=0.1), momentum(ε=0.1, γ=0.9)]:
+            param = self.model.param()
+            state, store = update.initialize(param), ParameterStore(param, update)
+            for _ in range(3):
+                pdiff = mapping.zero_of(param)
+                for change in leaves(pdiff):
+                    change[...] = np.random.random(change.shape)
+                state, param = update.update.rev(((state, param), pdiff))
+                store.update(pdiff)
+            for a, b in zip(leaves((state, param)), leaves((store.state, store.param))):
+                np.testing.assert_allclose(a, b)
+
+    def test_views_share_one_buffer_and_checkpoint(self):
+        store = ParameterStore(self.model.param(), momentum(ε=0.1, γ=0.9))
+        self.assertEqual(store.buffer.size, 2 * (4 * 3 + 3 + 3 * 2 + 2))
+        # p = (second layer, first layer), each (activation unit, (bias, weights))
+        self.assertIs(store.views["param.111"], store.param[1][1][1])
+        self.assertEqual(store.views["state.011"].shape, (2, 3))
+        self.assertTrue(all(np.shares_memory(view, store.buffer) for view in store.views.values()))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.npy")
+            store.buffer[...] = np.arange(store.buffer.size)
+            store.save(path)
+            store.buffer[...] = 0
+            store.restore(path)
+            np.testing.assert_array_equal(store.buffer, np.arange(store.buffer.size))
+            # After the second layer's bias (2) and weights (6) and the first layer's bias (3)
+            np.testing.assert_array_equal(store.param[1][1][1].ravel(), np.arange(11, 23))
+            with self.assertRaises(ValueError):
+                ParameterStore(self.model.param()).restore(path)
+
+    def test_update_does_not_allocate(self):
+        store = ParameterStore(dense((300, 200), activation=mapping.relu).param(), rda_momentum(γ=-0.1))
+        store.update()
+        tracemalloc.start()
+        store.update()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        self.assertLess(peak, store.diff.nbytes // 100)
+
+class TestAdaptiveUpdates(unittest.TestCase):
+
+    def test_adam_matches_its_definition(self):
+        p, m, v = np.array([1.0, 2.0]), np.zeros(2), np.zeros(2)
+        update = adam(ε=0.1)
+        state, q = update.initialize(p), p
+        for t in range(1, 4):
+            g = np.array([0.5, -1.0]) * t
+            m, v = 0.9 * m + 0.1 * g, 0.999 * v + 0.001 * g * g
+            p = p - 0.1 * (m / (1 - 0.9 ** t)) / (np.sqrt(v / (1 - 0.999 ** t)) + 1e-8)
+            state, q = update.update.rev(((state, q), g))
+        np.testing.assert_allclose(q, p)
+
+    def test_tree_and_store_agree_without_allocating(self):
+        np.random.seed(0)
+        model = dense((4, 3), activation=mapping.relu) >> dense((3, 2), activation=mapping.sigmoid)
+        for update in [adam(), adamw(), rmsprop(), adagrad()]:
+            param = model.param()
+            state, store = update.initialize(param), ParameterStore(param, update)
+            for _ in range(3):
+                gradient = mapping.zero_of(param)
+                for g in leaves(gradient):
+                    g[...] = np.random.random(g.shape)
+                state, param = update.update.rev(((state, param), gradient))
+                store.update(gradient)
+            for a, b in zip(leaves((state, param)), leaves((store.state, store.param))):
+                np.testing.assert_allclose(a, b)
+            tracemalloc.start()
+            store.update()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            self.assertLess(peak, 1024)
+
+def idx_bytes(array):
+    """ An unsigned-byte array in the IDX format """
+    header = bytes([0, 0, 0x08, array.ndim]) + np.array(array.shape, dtype=">i4").tobytes()
+    return header + array.astype(np.uint8).tobytes()
+
+class TestDatasets(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.images = np.arange(5 * 2 * 3).reshape(5, 2, 3)
+        self.labels = np.array([3, 0, 9, 1, 3])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, array, compress):
+        path = os.path.join(self.directory.name, name)
+        with (gzip.open(path + ".gz", "wb") if compress else open(path, "wb")) as f:
+            f.write(idx_bytes(array))
+        return path + (".gz" if compress else "")
+
+    def test_compressed_and_raw_files_load_alike(self):
+        for compress in [True, False]:
+            path = self.write("images", self.images, compress)
+            np.testing.assert_array_equal(read_idx(path), self.images)
+        with open(path, "r+b") as f:
+            f.write(b"\x01")
+        with self.assertRaises(ValueError):
+            read_idx(path)
+
+    def test_mnist_is_cached_normalized_and_memory_mapped(self):
+        self.write("t10k-images-idx3-ubyte", self.images, True)
+        self.write("t10k-labels-idx1-ubyte", self.labels, True)
+        cache = os.path.join(self.directory.name, "cache")
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": cache}):
+            for _ in range(2):
+                images, labels = load_mnist(self.directory.name, "t10k")
+                self.assertIsInstance(images.base, np.memmap)
+                self.assertEqual((images.dtype, images.shape), (np.float32, (5, 6)))
+                np.testing.assert_allclose(images, self.images.reshape(5, 6) / 255)
+            self.assertEqual(default_cache_dir(), os.path.join(cache, "CategoryTheory"))
+        # The cache is kept in the user cache directory, not next to the data
+        self.assertFalse([name for name in os.listdir(self.directory.name) if name.endswith(".npy")])
+        cached = [name for _, _, names in os.walk(cache) for name in names]
+        self.assertIn("t10k-images-idx3-ubyte.float32.npy", cached)
+        self.assertEqual(labels.shape, (5, 10))
+        np.testing.assert_array_equal(labels[[0, 2]].argmax(axis=1), [3, 9])
+        self.assertEqual(labels[1][0], 1.0)
+        with self.assertRaises(ValueError):
+            load_mnist(self.directory.name, "train")
+
+    def test_minibatches_cover_the_dataset(self):
+        labels = OneHot(self.labels, 10)
+        batches = list(minibatches(self.images, labels, 2, seed=0))
+        self.assertEqual([len(x) for x, _ in batches], [2, 2, 1])
+        seen = np.concatenate([y.argmax(axis=1) for _, y in batches])
+        self.assertEqual(sorted(seen), sorted(self.labels))
+        x, y = next(minibatches(self.images, labels, 2, shuffle=False))
+        self.assertTrue(np.shares_memory(x, self.images))
+
+    def test_bundled_labels(self):
+        labels = load_labels(os.path.join(os.path.dirname(os.path.abspath(__file__)), "t10k-labels-idx1-ubyte.gz"),
+                             cache_dir=self.directory.name)
+        self.assertEqual(labels.shape, (10000, 10))
+
+class TestEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        np.random.seed(0)
+        self.model = dense((6, 5), activation=mapping.relu) >> dense((5, 3), activation=mapping.sigmoid)
+        self.param, self.fwd = self.model.param(), self.model.arrow.arrow.fwd
+        self.xs = np.random.random((50, 6))
+        self.labels = np.random.randint(0, 3, 50)
+        self.ys = np.identity(3)[self.labels]
+
+    def test_batched_accuracy_matches_the_per_example_loop(self):
+        predict = lambda x: self.fwd((self.param, x)).argmax(axis=-1)
+        expected = accuracy(predict, self.xs, self.labels)
+        self.assertEqual(accuracy(predict, self.xs, self.labels, batched=True), expected)
+        self.assertEqual(accuracy(predict, self.xs, self.labels, batched=True, chunk_size=7), expected)
+        # Rows of one-hot outputs are compared whole
+        one_hot = lambda x: np.identity(3)[predict(x)]
+        self.assertEqual(accuracy(one_hot, self.xs, self.ys, batched=True, chunk_size=16), expected)
+
+    def test_confusion_matrix_and_loss(self):
+        scores = lambda x: self.fwd((self.param, x))
+        confusion = confusion_matrix(scores, self.xs, self.labels, 3, chunk_size=16)
+        predicted = scores(self.xs).argmax(axis=1)
+        for i in range(3):
+            for j in range(3):
+                self.assertEqual(confusion[i, j], np.sum((self.labels == i) & (predicted == j)))
+        loss = np.mean([mse_loss.fwd((y, scores(x)))[0] for x, y in zip(self.xs, self.ys)])
+        self.assertAlmostEqual(mean_loss(scores, self.xs, self.ys, mse_loss, chunk_size=16, summed=True), loss)
+        result = evaluate(scores, self.xs, self.ys, mse_loss, chunk_size=16, summed=True)
+        np.testing.assert_array_equal(result["confusion"], confusion)
+        self.assertAlmostEqual(result["accuracy"], np.mean(predicted == self.labels))
+        self.assertAlmostEqual(result["loss"], loss)
+
+    def test_losses_averaging_over_rows(self):
+        scores = lambda x: self.fwd((self.param, x))
+        for loss in [batch_mse_loss, softmax_cross_entropy_loss]:
+            expected = np.mean([loss.fwd((y[None], scores(x)[None]))[0] for x, y in zip(self.xs, self.ys)])
+            # 50 rows in chunks of 16: the last chunk is smaller
+            self.assertAlmostEqual(mean_loss(scores, self.xs, self.ys, loss, chunk_size=16), expected)
+            self.assertAlmostEqual(evaluate(scores, self.xs, self.ys, loss, chunk_size=16)["loss"], expected)
+
+    def test_background_evaluation_uses_a_snapshot(self):
+        expected = evaluate(lambda x: self.fwd((self.param, x)), self.xs, self.ys, batch_mse_loss)
+        with BackgroundEvaluation(self.fwd, self.xs, self.ys, batch_mse_loss, chunk_size=16) as background:
+            future = background.submit(self.param)
+            # Training goes on updating the parameters in place
+            for p in leaves(self.param):
+                p += 1.0
+            result = future.result()
+        self.assertAlmostEqual(result["loss"], expected["loss"])
+        np.testing.assert_array_equal(result["confusion"], expected["confusion"])
+
+class TestDataParallelTrainer(unittest.TestCase):
+
+    def train(self, workers, mode):
+        np.random.seed(0)
+        model = batch_dense((5, 4), activation=mapping.relu) >> batch_dense((4, 2), activation=mapping.sigmoid)
+        xs = np.random.random((64, 5))
+        ys = np.identity(2)[(xs[:, 0] > 0.5).astype(int)]
+        trainer = DataParallelTrainer(model, rda_momentum(γ=-0.1), Para(batch_mse_loss),
+                                      to_para(learning_rate(η=-2.0)), workers=workers, mode=mode, seed=1)
+        loss = lambda p: np.sum((model.arrow.arrow.fwd((p, xs)) - ys) ** 2)
+        before = loss(trainer.store.param)
+        store = trainer.train(xs, ys, num_epochs=30, batch_size=16)
+        return before, loss(store.param), store.buffer.copy()
+
+    def test_synchronous_training_does_not_depend_on_the_number_of_workers(self):
+        before, after, single = self.train(1, "sync")
+        self.assertLess(after, before / 2)
+        for workers in [2, 3]:
+            np.testing.assert_allclose(self.train(workers, "sync")[2], single, atol=1e-12)
+
+    def test_hogwild_training_and_errors(self):
+        before, after, _ = self.train(2, "hogwild")
+        self.assertLess(after, before)
+        model = batch_dense((5, 4), activation=mapping.relu)
+        with self.assertRaises(ValueError):
+            DataParallelTrainer(model, rda_momentum(γ=-0.1), Para(batch_mse_loss), to_para(learning_rate(η=-2.0)),
+                                mode="async")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,6 @@
 
 from typing import List, Dict
 from AbstractCategory.Morphism import Morphism
-from graphviz import Digraph
 
 class Diagram:
     """
@@ -72,6 +71,8 @@ class Diagram:
         :param filename: The name of the output file without extension.
         :param format: The format of the output file (e.g., 'png', 'pdf').
         """
+        from graphviz import Digraph
+
         dot = Digraph(comment="Category Diagram", format=format)
         # Add nodes
         for obj in self.objects:
@@ -0,0 +1,34 @@
+# CategoryTheory/FinSet/Colimit.py
+
+from typing import List, Sequence, Tuple
+import numpy as np
+from .Quotient import quotient_map
+
+
+def finite_colimit(sizes: Sequence[int],
+                   arrows: Sequence[Tuple[int, int, np.ndarray]]) -> Tuple[List[np.ndarray], np.ndarray]:
+    """
+    Computes the colimit of a finite diagram of finite sets: the disjoint union of
+    the objects modulo the equivalence generated by x ~ f(x) for every arrow f.
+
+    :param sizes: Number of elements of every object of the diagram.
+    :param arrows: Arrows of the diagram as (source position, target position, index map).
+    :return: A pair (injections, representatives): the cocone injection of every object
+             as an int array into the colimit, and for every element of the colimit the
+             (object position, element index) of its smallest representative.
+    """
+    offsets = np.concatenate(([0], np.cumsum(sizes, dtype=np.int64)))
+    total = int(offsets[-1])
+    if arrows:
+        sources = np.concatenate([offsets[s] + np.arange(len(index_map), dtype=np.int64)
+                                  for s, _, index_map in arrows])
+        targets = np.concatenate([offsets[t] + np.asarray(index_map, dtype=np.int64)
+                                  for _, t, index_map in arrows])
+    else:
+        sources = targets = np.empty(0, dtype=np.int64)
+
+    q, first = quotient_map(total, sources, targets)
+    injections = [q[offsets[i]:offsets[i + 1]] for i in range(len(sizes))]
+    position = np.searchsorted(offsets, first, side="right") - 1
+    representatives = np.column_stack((position, first - offsets[position]))
+    return injections, representatives
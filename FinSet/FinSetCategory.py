@@ -0,0 +1,553 @@
+# CategoryTheory/FinSet/FinSetCategory.py
+
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from AbstractCategory.AbstractCategory import AbstractCategory
+from AbstractCategory.Morphism import Morphism
+from .Colimit import finite_colimit
+from .Limit import finite_limit, iter_finite_limit, row_positions
+from .Lazy import LazyCoproduct, LazyIndexMap, LazyProduct, compose_index_maps
+
+
+class FinSetMorphism(Morphism):
+    """
+    A function between finite sets, stored as an index map:
+    element i of the source is sent to element index_map[i] of the target.
+    """
+
+    def __init__(self, name: str, source: str, target: str, index_map):
+        """
+        Initialize a finite-set morphism.
+
+        :param name: The name of the morphism.
+        :param source: The source object of the morphism.
+        :param target: The target object of the morphism.
+        :param index_map: Integer array of length |source| with values in [0, |target|),
+                          or a LazyIndexMap for morphisms out of lazy objects.
+        """
+        super().__init__(name, source, target)
+        self.index_map = index_map if isinstance(index_map, LazyIndexMap) else np.asarray(index_map, dtype=np.int64)
+
+    def __call__(self, indices):
+        """Apply the morphism to a batch of source element indices."""
+        return self.index_map[indices]
+
+
+class FinSetCategory(AbstractCategory):
+    """
+    A full subcategory of FinSet: objects carry arrays of elements and morphisms
+    carry NumPy index maps, so limits and colimits can be computed concretely.
+    """
+
+    def __init__(self,
+                 elements: Dict[str, np.ndarray],
+                 morphisms: List[FinSetMorphism],
+                 compositions: Optional[Dict[Tuple[str, str], str]] = None):
+        """
+        Initialize a FinSetCategory instance.
+
+        :param elements: Mapping from object names to the array of their elements (indexed along axis 0),
+                         or to a LazyProduct / LazyCoproduct.
+        :param morphisms: List of FinSetMorphism instances between those objects.
+        :param compositions: User-defined morphism compositions.
+        """
+        self.elements = {obj: self._as_elements(elems) for obj, elems in elements.items()}
+        objects = list(self.elements)
+        for morph in morphisms:
+            self._check_morphism(morph)
+
+        # Identities are index maps too; add them up front so the base class keeps them
+        identities = {obj: FinSetMorphism(f"id_{obj}", obj, obj, self._identity_map(obj)) for obj in objects}
+        association: Dict[str, Dict[str, List[Morphism]]] = {obj: {obj: [identities[obj]]} for obj in objects}
+        all_morphisms = list(identities.values())
+        for morph in morphisms:
+            if morph.name == f"id_{morph.source}" and morph.source == morph.target:
+                continue
+            association[morph.source].setdefault(morph.target, []).append(morph)
+            all_morphisms.append(morph)
+
+        super().__init__(objects, all_morphisms, association, compositions=compositions)
+        self.identity_morphisms = identities
+        self._cones: Dict[str, Tuple[FinSetMorphism, ...]] = {}  # universal cones and cocones by object name
+        self._universal: Dict[tuple, str] = {}  # names of the computed limits and colimits by diagram
+
+    @staticmethod
+    def _as_elements(elements):
+        """Keep lazy objects as they are and turn anything else into an array."""
+        return elements if isinstance(elements, (LazyProduct, LazyCoproduct)) else np.asarray(elements)
+
+    def _identity_map(self, obj: str):
+        """Index map of the identity of an object, lazy for lazy objects."""
+        if isinstance(self.elements[obj], (LazyProduct, LazyCoproduct)):
+            return LazyIndexMap(self.size(obj), lambda indices: indices)
+        return np.arange(self.size(obj))
+
+    def size(self, obj: str) -> int:
+        """Return the number of elements of an object (in O(1), also for lazy objects)."""
+        return len(self.elements[obj])
+
+    def _check_morphism(self, morph: FinSetMorphism):
+        """Validate that an index map is a function between the declared objects."""
+        if not isinstance(morph, FinSetMorphism):
+            raise TypeError(f"Morphism {morph.name} is not a FinSetMorphism.")
+        for obj in (morph.source, morph.target):
+            if obj not in self.elements:
+                raise ValueError(f"Object {obj} of morphism {morph.name} is not in the category.")
+        if morph.index_map.shape != (self.size(morph.source),):
+            raise ValueError(f"Index map of {morph.name} must have length {self.size(morph.source)}.")
+        if isinstance(morph.index_map, LazyIndexMap):
+            return  # evaluated on demand, cannot be checked up front
+        if morph.index_map.size and (morph.index_map.min() < 0 or morph.index_map.max() >= self.size(morph.target)):
+            raise ValueError(f"Index map of {morph.name} points outside of {morph.target}.")
+
+    def add_object(self, obj: str, elements) -> str:
+        """
+        Add an object (and its identity morphism) to the category.
+
+        :param obj: The name of the new object.
+        :param elements: The array of its elements.
+        :return: The name of the object.
+        """
+        if obj in self.elements:
+            raise ValueError(f"Object {obj} already exists in the category.")
+        self.elements[obj] = self._as_elements(elements)
+        identity = FinSetMorphism(f"id_{obj}", obj, obj, self._identity_map(obj))
+        self.objects.append(obj)
+        self.identity_morphisms[obj] = identity
+        self.morphism_association[obj] = {obj: [identity]}
+        self.morphisms.append(identity)
+        self.morphism_equivalences[identity.name] = identity.name
+        return obj
+
+    def add_morphism(self, morph: FinSetMorphism) -> FinSetMorphism:
+        """
+        Add a morphism to the category.
+
+        :param morph: The FinSetMorphism to add.
+        :return: The added morphism.
+        """
+        self._check_morphism(morph)
+        self.morphism_association.setdefault(morph.source, {}).setdefault(morph.target, []).append(morph)
+        self.morphisms.append(morph)
+        return morph
+
+    def compose(self, morph1: Morphism, morph2: Morphism, add_if_missing: bool = True) -> Morphism:
+        """
+        Compose two morphisms in diagrammatic order (morph1, then morph2).
+
+        :param morph1: The first morphism.
+        :param morph2: The second morphism.
+        :param add_if_missing: Whether to add the new composition morphism if it doesn't already exist.
+        :return: The composed morphism, whose index map is morph2.index_map[morph1.index_map]
+                 (lazy if either index map is).
+        """
+        if morph1.target != morph2.source:
+            raise ValueError(f"Cannot compose morphism {morph1.name} with {morph2.name}")
+        if morph1.name == self.identity(morph1.source).name:
+            return morph2
+        if morph2.name == self.identity(morph2.target).name:
+            return morph1
+
+        composed_name = f"{morph1.name} ∘ {morph2.name}"
+        for morph in self.Hom(morph1.source, morph2.target):
+            if morph.name == composed_name:
+                return morph
+        if not add_if_missing:
+            raise ValueError(f"No composition found for {composed_name}")
+        return self.add_morphism(FinSetMorphism(composed_name, morph1.source, morph2.target,
+                                                compose_index_maps(morph1.index_map, morph2.index_map)))
+
+    def _diagram_arrows(self, objects: List[str], morphisms: List[FinSetMorphism]) -> Tuple[List[str], list]:
+        """Turn a diagram given by object names into positional form (one position per distinct object)."""
+        objects = list(dict.fromkeys(objects))
+        position = {obj: i for i, obj in enumerate(objects)}
+        for morph in morphisms:
+            if morph.source not in position or morph.target not in position:
+                raise ValueError(f"Morphism {morph.name} is not between objects of the diagram.")
+        return objects, [(position[m.source], position[m.target], m.index_map) for m in morphisms]
+
+    def _universal_name(self, key: tuple, name: str) -> str:
+        """
+        Name of the limit or colimit of the diagram identified by key: the name it was registered
+        under, or else name, primed until it does not clash with an existing object.
+        """
+        if key not in self._universal:
+            while name in self.elements:
+                name += "′"
+            self._universal[key] = name
+        return self._universal[key]
+
+    ################################################################################
+    # Limits
+    ################################################################################
+
+    def _register_limit(self, key: tuple, name: str, nodes: List[str],
+                        arrows: list) -> Tuple[str, Tuple[FinSetMorphism, ...]]:
+        """
+        Compute the limit of a positional diagram, register it with one projection per node and
+        return its name and projections. Its elements are the rows of element indices (one column per node).
+        The diagram is identified by key, so that limits of different diagrams never share a name.
+        """
+        name = self._universal_name(key, name)
+        if name not in self._cones:
+            rows = finite_limit([self.size(obj) for obj in nodes], arrows)
+            self.add_object(name, rows)
+            self._cones[name] = tuple(
+                self.add_morphism(FinSetMorphism(f"π{i + 1}: {name}→{obj}", name, obj, rows[:, i].copy()))
+                for i, obj in enumerate(nodes))
+        return name, self._cones[name]
+
+    def _limit_mediating(self, name: str, legs: Sequence[FinSetMorphism]) -> Optional[np.ndarray]:
+        """Unique u: C → lim with π_i ∘ u = legs[i], or None if the legs do not form a cone."""
+        projections = self._cones[name]
+        if len({leg.source for leg in legs}) != 1 or \
+                any(leg.target != projection.target for leg, projection in zip(legs, projections)):
+            return None
+        # The limit holds every compatible family exactly once, so u is a row lookup
+        table = self.elements[name]
+        queries = np.column_stack([leg.index_map for leg in legs]) if legs else np.empty((1, 0), dtype=np.int64)
+        if isinstance(table, LazyProduct):
+            return table.index(queries)
+        u = row_positions(table, queries, [self.size(p.target) for p in projections])
+        return None if np.any(u < 0) else u
+
+    def limit_projections(self, objects: List[str], morphisms: List[FinSetMorphism],
+                          name: Optional[str] = None) -> Tuple[str, Tuple[FinSetMorphism, ...]]:
+        """
+        Compute the limit of a finite diagram, the set of families (x_X) with f(x_X) = x_Y for
+        every f: X → Y, as a multiway join in a cost-based order, and register it in the category.
+
+        :param objects: The objects of the diagram.
+        :param morphisms: The morphisms of the diagram, between those objects.
+        :param name: The name of the limit object (defaults to lim(objects), primed if taken).
+        :return: A tuple (limit object, projections in the order of objects).
+        """
+        nodes, arrows = self._diagram_arrows(objects, morphisms)
+        if name is None:
+            name = f"lim({', '.join(nodes)})"
+        return self._register_limit(("limit", tuple(nodes), tuple(m.name for m in morphisms)), name, nodes, arrows)
+
+    def iter_limit(self, objects: List[str], morphisms: List[FinSetMorphism],
+                   chunk_size: int = 1 << 20) -> Iterator[np.ndarray]:
+        """
+        Stream the limit of a finite diagram without materializing or registering it.
+
+        :param objects: The objects of the diagram.
+        :param morphisms: The morphisms of the diagram.
+        :param chunk_size: Approximate number of limit elements per chunk.
+        :return: An iterator of (k, number of objects) arrays of element indices.
+        """
+        nodes, arrows = self._diagram_arrows(objects, morphisms)
+        return iter_finite_limit([self.size(obj) for obj in nodes], arrows, chunk_size)
+
+    def limit_mediating_map(self, name: str, legs: Dict[str, FinSetMorphism]) -> Optional[np.ndarray]:
+        """
+        Compute the unique map u into a computed limit with π_X ∘ u = c_X for every object X.
+
+        :param name: The limit object.
+        :param legs: Cone legs c_X: C → X, keyed by object.
+        :return: The index map of u, or None if the legs do not form a cone.
+        """
+        if any(projection.target not in legs for projection in self._cones[name]):
+            return None
+        return self._limit_mediating(name, [legs[projection.target] for projection in self._cones[name]])
+
+    def pullback_projections(self, f: FinSetMorphism, g: FinSetMorphism) -> Optional[Tuple[str, FinSetMorphism, FinSetMorphism]]:
+        """
+        Compute the pullback X ×_Z Y = {(x, y) | f(x) = g(y)} of f: X → Z and g: Y → Z
+        (the limit of the cospan, an equi-join) and register it in the category.
+
+        :param f: The first morphism.
+        :param g: The second morphism.
+        :return: A tuple (pullback object, projection to X, projection to Y), or None if f and g do not form a cospan.
+        """
+        if f.target != g.target:
+            return None
+        name, (p1, p2, _) = self._register_limit(("pullback", f.name, g.name), f"{f.name}×{g.name}",
+                                                 [f.source, g.source, f.target], [(0, 2, f.index_map), (1, 2, g.index_map)])
+        return name, p1, p2
+
+    def pullback(self, f: Morphism, g: Morphism) -> Optional[str]:
+        """
+        Calculate the pullback of two morphisms, if it exists.
+
+        :param f: The first morphism.
+        :param g: The second morphism.
+        :return: The name of the pullback object or None if it doesn't exist.
+        """
+        cone = self.pullback_projections(f, g)
+        return cone[0] if cone else None
+
+    def iter_pullback(self, f: FinSetMorphism, g: FinSetMorphism,
+                      chunk_size: int = 1 << 20) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Stream the pullback of f: X → Z and g: Y → Z without materializing it.
+
+        :param f: The first morphism.
+        :param g: The second morphism.
+        :param chunk_size: Approximate number of pairs per chunk.
+        :return: An iterator of (x indices, y indices) chunks.
+        """
+        if f.target != g.target:
+            raise ValueError("Both morphisms must have the same codomain.")
+        chunks = iter_finite_limit([self.size(f.source), self.size(g.source), self.size(f.target)],
+                                   [(0, 2, f.index_map), (1, 2, g.index_map)], chunk_size)
+        return ((rows[:, 0], rows[:, 1]) for rows in chunks)
+
+    def pullback_mediating_map(self, f: FinSetMorphism, g: FinSetMorphism,
+                               a: FinSetMorphism, b: FinSetMorphism) -> Optional[np.ndarray]:
+        """
+        Compute the unique map u: C → X ×_Z Y with π1 ∘ u = a and π2 ∘ u = b.
+
+        :param f: The first morphism f: X → Z.
+        :param g: The second morphism g: Y → Z.
+        :param a: Cone leg a: C → X.
+        :param b: Cone leg b: C → Y.
+        :return: The index map of u, or None if (a, b) is not a cone over f and g.
+        """
+        name, _, _ = self.pullback_projections(f, g)
+        leg_Z = FinSetMorphism(f"{a.name} ∘ {f.name}", a.source, f.target, f.index_map[a.index_map])
+        return self._limit_mediating(name, [a, b, leg_Z])
+
+    def equalizer_inclusion(self, f: FinSetMorphism, g: FinSetMorphism) -> Optional[Tuple[str, FinSetMorphism]]:
+        """
+        Compute the equalizer {x | f(x) = g(x)} of parallel morphisms f, g: X → Y
+        (the limit of the parallel pair) and register it in the category.
+
+        :param f: The first morphism.
+        :param g: The second morphism.
+        :return: A tuple (equalizer object, inclusion e into X), or None if f and g are not parallel.
+        """
+        if f.source != g.source or f.target != g.target:
+            return None
+        name, (e, _) = self._register_limit(("equalizer", f.name, g.name), f"Eq({f.name},{g.name})",
+                                            [f.source, f.target], [(0, 1, f.index_map), (0, 1, g.index_map)])
+        return name, e
+
+    def equalizer(self, f: Morphism, g: Morphism) -> Optional[str]:
+        """
+        Calculate the equalizer of two parallel morphisms, if it exists.
+
+        :param f: The first morphism.
+        :param g: The second morphism.
+        :return: The name of the equalizer object or None if it doesn't exist.
+        """
+        cone = self.equalizer_inclusion(f, g)
+        return cone[0] if cone else None
+
+    def equalizer_mediating_map(self, f: FinSetMorphism, g: FinSetMorphism,
+                                e_prime: FinSetMorphism) -> Optional[np.ndarray]:
+        """
+        Compute the unique map u: C → Eq(f, g) with e ∘ u = e'.
+
+        :param f: The first morphism f: X → Y.
+        :param g: The second morphism g: X → Y.
+        :param e_prime: Cone leg e': C → X.
+        :return: The index map of u, or None if f ∘ e' ≠ g ∘ e'.
+        """
+        name, _ = self.equalizer_inclusion(f, g)
+        leg_Y = FinSetMorphism(f"{e_prime.name} ∘ {f.name}", e_prime.source, f.target, f.index_map[e_prime.index_map])
+        return self._limit_mediating(name, [e_prime, leg_Y])
+
+    def product_projections(self, objects: List[str], lazy: bool = False) -> Tuple[str, Tuple[FinSetMorphism, ...]]:
+        """
+        Compute the product of objects and register it in the category.
+
+        :param objects: The factors.
+        :param lazy: Whether to represent the product as a LazyProduct with lazy projections
+                     instead of materializing every tuple.
+        :return: A tuple (product object, projections in the order of objects).
+        """
+        key = ("product", tuple(objects))
+        if not lazy or key in self._universal:
+            return self._register_limit(key, "×".join(objects), list(objects), [])
+        name = self._universal_name(key, "×".join(objects))
+        product = LazyProduct([self.size(obj) for obj in objects])
+        self.add_object(name, product)
+        self._cones[name] = tuple(
+            self.add_morphism(FinSetMorphism(f"π{i + 1}: {name}→{obj}", name, obj,
+                                             LazyIndexMap(len(product), lambda indices, i=i: product.project(i, indices))))
+            for i, obj in enumerate(objects))
+        return name, self._cones[name]
+
+    def product(self, obj1: str, obj2: str) -> Optional[str]:
+        """
+        Calculate the product of two objects; in FinSet it always exists and is built lazily.
+
+        :param obj1: The first object.
+        :param obj2: The second object.
+        :return: The name of the product object.
+        """
+        return self.product_projections([obj1, obj2], lazy=True)[0]
+
+    ################################################################################
+    # Colimits
+    ################################################################################
+
+    def _register_colimit(self, key: tuple, name: str, nodes: List[str], arrows: list,
+                          elements: Optional[Callable[[np.ndarray], np.ndarray]] = None
+                          ) -> Tuple[str, Tuple[FinSetMorphism, ...]]:
+        """
+        Compute the colimit of a positional diagram, register it with one injection per node and
+        return its name and injections. Its elements are the (node, element index) pairs of the smallest
+        representative of every class, or elements applied to these pairs. The diagram is identified by key.
+        """
+        name = self._universal_name(key, name)
+        if name not in self._cones:
+            injections, representatives = finite_colimit([self.size(obj) for obj in nodes], arrows)
+            self.add_object(name, representatives if elements is None else elements(representatives))
+            self._cones[name] = tuple(
+                self.add_morphism(FinSetMorphism(f"ι{i + 1}: {obj}→{name}", obj, name, injection))
+                for i, (obj, injection) in enumerate(zip(nodes, injections)))
+        return name, self._cones[name]
+
+    def _colimit_mediating(self, name: str, legs: Sequence[FinSetMorphism]) -> Optional[np.ndarray]:
+        """Unique u: colim → C with u ∘ ι_i = legs[i], or None if the legs do not form a cocone."""
+        injections = self._cones[name]
+        if len({leg.target for leg in legs}) != 1 or \
+                any(leg.source != injection.source for leg, injection in zip(legs, injections)):
+            return None
+        if isinstance(self.elements[name], LazyCoproduct):
+            # Summands are laid out one after the other
+            return np.concatenate([np.asarray(leg.index_map) for leg in legs] or [np.empty(0, dtype=np.int64)])
+        u = np.empty(self.size(name), dtype=np.int64)
+        for injection, leg in zip(injections, legs):
+            u[injection.index_map] = leg.index_map
+        # The injections are jointly surjective, so u is unique; it exists iff it is consistent
+        for injection, leg in zip(injections, legs):
+            if not np.array_equal(u[injection.index_map], leg.index_map):
+                return None
+        return u
+
+    def colimit_injections(self, objects: List[str], morphisms: List[FinSetMorphism],
+                           name: Optional[str] = None) -> Tuple[str, Tuple[FinSetMorphism, ...]]:
+        """
+        Compute the colimit of a finite diagram, the disjoint union of its objects modulo
+        the equivalence generated by x ~ f(x), and register it in the category.
+
+        :param objects: The objects of the diagram.
+        :param morphisms: The morphisms of the diagram, between those objects.
+        :param name: The name of the colimit object (defaults to colim(objects), primed if taken).
+        :return: A tuple (colimit object, cocone injections in the order of objects).
+        """
+        nodes, arrows = self._diagram_arrows(objects, morphisms)
+        if name is None:
+            name = f"colim({', '.join(nodes)})"
+        return self._register_colimit(("colimit", tuple(nodes), tuple(m.name for m in morphisms)), name, nodes, arrows)
+
+    def colimit_mediating_map(self, name: str, legs: Dict[str, FinSetMorphism]) -> Optional[np.ndarray]:
+        """
+        Compute the unique map u out of a computed colimit with u ∘ ι_X = c_X for every object X.
+
+        :param name: The colimit object.
+        :param legs: Cocone legs c_X: X → C, keyed by object.
+        :return: The index map of u, or None if the legs do not form a cocone.
+        """
+        if any(injection.source not in legs for injection in self._cones[name]):
+            return None
+        return self._colimit_mediating(name, [legs[injection.source] for injection in self._cones[name]])
+
+    def coequalizer_projection(self, f: FinSetMorphism, g: FinSetMorphism) -> Optional[Tuple[str, FinSetMorphism]]:
+        """
+        Compute the coequalizer of parallel morphisms f, g: X → Y, the quotient of Y
+        by the equivalence generated by f(x) ~ g(x), and register it in the category.
+        Its elements are the smallest element of Y in every class.
+
+        :param f: The first morphism.
+        :param g: The second morphism.
+        :return: A tuple (coequalizer object, quotient map q from Y), or None if f and g are not parallel.
+        """
+        if f.source != g.source or f.target != g.target:
+            return None
+        # Every class contains an element of Y (node 0), which is its smallest representative
+        name, (q, _) = self._register_colimit(("coequalizer", f.name, g.name), f"Coeq({f.name},{g.name})",
+                                              [f.target, f.source], [(1, 0, f.index_map), (1, 0, g.index_map)],
+                                              lambda representatives: self.elements[f.target][representatives[:, 1]])
+        return name, q
+
+    def coequalizer(self, f: Morphism, g: Morphism) -> Optional[str]:
+        """
+        Calculate the coequalizer of two parallel morphisms, if it exists.
+
+        :param f: The first morphism.
+        :param g: The second morphism.
+        :return: The name of the coequalizer object or None if it doesn't exist.
+        """
+        cocone = self.coequalizer_projection(f, g)
+        return cocone[0] if cocone else None
+
+    def coequalizer_mediating_map(self, f: FinSetMorphism, g: FinSetMorphism,
+                                  q_prime: FinSetMorphism) -> Optional[np.ndarray]:
+        """
+        Compute the unique map u: Coeq(f, g) → C with u ∘ q = q'.
+
+        :param f: The first morphism f: X → Y.
+        :param g: The second morphism g: X → Y.
+        :param q_prime: Cocone leg q': Y → C.
+        :return: The index map of u, or None if q' ∘ f ≠ q' ∘ g.
+        """
+        name, _ = self.coequalizer_projection(f, g)
+        leg_X = FinSetMorphism(f"{q_prime.name} ∘ {f.name}", f.source, q_prime.target, q_prime.index_map[f.index_map])
+        return self._colimit_mediating(name, [q_prime, leg_X])
+
+    def pushout_injections(self, f: FinSetMorphism, g: FinSetMorphism) -> Optional[Tuple[str, FinSetMorphism, FinSetMorphism]]:
+        """
+        Compute the pushout X +_Z Y of f: Z → X and g: Z → Y and register it in the category.
+
+        :param f: The first morphism.
+        :param g: The second morphism.
+        :return: A tuple (pushout object, injection of X, injection of Y), or None if f and g do not form a span.
+        """
+        if f.source != g.source:
+            return None
+        name, (i_X, i_Y, _) = self._register_colimit(("pushout", f.name, g.name), f"{f.name}∪{g.name}",
+                                                     [f.target, g.target, f.source],
+                                                     [(2, 0, f.index_map), (2, 1, g.index_map)])
+        return name, i_X, i_Y
+
+    def pushout(self, f: Morphism, g: Morphism) -> Optional[str]:
+        """
+        Calculate the pushout of two morphisms, if it exists.
+
+        :param f: The first morphism.
+        :param g: The second morphism.
+        :return: The name of the pushout object or None if it doesn't exist.
+        """
+        cocone = self.pushout_injections(f, g)
+        return cocone[0] if cocone else None
+
+    def pushout_mediating_map(self, f: FinSetMorphism, g: FinSetMorphism,
+                              a: FinSetMorphism, b: FinSetMorphism) -> Optional[np.ndarray]:
+        """
+        Compute the unique map u: X +_Z Y → C with u ∘ ι_X = a and u ∘ ι_Y = b.
+
+        :param f: The first morphism f: Z → X.
+        :param g: The second morphism g: Z → Y.
+        :param a: Cocone leg a: X → C.
+        :param b: Cocone leg b: Y → C.
+        :return: The index map of u, or None if a ∘ f ≠ b ∘ g.
+        """
+        name, _, _ = self.pushout_injections(f, g)
+        leg_Z = FinSetMorphism(f"{a.name} ∘ {f.name}", f.source, a.target, a.index_map[f.index_map])
+        return self._colimit_mediating(name, [a, b, leg_Z])
+
+    def coproduct_injections(self, objects: List[str], lazy: bool = False) -> Tuple[str, Tuple[FinSetMorphism, ...]]:
+        """
+        Compute the coproduct (disjoint union) of objects and register it in the category.
+
+        :param objects: The objects to sum.
+        :param lazy: Whether to represent the coproduct as a LazyCoproduct tagged by offsets,
+                     with lazy injections, instead of materializing its elements.
+        :return: A tuple (coproduct object, injections in the order of objects).
+        """
+        key = ("coproduct", tuple(objects))
+        if not lazy or key in self._universal:
+            return self._register_colimit(key, "⊔".join(objects), list(objects), [])
+        name = self._universal_name(key, "⊔".join(objects))
+        coproduct = LazyCoproduct([self.size(obj) for obj in objects])
+        self.add_object(name, coproduct)
+        self._cones[name] = tuple(
+            self.add_morphism(FinSetMorphism(f"ι{i + 1}: {obj}→{name}", obj, name,
+                                             LazyIndexMap(self.size(obj), lambda indices, i=i: coproduct.inject(i, indices))))
+            for i, obj in enumerate(objects))
+        return name, self._cones[name]
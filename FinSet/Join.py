@@ -0,0 +1,103 @@
+# CategoryTheory/FinSet/Join.py
+
+from typing import Iterator, Optional, Tuple
+import numpy as np
+
+# Key domains up to this many times the size of the build side are indexed with
+# a dense counting table; larger (or unknown) domains fall back to sorting.
+DENSE_KEY_FACTOR = 4
+
+
+class JoinIndex:
+    """
+    Index over the build side of an equi-join.
+
+    Elements of the build side are grouped by key, so that every probe key maps to
+    a contiguous block ``order[start:start + count]`` of build-side positions.
+    """
+
+    def __init__(self, keys: np.ndarray, n_keys: Optional[int] = None):
+        """
+        Builds the index.
+
+        :param keys: Integer key of every build-side element.
+        :param n_keys: Size of the key domain (keys lie in [0, n_keys)), if known.
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        self.size = keys.size
+        self.order = np.argsort(keys)
+        self.dense = n_keys is not None and n_keys <= DENSE_KEY_FACTOR * max(keys.size, 1)
+        if self.dense:
+            # Counting table: perfect hashing of the finite key domain
+            self.counts = np.bincount(keys, minlength=n_keys)
+            self.starts = np.cumsum(self.counts) - self.counts
+        else:
+            self.sorted_keys = keys[self.order]
+
+    def probe(self, keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Looks up a batch of probe keys.
+
+        :param keys: Integer probe keys.
+        :return: A pair (starts, counts) locating the matching block of every key in ``order``.
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        if self.dense:
+            return self.starts[keys], self.counts[keys]
+        lo = np.searchsorted(self.sorted_keys, keys, side="left")
+        hi = np.searchsorted(self.sorted_keys, keys, side="right")
+        return lo, hi - lo
+
+    def join(self, keys: np.ndarray, offset: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Joins a batch of probe keys against the index.
+
+        :param keys: Integer probe keys.
+        :param offset: Added to the probe-side positions (used when probing in chunks).
+        :return: A pair (probe_idx, build_idx) of equally long index arrays, one row per match.
+        """
+        starts, counts = self.probe(keys)
+        probe_idx = np.repeat(np.arange(offset, offset + counts.size, dtype=np.int64), counts)
+        # Position of every output row inside its block, computed without a Python loop
+        block_start = np.cumsum(counts) - counts
+        shift = np.repeat(starts - block_start, counts)
+        build_idx = self.order[np.arange(probe_idx.size, dtype=np.int64) + shift]
+        return probe_idx, build_idx
+
+
+def hash_join(left_keys: np.ndarray,
+              right_keys: np.ndarray,
+              n_keys: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes all pairs (i, j) with left_keys[i] == right_keys[j].
+
+    :param left_keys: Integer keys of the left (probe) side.
+    :param right_keys: Integer keys of the right (build) side.
+    :param n_keys: Size of the key domain, if known.
+    :return: A pair (left_idx, right_idx) of index arrays.
+    """
+    return JoinIndex(right_keys, n_keys).join(left_keys)
+
+
+def iter_hash_join(left_keys: np.ndarray,
+                   right_keys: np.ndarray,
+                   n_keys: Optional[int] = None,
+                   chunk_size: int = 1 << 20) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Streaming variant of hash_join: the right side is indexed once and the left
+    side is probed ``chunk_size`` elements at a time, so the left keys may be a
+    memory-mapped array and the full result never has to be held in memory.
+
+    :param left_keys: Integer keys of the left (probe) side.
+    :param right_keys: Integer keys of the right (build) side.
+    :param n_keys: Size of the key domain, if known.
+    :param chunk_size: Number of left elements probed per chunk.
+    :return: An iterator of (left_idx, right_idx) chunks with global left indices.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    index = JoinIndex(right_keys, n_keys)
+    for start in range(0, len(left_keys), chunk_size):
+        chunk = np.asarray(left_keys[start:start + chunk_size])
+        yield index.join(chunk, offset=start)
+
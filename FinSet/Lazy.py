@@ -0,0 +1,199 @@
+# CategoryTheory/FinSet/Lazy.py
+
+from typing import Callable, Iterator, Sequence, Tuple
+import numpy as np
+
+
+def _as_indices(indices, length: int) -> np.ndarray:
+    """Normalize an int, slice or index array into an int64 array checked against length."""
+    if isinstance(indices, slice):
+        return np.arange(*indices.indices(length), dtype=np.int64)
+    indices = np.asarray(indices, dtype=np.int64)
+    if indices.size and (indices.min() < 0 or indices.max() >= length):
+        raise IndexError(f"Index out of range for {length} elements.")
+    return indices
+
+
+class LazyProduct:
+    """
+    The Cartesian product of finite sets of the given sizes, never materialized.
+    Element k is the tuple of factor indices of k in mixed radix, the last factor
+    varying fastest, so elements are in lexicographic order.
+    """
+
+    def __init__(self, sizes: Sequence[int]):
+        """
+        :param sizes: Number of elements of every factor.
+        """
+        self.sizes = tuple(int(s) for s in sizes)
+        if any(s < 0 for s in self.sizes):
+            raise ValueError("Factor sizes must be non-negative.")
+        total = 1
+        for s in self.sizes:
+            total *= s
+        if total >= 2 ** 63:
+            raise ValueError(f"A product of {total} elements cannot be indexed with 64-bit integers.")
+        self.total = total
+        strides = [1]
+        for s in self.sizes[:0:-1]:
+            strides.append(strides[-1] * s)
+        self.strides = np.array(strides[::-1], dtype=np.int64)
+        self._radix = np.array(self.sizes, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __getitem__(self, indices) -> np.ndarray:
+        """Decode element indices into rows of factor indices (one column per factor)."""
+        indices = _as_indices(indices, self.total)
+        return (indices[..., None] // self.strides) % self._radix
+
+    def __array__(self, dtype=None, copy=None):
+        return self[np.arange(self.total, dtype=np.int64)].astype(dtype or np.int64)
+
+    def project(self, i: int, indices) -> np.ndarray:
+        """
+        Vectorized projection onto the i-th factor.
+
+        :param i: The factor.
+        :param indices: Element indices of the product.
+        :return: The indices of their i-th components.
+        """
+        return (_as_indices(indices, self.total) // self.strides[i]) % self.sizes[i]
+
+    def index(self, rows) -> np.ndarray:
+        """
+        Encode rows of factor indices into element indices (the inverse of indexing).
+
+        :param rows: A (k, number of factors) array.
+        :return: The element indices of the rows.
+        """
+        rows = np.asarray(rows, dtype=np.int64).reshape(-1, len(self.sizes))
+        if rows.size and (np.any(rows < 0) or np.any(rows >= self._radix)):
+            raise IndexError("Component index out of range.")
+        return rows @ self.strides
+
+    def iter_chunks(self, chunk_size: int = 1 << 20, start: int = 0, stop: int = None) -> Iterator[np.ndarray]:
+        """
+        Iterate over a range of elements in chunks of decoded rows.
+
+        :param chunk_size: Number of elements per chunk.
+        :param start: First element index.
+        :param stop: End of the range (defaults to the size of the product).
+        :return: An iterator of (k, number of factors) arrays.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+        stop = self.total if stop is None else min(stop, self.total)
+        for lo in range(start, stop, chunk_size):
+            yield self[np.arange(lo, min(lo + chunk_size, stop), dtype=np.int64)]
+
+    def __repr__(self):
+        return f"LazyProduct({' × '.join(map(str, self.sizes))} = {self.total} elements)"
+
+
+class LazyCoproduct:
+    """
+    The disjoint union of finite sets of the given sizes, never materialized.
+    Summand i occupies the element indices [offsets[i], offsets[i + 1]), and every
+    element is tagged by the pair (summand, local index).
+    """
+
+    def __init__(self, sizes: Sequence[int]):
+        """
+        :param sizes: Number of elements of every summand.
+        """
+        self.sizes = tuple(int(s) for s in sizes)
+        if any(s < 0 for s in self.sizes):
+            raise ValueError("Summand sizes must be non-negative.")
+        self.offsets = np.concatenate(([0], np.cumsum(self.sizes, dtype=np.int64)))
+        self.total = int(self.offsets[-1])
+
+    def __len__(self) -> int:
+        return self.total
+
+    def tag(self, indices) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized tagging of element indices.
+
+        :param indices: Element indices of the coproduct.
+        :return: A pair (summand, local index) of arrays.
+        """
+        indices = _as_indices(indices, self.total)
+        # side="right" skips empty summands sharing an offset
+        summand = np.searchsorted(self.offsets, indices, side="right") - 1
+        return summand, indices - self.offsets[summand]
+
+    def __getitem__(self, indices) -> np.ndarray:
+        """Decode element indices into (summand, local index) rows."""
+        summand, local = self.tag(indices)
+        return np.stack((summand, local), axis=-1)
+
+    def __array__(self, dtype=None, copy=None):
+        return self[np.arange(self.total, dtype=np.int64)].astype(dtype or np.int64)
+
+    def inject(self, i: int, local) -> np.ndarray:
+        """
+        Vectorized injection of the i-th summand.
+
+        :param i: The summand.
+        :param local: Element indices of the summand.
+        :return: Their element indices in the coproduct.
+        """
+        return self.offsets[i] + _as_indices(local, self.sizes[i])
+
+    def iter_chunks(self, chunk_size: int = 1 << 20) -> Iterator[np.ndarray]:
+        """
+        Iterate over the elements in chunks of (summand, local index) rows.
+
+        :param chunk_size: Number of elements per chunk.
+        :return: An iterator of (k, 2) arrays.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+        for lo in range(0, self.total, chunk_size):
+            yield self[np.arange(lo, min(lo + chunk_size, self.total), dtype=np.int64)]
+
+    def __repr__(self):
+        return f"LazyCoproduct({' ⊔ '.join(map(str, self.sizes))} = {self.total} elements)"
+
+
+class LazyIndexMap:
+    """
+    An index map evaluated on demand, used by morphisms out of lazy objects.
+    It supports len() and batch indexing like the arrays of ordinary FinSet morphisms.
+    """
+
+    def __init__(self, length: int, function: Callable[[np.ndarray], np.ndarray]):
+        """
+        :param length: Number of elements of the source.
+        :param function: Vectorized map from int64 source indices to target indices.
+        """
+        self.length = int(length)
+        self.function = function
+
+    def __len__(self) -> int:
+        return self.length
+
+    @property
+    def shape(self) -> Tuple[int]:
+        return (self.length,)
+
+    def __getitem__(self, indices) -> np.ndarray:
+        return self.function(_as_indices(indices, self.length))
+
+    def __array__(self, dtype=None, copy=None):
+        return self[np.arange(self.length, dtype=np.int64)].astype(dtype or np.int64)
+
+
+def compose_index_maps(first, second):
+    """
+    Compose two index maps in diagrammatic order, staying lazy if either one is.
+
+    :param first: The index map applied first.
+    :param second: The index map applied second.
+    :return: second[first], as an array or a LazyIndexMap.
+    """
+    if isinstance(first, LazyIndexMap) or isinstance(second, LazyIndexMap):
+        return LazyIndexMap(len(first), lambda indices: second[first[indices]])
+    return second[first]
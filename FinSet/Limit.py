@@ -0,0 +1,243 @@
+# CategoryTheory/FinSet/Limit.py
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+from .Join import JoinIndex
+
+# A diagram is given positionally: sizes[i] is the size of its i-th object and every
+# arrow is a triple (source position, target position, index map).
+Arrow = Tuple[int, int, np.ndarray]
+
+
+@dataclass
+class JoinStep:
+    """
+    One step of a limit plan: bring the object at position ``node`` into the join.
+
+    kind is one of
+      'scan'   -- start from all elements of the object,
+      'extend' -- the object is determined by an arrow from a joined object (fan-out 1),
+      'join'   -- equi-join through an arrow from the object into a joined object,
+      'cross'  -- no arrow connects the object to the joined ones (Cartesian product).
+    """
+    node: int
+    kind: str
+    arrow: Optional[int] = None
+    filters: List[int] = field(default_factory=list)
+    estimate: float = 0.0
+
+
+def plan_limit(sizes: Sequence[int], arrows: Sequence[Arrow]) -> List[JoinStep]:
+    """
+    Chooses a join order for the limit of a finite diagram, viewed as the conjunctive
+    query {(x_i) | f(x_s) = x_t for every arrow f: s → t}. Objects are added greedily
+    by smallest estimated intermediate cardinality, assuming uniformly spread fibres;
+    arrows between already joined objects become filters at the earliest step.
+
+    :param sizes: Number of elements of every object of the diagram.
+    :param arrows: Arrows of the diagram.
+    :return: The plan, one JoinStep per object.
+    """
+    if not sizes:
+        return []
+    joined: Dict[int, None] = {}
+    used = set()
+    steps = []
+    rows = 1.0
+    while len(joined) < len(sizes):
+        best = None
+        for node in range(len(sizes)):
+            if node in joined:
+                continue
+            if not joined:
+                candidate = JoinStep(node, "scan", estimate=float(sizes[node]))
+            else:
+                candidate = _best_access(node, joined, sizes, arrows, rows)
+            # Every other arrow closing a cycle through this object acts as a filter
+            for k, (s, t, _) in enumerate(arrows):
+                if k in used or k == candidate.arrow:
+                    continue
+                if (s == node or s in joined) and (t == node or t in joined) and node in (s, t):
+                    candidate.filters.append(k)
+                    candidate.estimate /= max(sizes[t], 1)
+            if best is None or candidate.estimate < best.estimate:
+                best = candidate
+        steps.append(best)
+        joined[best.node] = None
+        used.update(best.filters)
+        if best.arrow is not None:
+            used.add(best.arrow)
+        rows = best.estimate
+    return steps
+
+
+def _best_access(node: int, joined: Dict[int, None], sizes: Sequence[int],
+                 arrows: Sequence[Arrow], rows: float) -> JoinStep:
+    """Cheapest way to bring ``node`` into the join of ``joined`` (estimated ``rows`` rows)."""
+    best = JoinStep(node, "cross", estimate=rows * sizes[node])
+    for k, (s, t, _) in enumerate(arrows):
+        if s in joined and t == node:
+            step = JoinStep(node, "extend", k, estimate=rows)
+        elif s == node and t in joined:
+            step = JoinStep(node, "join", k, estimate=rows * sizes[node] / max(sizes[t], 1))
+        else:
+            continue
+        if step.estimate < best.estimate or (step.estimate == best.estimate and step.kind == "extend"):
+            best = step
+    return best
+
+
+class LimitExecutor:
+    """Executes a limit plan with vectorized joins, optionally in bounded-size chunks."""
+
+    def __init__(self, sizes: Sequence[int], arrows: Sequence[Arrow], steps: Optional[List[JoinStep]] = None):
+        """
+        :param sizes: Number of elements of every object of the diagram.
+        :param arrows: Arrows of the diagram.
+        :param steps: A plan from plan_limit (computed if omitted).
+        """
+        self.sizes = list(sizes)
+        self.arrows = [(s, t, np.asarray(index_map, dtype=np.int64)) for s, t, index_map in arrows]
+        self.steps = plan_limit(self.sizes, self.arrows) if steps is None else steps
+        self._indexes: Dict[int, JoinIndex] = {}
+
+    def _index(self, k: int) -> JoinIndex:
+        """Join index of arrow k keyed by its values, built once and reused across chunks."""
+        if k not in self._indexes:
+            s, t, index_map = self.arrows[k]
+            self._indexes[k] = JoinIndex(index_map, self.sizes[t])
+        return self._indexes[k]
+
+    def _fanout(self, step: JoinStep, columns: Dict[int, np.ndarray], n_rows: int) -> np.ndarray:
+        """Number of output rows every input row produces in ``step`` (before filters)."""
+        if step.kind == "join":
+            _, counts = self._index(step.arrow).probe(columns[self.arrows[step.arrow][1]])
+            return counts
+        if step.kind == "cross":
+            return np.full(n_rows, self.sizes[step.node], dtype=np.int64)
+        return np.ones(n_rows, dtype=np.int64)
+
+    def _apply(self, step: JoinStep, columns: Dict[int, np.ndarray], n_rows: int) -> Tuple[Dict[int, np.ndarray], int]:
+        """Apply one step to the current relation."""
+        if step.kind == "extend":
+            s, _, index_map = self.arrows[step.arrow]
+            columns = dict(columns)
+            columns[step.node] = index_map[columns[s]]
+        elif step.kind == "join":
+            rows, matches = self._index(step.arrow).join(columns[self.arrows[step.arrow][1]])
+            columns = {node: column[rows] for node, column in columns.items()}
+            columns[step.node] = matches
+            n_rows = rows.size
+        else:  # cross
+            size = self.sizes[step.node]
+            columns = {node: np.repeat(column, size) for node, column in columns.items()}
+            columns[step.node] = np.tile(np.arange(size, dtype=np.int64), n_rows)
+            n_rows *= size
+        return self._filter(step.filters, columns, n_rows)
+
+    def _filter(self, filters: List[int], columns: Dict[int, np.ndarray], n_rows: int) -> Tuple[Dict[int, np.ndarray], int]:
+        """Keep the rows satisfying f(x_s) = x_t for every filter arrow f."""
+        if not filters:
+            return columns, n_rows
+        keep = np.ones(n_rows, dtype=bool)
+        for k in filters:
+            s, t, index_map = self.arrows[k]
+            keep &= index_map[columns[s]] == columns[t]
+        return {node: column[keep] for node, column in columns.items()}, int(keep.sum())
+
+    def _run(self, i: int, columns: Dict[int, np.ndarray], n_rows: int,
+             chunk_size: Optional[int]) -> Iterator[Dict[int, np.ndarray]]:
+        """Run the plan from step i, splitting the relation whenever a step would exceed chunk_size rows."""
+        if i == len(self.steps):
+            yield columns
+            return
+        step = self.steps[i]
+        if chunk_size is not None and n_rows > 1 and step.kind != "extend":
+            counts = self._fanout(step, columns, n_rows)
+            if counts.sum() > chunk_size:
+                # Group consecutive rows whose output starts in the same chunk
+                piece = (np.cumsum(counts) - counts) // chunk_size
+                bounds = np.flatnonzero(np.diff(piece)) + 1
+                if bounds.size:
+                    for lo, hi in zip(np.concatenate(([0], bounds)), np.concatenate((bounds, [n_rows]))):
+                        part = {node: column[lo:hi] for node, column in columns.items()}
+                        yield from self._run(i, part, int(hi - lo), chunk_size)
+                    return
+        columns, n_rows = self._apply(step, columns, n_rows)
+        yield from self._run(i + 1, columns, n_rows, chunk_size)
+
+    def iter_rows(self, chunk_size: Optional[int] = None) -> Iterator[np.ndarray]:
+        """
+        Stream the elements of the limit.
+
+        :param chunk_size: Approximate bound on the rows materialized at once (None: no bound).
+        :return: An iterator of (k, number of objects) arrays of element indices, one column per object.
+        """
+        if not self.steps:
+            yield np.empty((1, 0), dtype=np.int64)
+            return
+        first = self.steps[0]
+        size = self.sizes[first.node]
+        step = max(size, 1) if chunk_size is None else max(chunk_size, 1)
+        for start in range(0, max(size, 1), step):
+            scan = np.arange(start, min(start + step, size), dtype=np.int64)
+            columns, n_rows = self._filter(first.filters, {first.node: scan}, scan.size)
+            for result in self._run(1, columns, n_rows, chunk_size):
+                yield np.column_stack([result[node] for node in range(len(self.sizes))])
+
+
+def finite_limit(sizes: Sequence[int], arrows: Sequence[Arrow]) -> np.ndarray:
+    """
+    Computes the limit of a finite diagram of finite sets.
+
+    :param sizes: Number of elements of every object of the diagram.
+    :param arrows: Arrows of the diagram as (source position, target position, index map).
+    :return: A (k, number of objects) array; row r holds the element indices of the r-th
+             compatible family, so column i is the limit projection onto object i.
+    """
+    chunks = list(LimitExecutor(sizes, arrows).iter_rows())
+    if not chunks:
+        return np.empty((0, len(sizes)), dtype=np.int64)
+    return np.concatenate(chunks)
+
+
+def iter_finite_limit(sizes: Sequence[int], arrows: Sequence[Arrow],
+                      chunk_size: int = 1 << 20) -> Iterator[np.ndarray]:
+    """
+    Streaming variant of finite_limit that never materializes much more than
+    chunk_size rows (or a single object) at a time.
+
+    :param sizes: Number of elements of every object of the diagram.
+    :param arrows: Arrows of the diagram.
+    :param chunk_size: Approximate number of rows per chunk.
+    :return: An iterator of (k, number of objects) arrays.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive.")
+    return LimitExecutor(sizes, arrows).iter_rows(chunk_size)
+
+
+def row_positions(table: np.ndarray, queries: np.ndarray, sizes: Sequence[int]) -> np.ndarray:
+    """
+    Finds the row of ``table`` equal to every row of ``queries``.
+
+    :param table: A (k, n) array of distinct rows.
+    :param queries: A (m, n) array of rows.
+    :param sizes: Exclusive upper bound of every column.
+    :return: For every query, the matching row position in table, or -1.
+    """
+    if np.prod([float(s) for s in sizes]) < 2.0 ** 62:
+        # Mixed-radix codes fit in 64 bits
+        radix = np.cumprod([1] + [int(s) for s in sizes[:0:-1]], dtype=np.int64)[::-1]
+        codes, wanted = table @ radix, queries @ radix
+    else:
+        _, inverse = np.unique(np.concatenate((table, queries)), axis=0, return_inverse=True)
+        inverse = inverse.ravel()
+        codes, wanted = inverse[:len(table)], inverse[len(table):]
+    order = np.argsort(codes)
+    pos = np.minimum(np.searchsorted(codes[order], wanted), max(len(order) - 1, 0))
+    if not len(order):
+        return np.full(len(wanted), -1, dtype=np.int64)
+    found = codes[order][pos] == wanted
+    return np.where(found, order[pos], -1)
@@ -0,0 +1,31 @@
+# CategoryTheory/FinSet/Quotient.py
+
+from typing import Tuple
+import numpy as np
+
+
+def quotient_map(n: int, a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the quotient of {0, ..., n-1} by the equivalence generated by the pairs
+    (a[k], b[k]), as the connected components of the sparse graph with those edges.
+
+    :param n: Number of elements.
+    :param a: Left elements of the generating pairs.
+    :param b: Right elements of the generating pairs.
+    :return: A pair (q, representatives): the quotient map as an int array of length n
+             with values in [0, number of classes), classes numbered in order of their
+             smallest element, and that smallest element of every class.
+    """
+    # scipy is only loaded once a colimit is computed, not when the limit and colimit modules are imported
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    graph = coo_matrix((np.ones(a.size, dtype=np.int8), (a, b)), shape=(n, n)).tocsr()
+    _, labels = connected_components(graph, directed=False)
+    # Renumber the components by their smallest element so results are canonical
+    _, first = np.unique(labels, return_index=True)
+    order = np.argsort(first)
+    renumber = np.empty(order.size, dtype=np.int64)
+    renumber[order] = np.arange(order.size)
+    return renumber[labels], first[order]
@@ -0,0 +1,26 @@
+# CategoryTheory/FinSet/__init__.py
+
+from .FinSetCategory import FinSetCategory, FinSetMorphism
+from .Join import JoinIndex, hash_join, iter_hash_join
+from .Quotient import quotient_map
+from .Colimit import finite_colimit
+from .Lazy import LazyProduct, LazyCoproduct, LazyIndexMap
+from .Limit import JoinStep, LimitExecutor, plan_limit, finite_limit, iter_finite_limit
+
+__all__ = [
+    "FinSetCategory",
+    "FinSetMorphism",
+    "JoinIndex",
+    "hash_join",
+    "iter_hash_join",
+    "quotient_map",
+    "finite_colimit",
+    "JoinStep",
+    "LimitExecutor",
+    "plan_limit",
+    "finite_limit",
+    "iter_finite_limit",
+    "LazyProduct",
+    "LazyCoproduct",
+    "LazyIndexMap"
+]
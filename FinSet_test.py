@@ -0,0 +1,305 @@
+
+import unittest
+import numpy as np
+from FinSet.FinSetCategory import FinSetCategory, FinSetMorphism
+from FinSet.Join import hash_join, iter_hash_join
+from FinSet.Quotient import quotient_map
+from FinSet.Limit import plan_limit, finite_limit, iter_finite_limit
+from FinSet.Lazy import LazyProduct, LazyCoproduct
+from AbstractLimit.AbstractLimit import AbstractLimit
+from AbstractLimit.Product import Product
+from AbstractPullback.AbstractPullback import Pullback
+from AbstractEqualizer.AbstractEqualizer import Equalizer
+from AbstractCoequalizer.AbstractCoequalizer import Coequalizer
+from AbstractPushout.AbstractPushout import Pushout
+from AbstractColimit.AbstractColimit import AbstractColimit
+from AbstractColimit.Coproduct import Coproduct
+from Diagram.Diagram import Diagram
+
+class TestFinSetPullback(unittest.TestCase):
+
+    def setUp(self):
+        """Cospan X → Z ← Y of small finite sets"""
+        self.f = FinSetMorphism("f", "X", "Z", [0, 1, 1, 2, 3])
+        self.g = FinSetMorphism("g", "Y", "Z", [1, 0, 1, 3])
+        self.C = FinSetCategory(
+            elements={"X": np.arange(5), "Y": np.arange(4), "Z": np.arange(4)},
+            morphisms=[self.f, self.g]
+        )
+
+    def brute_force(self, fx, gy):
+        return sorted((x, y) for x in range(len(fx)) for y in range(len(gy)) if fx[x] == gy[y])
+
+    def test_hash_join_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        fx = rng.integers(0, 7, 50)
+        gy = rng.integers(0, 7, 40)
+        for n_keys in (7, None):
+            x_idx, y_idx = hash_join(fx, gy, n_keys)
+            self.assertEqual(sorted(zip(x_idx.tolist(), y_idx.tolist())), self.brute_force(fx, gy))
+
+    def test_streaming_join_matches_join(self):
+        rng = np.random.default_rng(1)
+        fx = rng.integers(0, 5, 33)
+        gy = rng.integers(0, 5, 20)
+        chunks = list(iter_hash_join(fx, gy, 5, chunk_size=4))
+        x_idx = np.concatenate([c[0] for c in chunks])
+        y_idx = np.concatenate([c[1] for c in chunks])
+        self.assertEqual(sorted(zip(x_idx.tolist(), y_idx.tolist())), self.brute_force(fx, gy))
+
+    def test_pullback_object(self):
+        pullback = Pullback(category=self.C, morphism1=self.f, morphism2=self.g)
+        name = pullback.compute_limit()
+        self.assertEqual(name, "f×g")
+        p1 = pullback.cone_morphisms["X"].index_map
+        p2 = pullback.cone_morphisms["Y"].index_map
+        self.assertEqual(sorted(zip(p1.tolist(), p2.tolist())), self.brute_force(self.f.index_map, self.g.index_map))
+        # Computing twice does not register the object twice
+        self.assertEqual(self.C.pullback(self.f, self.g), name)
+        self.assertEqual(self.C.objects.count(name), 1)
+
+    def test_universal_property(self):
+        pullback = Pullback(category=self.C, morphism1=self.f, morphism2=self.g)
+        pullback.compute_limit()
+        self.C.add_object("C", np.arange(3))
+        a = FinSetMorphism("a", "C", "X", [1, 2, 4])
+        b = FinSetMorphism("b", "C", "Y", [0, 2, 3])
+        self.assertTrue(pullback.verify_universal_property({"X": a, "Y": b}))
+        not_a_cone = FinSetMorphism("b'", "C", "Y", [1, 2, 3])
+        self.assertFalse(pullback.verify_universal_property({"X": a, "Y": not_a_cone}))
+
+    def test_composition_uses_index_maps(self):
+        h = FinSetMorphism("h", "Z", "Y", [3, 2, 1, 0])
+        self.C.add_morphism(h)
+        fh = self.C.compose(self.f, h)
+        np.testing.assert_array_equal(fh.index_map, [3, 2, 2, 1, 0])
+
+class TestFinSetEqualizers(unittest.TestCase):
+
+    def setUp(self):
+        """Parallel pair f, g: X → Y"""
+        self.f = FinSetMorphism("f", "X", "Y", [0, 1, 2, 3, 4])
+        self.g = FinSetMorphism("g", "X", "Y", [1, 1, 3, 2, 4])
+        self.C = FinSetCategory(
+            elements={"X": np.array(list("abcde")), "Y": np.arange(10, 16)},
+            morphisms=[self.f, self.g]
+        )
+
+    def test_equalizer(self):
+        equalizer = Equalizer(category=self.C, morphism1=self.f, morphism2=self.g)
+        name = equalizer.compute_limit()
+        np.testing.assert_array_equal(equalizer.cone_morphisms["X"].index_map, [1, 4])
+        # Elements are the compatible families (x, f(x)) of the parallel pair
+        np.testing.assert_array_equal(self.C.elements[name], [[1, 1], [4, 4]])
+
+        self.C.add_object("C", np.arange(3))
+        good = FinSetMorphism("e'", "C", "X", [4, 1, 4])
+        bad = FinSetMorphism("e''", "C", "X", [4, 0, 4])
+        self.assertTrue(equalizer.verify_universal_property({"X": good}))
+        np.testing.assert_array_equal(self.C.equalizer_mediating_map(self.f, self.g, good), [1, 0, 1])
+        self.assertFalse(equalizer.verify_universal_property({"X": bad}))
+
+    def test_coequalizer(self):
+        coequalizer = Coequalizer(category=self.C, morphism1=self.f, morphism2=self.g)
+        name = coequalizer.compute_colimit()
+        q = coequalizer.cocone_morphisms["Y"].index_map
+        # Classes of Y: {0, 1}, {2, 3}, {4}, {5}
+        np.testing.assert_array_equal(q, [0, 0, 1, 1, 2, 3])
+        np.testing.assert_array_equal(self.C.elements[name], [10, 12, 14, 15])
+
+        self.C.add_object("C", np.arange(2))
+        good = FinSetMorphism("q'", "Y", "C", [1, 1, 0, 0, 1, 0])
+        bad = FinSetMorphism("q''", "Y", "C", [1, 0, 0, 0, 1, 0])
+        self.assertTrue(coequalizer.verify_universal_property({"Y": good}))
+        np.testing.assert_array_equal(self.C.coequalizer_mediating_map(self.f, self.g, good), [1, 0, 1, 0])
+        self.assertFalse(coequalizer.verify_universal_property({"Y": bad}))
+
+    def test_quotient_of_long_chain(self):
+        # A path 0 - 1 - ... - n-1 in shuffled order collapses to a single class
+        n = 1000
+        rng = np.random.default_rng(2)
+        perm = rng.permutation(n - 1)
+        q, representatives = quotient_map(n, perm, perm + 1)
+        self.assertTrue(np.all(q == 0))
+        np.testing.assert_array_equal(representatives, [0])
+
+class TestFinSetLimits(unittest.TestCase):
+
+    def brute_force(self, sizes, arrows):
+        families = np.stack(np.meshgrid(*[np.arange(n) for n in sizes], indexing="ij"), -1).reshape(-1, len(sizes))
+        keep = np.ones(len(families), dtype=bool)
+        for s, t, index_map in arrows:
+            keep &= index_map[families[:, s]] == families[:, t]
+        return sorted(map(tuple, families[keep].tolist()))
+
+    def random_diagram(self, seed):
+        rng = np.random.default_rng(seed)
+        sizes = [int(n) for n in rng.integers(1, 6, 4)]
+        arrows = [(s, t, rng.integers(0, sizes[t], sizes[s]))
+                  for s, t in [(0, 1), (2, 1), (1, 3), (0, 3), (2, 2)]]
+        return sizes, arrows
+
+    def test_limit_matches_brute_force(self):
+        for seed in range(20):
+            sizes, arrows = self.random_diagram(seed)
+            rows = finite_limit(sizes, arrows)
+            self.assertEqual(sorted(map(tuple, rows.tolist())), self.brute_force(sizes, arrows))
+
+    def test_streaming_limit_matches_limit(self):
+        sizes, arrows = [6, 5, 4], [(0, 2, np.arange(6) % 4), (1, 2, np.arange(5) % 2)]
+        chunks = list(iter_finite_limit(sizes, arrows, chunk_size=2))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(sorted(map(tuple, np.concatenate(chunks).tolist())), self.brute_force(sizes, arrows))
+
+    def test_plan_extends_along_arrows(self):
+        # A chain 0 → 1 → 2 out of a small object is joined by following its arrows
+        steps = plan_limit([10, 50, 100], [(0, 1, np.zeros(10, int)), (1, 2, np.zeros(50, int))])
+        self.assertEqual([step.kind for step in steps], ["scan", "extend", "extend"])
+        # A cospan 0 → 2 ← 1 scans the apex and joins both legs
+        steps = plan_limit([100, 50, 10], [(0, 2, np.zeros(100, int)), (1, 2, np.zeros(50, int))])
+        self.assertEqual([step.kind for step in steps], ["scan", "join", "join"])
+
+    def test_product(self):
+        C = FinSetCategory(elements={"X": np.arange(3), "Y": np.arange(4)}, morphisms=[])
+        product = Product(category=C, objects=["X", "Y"])
+        name = product.compute_limit()
+        self.assertEqual(C.size(name), 12)
+        C.add_object("C", np.arange(2))
+        a = FinSetMorphism("a", "C", "X", [2, 0])
+        b = FinSetMorphism("b", "C", "Y", [1, 3])
+        self.assertTrue(product.verify_universal_property({"X": a, "Y": b}))
+        u = C.limit_mediating_map(name, {"X": a, "Y": b})
+        np.testing.assert_array_equal(product.cone_morphisms["X"].index_map[u], [2, 0])
+        np.testing.assert_array_equal(product.cone_morphisms["Y"].index_map[u], [1, 3])
+
+    def test_limit_of_diagram(self):
+        # Limit of a cospan with a repeated leg equals the kernel pair of f
+        f = FinSetMorphism("f", "X", "Z", [0, 1, 1, 0, 2])
+        C = FinSetCategory(elements={"X": np.arange(5), "Z": np.arange(3)}, morphisms=[f])
+        self.assertEqual(C.size(C.pullback(f, f)), 9)
+        limit = AbstractLimit(C, Diagram(objects=["X", "Z"], morphisms=[f]), {})
+        name = limit.compute_limit()
+        self.assertEqual(C.size(name), 5)
+        self.assertEqual(sum(len(chunk) for chunk in limit.iter_limit(chunk_size=2)), 5)
+        self.assertTrue(limit.verify_universal_property({"X": C.identity("X"), "Z": f}))
+
+    def test_limits_with_the_same_name(self):
+        # The pullback of A: A → Z and B: B → Z is also named A×B, like the product of A and B
+        A = FinSetMorphism("A", "A", "Z", [0, 1])
+        B = FinSetMorphism("B", "B", "Z", [1, 1, 0])
+        for lazy in (False, True):
+            C = FinSetCategory(elements={"A": np.arange(2), "B": np.arange(3), "Z": np.arange(2)}, morphisms=[A, B])
+            pullback = C.pullback(A, B)
+            self.assertEqual(C.size(pullback), 3)
+            name, projections = C.product_projections(["A", "B"], lazy=lazy)
+            self.assertNotEqual(name, pullback)
+            self.assertEqual(C.size(name), 6)
+            self.assertEqual(C.size(pullback), 3)
+            self.assertEqual([p.target for p in projections], ["A", "B"])
+            self.assertEqual(C.product_projections(["A", "B"])[0], name)
+            self.assertEqual(C.pullback(A, B), pullback)
+
+class TestFinSetLazyObjects(unittest.TestCase):
+
+    def setUp(self):
+        self.C = FinSetCategory(
+            elements={"X": np.arange(10**4), "Y": np.arange(10**4), "Z": np.arange(10**4), "W": np.arange(3)},
+            morphisms=[]
+        )
+
+    def test_lazy_product_of_a_trillion_elements(self):
+        product = Product(category=self.C, objects=["X", "Y", "Z"], lazy=True)
+        name = product.compute_limit()
+        self.assertEqual(self.C.size(name), 10**12)
+        indices = np.array([0, 123456789012, 10**12 - 1])
+        np.testing.assert_array_equal(self.C.elements[name][indices],
+                                      [[0, 0, 0], [1234, 5678, 9012], [9999, 9999, 9999]])
+        np.testing.assert_array_equal(product.cone_morphisms["Y"](indices), [0, 5678, 9999])
+        # Mediating maps encode the legs in mixed radix
+        a = FinSetMorphism("a", "W", "X", [1, 2, 3])
+        b = FinSetMorphism("b", "W", "Y", [4, 5, 6])
+        c = FinSetMorphism("c", "W", "Z", [7, 8, 9])
+        u = self.C.limit_mediating_map(name, {"X": a, "Y": b, "Z": c})
+        np.testing.assert_array_equal(product.cone_morphisms["Z"](u), [7, 8, 9])
+        self.assertTrue(product.verify_universal_property({"X": a, "Y": b, "Z": c}))
+
+    def test_lazy_product_matches_materialized(self):
+        C = FinSetCategory(elements={"A": np.arange(3), "B": np.arange(4), "D": np.arange(2)}, morphisms=[])
+        lazy = LazyProduct([3, 4, 2])
+        name, _ = C.product_projections(["A", "B", "D"])
+        rows = np.concatenate(list(lazy.iter_chunks(5)))
+        self.assertEqual(sorted(map(tuple, rows.tolist())), sorted(map(tuple, C.elements[name].tolist())))
+        np.testing.assert_array_equal(lazy.index(rows), np.arange(24))
+
+    def test_lazy_projection_composes(self):
+        name = self.C.product("X", "W")
+        p2 = self.C.Hom(name, "W")[0]
+        h = FinSetMorphism("h", "W", "W", [2, 0, 1])
+        self.C.add_morphism(h)
+        composite = self.C.compose(p2, h)
+        np.testing.assert_array_equal(composite(np.arange(6)), [2, 0, 1, 2, 0, 1])
+
+    def test_lazy_coproduct(self):
+        coproduct = LazyCoproduct([3, 0, 2])
+        summand, local = coproduct.tag(np.arange(5))
+        np.testing.assert_array_equal(summand, [0, 0, 0, 2, 2])
+        np.testing.assert_array_equal(local, [0, 1, 2, 0, 1])
+        np.testing.assert_array_equal(coproduct.inject(2, [1]), [4])
+
+        C = FinSetCategory(elements={"A": np.arange(2), "B": np.arange(3)}, morphisms=[])
+        lazy = Coproduct(category=C, objects=["A", "B"], lazy=True)
+        name = lazy.compute_colimit()
+        self.assertEqual(C.size(name), 5)
+        np.testing.assert_array_equal(lazy.cocone_morphisms["B"](np.arange(3)), [2, 3, 4])
+        legs = {"A": FinSetMorphism("a", "A", "B", [1, 1]), "B": C.identity("B")}
+        C.add_morphism(legs["A"])
+        np.testing.assert_array_equal(C.colimit_mediating_map(name, legs), [1, 1, 0, 1, 2])
+
+class TestFinSetColimits(unittest.TestCase):
+
+    def setUp(self):
+        """Span X ← Z → Y"""
+        self.f = FinSetMorphism("f", "Z", "X", [0, 1, 1])
+        self.g = FinSetMorphism("g", "Z", "Y", [0, 0, 2])
+        self.C = FinSetCategory(
+            elements={"X": np.arange(3), "Y": np.arange(3), "Z": np.arange(3)},
+            morphisms=[self.f, self.g]
+        )
+
+    def test_pushout(self):
+        pushout = Pushout(category=self.C, morphism1=self.f, morphism2=self.g)
+        name = pushout.compute_colimit()
+        i_X = pushout.cocone_morphisms["X"].index_map
+        i_Y = pushout.cocone_morphisms["Y"].index_map
+        # X ⊔ Y = {x0, x1, x2, y0, y1, y2} with x0 ~ y0, x1 ~ y0, x1 ~ y2
+        np.testing.assert_array_equal(i_X, [0, 0, 1])
+        np.testing.assert_array_equal(i_Y, [0, 2, 0])
+        self.assertEqual(self.C.size(name), 3)
+
+        self.C.add_object("C", np.arange(2))
+        a = FinSetMorphism("a", "X", "C", [1, 1, 0])
+        b = FinSetMorphism("b", "Y", "C", [1, 0, 1])
+        self.assertTrue(pushout.verify_universal_property({"X": a, "Y": b}))
+        np.testing.assert_array_equal(self.C.pushout_mediating_map(self.f, self.g, a, b), [1, 0, 0])
+        b_bad = FinSetMorphism("b'", "Y", "C", [0, 0, 1])
+        self.assertFalse(pushout.verify_universal_property({"X": a, "Y": b_bad}))
+
+    def test_coproduct(self):
+        coproduct = Coproduct(category=self.C, objects=["X", "Y"])
+        name = coproduct.compute_colimit()
+        self.assertEqual(self.C.size(name), 6)
+        np.testing.assert_array_equal(coproduct.cocone_morphisms["Y"].index_map, [3, 4, 5])
+        # Legs with different codomains are not a cocone
+        self.assertFalse(coproduct.verify_universal_property({"X": self.C.identity("X"), "Y": self.C.identity("Y")}))
+        legs = {"X": self.C.identity("X"), "Y": FinSetMorphism("h", "Y", "X", [2, 2, 0])}
+        self.assertTrue(coproduct.verify_universal_property(legs))
+
+    def test_colimit_of_diagram(self):
+        # Colimit of the whole span equals its pushout
+        colimit = AbstractColimit(self.C, Diagram(objects=["X", "Y", "Z"], morphisms=[self.f, self.g]), {})
+        name = colimit.compute_colimit()
+        self.assertEqual(self.C.size(name), 3)
+        np.testing.assert_array_equal(colimit.cocone_morphisms["Z"].index_map, [0, 0, 0])
+
+if __name__ == '__main__':
+    unittest.main()
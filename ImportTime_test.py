@@ -0,0 +1,49 @@
+
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Graph, plotting and numerical backends that must only load when they are used
+HEAVY = ("numpy", "scipy", "networkx", "matplotlib", "graphviz")
+# Import-time budget of the core package, in microseconds
+BUDGET = 50000
+
+def run(code, *flags):
+    return subprocess.run([sys.executable, *flags, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+def import_time(module):
+    """Cumulative import time of a module in a fresh interpreter, as reported by python -X importtime"""
+    for line in run(f"import {module}", "-X", "importtime").stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1])
+    raise AssertionError(f"{module} not found in the -X importtime report")
+
+def loaded(module):
+    code = f"import sys, {module}; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    return run(code).stdout.split()
+
+class TestImportTime(unittest.TestCase):
+
+    def test_core_import_budget(self):
+        # The best of a few runs, so that compiling bytecode or a busy machine does not count
+        best = min(import_time("AbstractCategory") for _ in range(3))
+        self.assertLess(best, BUDGET, f"import AbstractCategory took {best / 1000:.1f} ms")
+
+    def test_backends_load_lazily(self):
+        for module in ("AbstractCategory", "AbstractFunctor", "Diagram"):
+            self.assertEqual(loaded(module), [], module)
+        # Finite sets are numpy arrays, but scipy is only needed to compute colimits
+        for module in ("DL.mapping", "FinSet", "AbstractLimit", "AbstractPullback", "AbstractEqualizer",
+                       "AbstractColimit", "AbstractCoequalizer", "AbstractPushout"):
+            self.assertEqual(loaded(module), ["numpy"], module)
+
+    def test_lazy_attributes(self):
+        self.assertEqual(run("import sys, AbstractCategory as C; C.CompletenessAnalyzer; "
+                             "print('numpy' in sys.modules, C.UniversalPropertyVerifier.__name__)").stdout.split(),
+                         ["True", "UniversalPropertyVerifier"])
+
+if __name__ == "__main__":
+    unittest.main()
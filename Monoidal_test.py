@@ -0,0 +1,404 @@
+import time
+import unittest
+from types import SimpleNamespace
+from AbstractCategory.Morphism import Morphism
+from AbstractMonoidalCategory.AbstractMonoidalCategory import AbstractMonoidalCategory
+from AbstractMonoidalCategory.Rewrite import RewriteRule, Rewriter
+from AbstractMonoidalCategory.StringDiagram import StringDiagram
+from AbstractMonoidalCategory.TensorTerms import TensorTermStore
+from SymmetricMonoidalCategory.SymmetricMonoidalCategory import SymmetricMonoidalCategory
+
+def tensor_objects(obj1: str, obj2: str) -> str:
+    if obj1 == "I":
+        return obj2
+    if obj2 == "I":
+        return obj1
+    return f"({obj1}⊗{obj2})"
+
+def tensor_morphisms(morph1: Morphism, morph2: Morphism) -> Morphism:
+    return Morphism(name=f"{morph1.name}⊗{morph2.name}",
+                    source=tensor_objects(morph1.source, morph2.source),
+                    target=tensor_objects(morph1.target, morph2.target))
+
+class CountingTensor:
+    """Wraps a tensor function and counts its calls"""
+
+    def __init__(self, function):
+        self.function = function
+        self.calls = 0
+
+    def __call__(self, left, right):
+        self.calls += 1
+        return self.function(left, right)
+
+class TestTensorTermStore(unittest.TestCase):
+
+    def test_terms_are_interned_once(self):
+        store = TensorTermStore(tensor_objects, tensor_morphisms)
+        first = store.tensor_objects("A", store.tensor_objects("B", "C"))
+        nodes = len(store)
+        for _ in range(1000):
+            again = store.tensor_objects("A", store.tensor_objects("B", "C"))
+        self.assertEqual(first, "(A⊗(B⊗C))")
+        self.assertIs(again, first)
+        self.assertEqual(len(store), nodes)
+
+    def test_user_function_called_once_per_product(self):
+        counting = CountingTensor(tensor_objects)
+        store = TensorTermStore(counting)
+        for _ in range(100):
+            store.tensor_objects(store.tensor_objects("A", "B"), store.tensor_objects("A", "B"))
+        self.assertEqual(counting.calls, 2)
+        self.assertEqual(store.cache_info()["misses"], 2)
+
+    def test_unit_keeps_resolving_to_leaf(self):
+        store = TensorTermStore(tensor_objects)
+        self.assertEqual(store.tensor_objects("I", "A"), "A")
+        self.assertEqual(store.node_of("A"), store.leaf("A"))
+
+    def test_eviction_keeps_values_correct(self):
+        store = TensorTermStore(tensor_objects, maxsize=2)
+        names = [chr(ord("A") + i) for i in range(8)]
+        expected = {}
+        for a in names:
+            for b in names:
+                expected[a, b] = store.tensor_objects(a, b)
+        self.assertLessEqual(store.cache_info()["cached"], 2)
+        for (a, b), value in expected.items():
+            self.assertEqual(store.tensor_objects(a, b), value)
+            self.assertEqual(value, f"({a}⊗{b})")
+        # Evicted values are no longer referenced by the store
+        self.assertLessEqual(len(store._node_of_value), 2)
+        self.assertIsNone(store.factors("(A⊗B)"))
+        self.assertEqual(store.factors(store.tensor_objects("A", "B")), ("A", "B"))
+
+    def test_deep_nesting(self):
+        store = TensorTermStore(tensor_objects, maxsize=16)
+        node = store.leaf("A")
+        for _ in range(5000):
+            node = store.tensor_nodes(node, store.leaf("A"))
+        value = store.value(node)
+        self.assertEqual(value.count("⊗"), 5000)
+        self.assertIs(store.value(node), value)
+
+    def test_mixed_kinds_rejected(self):
+        store = TensorTermStore(tensor_objects, tensor_morphisms)
+        with self.assertRaises(ValueError):
+            store.tensor_nodes(store.leaf("A"), store.leaf(Morphism("f", "A", "B"), "morphism"))
+
+    def test_category_tensor_uses_store(self):
+        f = Morphism("f", "A", "B")
+        g = Morphism("g", "B", "A")
+        counting = CountingTensor(tensor_morphisms)
+        category = AbstractMonoidalCategory(
+            objects=["I", "A", "B"], morphisms=[f, g],
+            morphism_association={"I": {}, "A": {"B": [f]}, "B": {"A": [g]}},
+            unit_object="I", tensor_objects_func=tensor_objects, tensor_morphisms_func=counting,
+            associators={}, left_unitors={}, right_unitors={})
+        fg = category.tensor_morphisms_pair(f, g)
+        self.assertIs(category.tensor_morphisms_pair(f, g), fg)
+        self.assertEqual((fg.name, fg.source, fg.target), ("f⊗g", "(A⊗B)", "(B⊗A)"))
+        nested = category.tensor_morphisms_pair(fg, f)
+        self.assertEqual(nested.name, "f⊗g⊗f")
+        self.assertEqual(counting.calls, 2)
+        self.assertEqual(category.tensor("A", category.tensor("B", "I")), "(A⊗B)")
+
+def join_semilattice(n: int, associator=None, symmetric: bool = False) -> AbstractMonoidalCategory:
+    """The chain 0 ≤ 1 ≤ ... ≤ n-1 as a thin monoidal category with max as tensor and unit 0"""
+    objects = [str(i) for i in range(n)]
+    leq = {(i, j): Morphism(f"id_{i}" if i == j else f"{i}≤{j}", str(i), str(j))
+           for i in range(n) for j in range(i, n)}
+    association = {obj: {} for obj in objects}
+    for morph in leq.values():
+        association[morph.source].setdefault(morph.target, []).append(morph)
+
+    def tensor_morphisms(m1: Morphism, m2: Morphism) -> Morphism:
+        return leq[max(int(m1.source), int(m2.source)), max(int(m1.target), int(m2.target))]
+
+    associators = {(a, b, c): leq[(max(map(int, (a, b, c))),) * 2]
+                   for a in objects for b in objects for c in objects}
+    if associator is not None:
+        associators.update(associator)
+    unitors = {obj: leq[int(obj), int(obj)] for obj in objects}
+    structure = dict(objects=objects, morphisms=list(leq.values()), morphism_association=association,
+                     unit_object="0", tensor_objects_func=lambda a, b: str(max(int(a), int(b))),
+                     tensor_morphisms_func=tensor_morphisms, associators=associators,
+                     left_unitors=unitors, right_unitors=dict(unitors))
+    if symmetric:
+        braidings = {(a, b): leq[(max(int(a), int(b)),) * 2] for a in objects for b in objects}
+        return SymmetricMonoidalCategory(braidings=braidings, **structure)
+    return AbstractMonoidalCategory(**structure)
+
+class TestCoherence(unittest.TestCase):
+
+    def test_thin_category_is_coherent(self):
+        category = join_semilattice(4)
+        self.assertTrue(category.verify_pentagon_identity())
+        self.assertTrue(category.verify_triangle_identity())
+
+    def test_non_involutive_associator_breaks_pentagon(self):
+        """Z/2 acting on A by s, with α_{A,A,A} = s: the pentagon reads s ∘ s = s ∘ s ∘ s"""
+        s = Morphism("s", "A", "A")
+        ss = Morphism("s ∘ s", "A", "A")
+        identities = {obj: Morphism(f"id_{obj}", obj, obj) for obj in ["I", "A"]}
+
+        def tensor_objects(a: str, b: str) -> str:
+            return "A" if "A" in (a, b) else "I"
+
+        def tensor_morphisms(m1: Morphism, m2: Morphism) -> Morphism:
+            flips = [m.name == "s" for m in (m1, m2)].count(True) % 2
+            return s if flips else identities[tensor_objects(m1.source, m2.source)]
+
+        objects = ["I", "A"]
+        associators = {(a, b, c): identities[tensor_objects(tensor_objects(a, b), c)]
+                       for a in objects for b in objects for c in objects}
+        associators["A", "A", "A"] = s
+        category = AbstractMonoidalCategory(
+            objects=objects, morphisms=[s, ss], morphism_association={"I": {}, "A": {"A": [s, ss]}},
+            unit_object="I", tensor_objects_func=tensor_objects, tensor_morphisms_func=tensor_morphisms,
+            associators=associators, left_unitors=dict(identities), right_unitors=dict(identities))
+        category.morphism_equivalences["s ∘ s"] = "id_A"
+        violations = category.coherence_checker().pentagon_violations()
+        self.assertEqual([v["objects"] for v in violations], [("A", "A", "A", "A")])
+        self.assertFalse(category.verify_pentagon_identity())
+        self.assertTrue(category.verify_triangle_identity())
+
+    def test_missing_and_mistyped_structure(self):
+        category = join_semilattice(3, associator={("1", "1", "1"): Morphism("id_2", "2", "2")})
+        del category.left_unitors["2"]
+        checker = category.coherence_checker()
+        self.assertIn("expected 1 → 1", checker.pentagon("1", "1", "1", "1"))
+        self.assertEqual(checker.triangle("0", "2"), "No left unitor λ_2.")
+        self.assertFalse(category.verify_triangle_identity())
+
+    def test_parallel_and_sampled_enumeration(self):
+        category = join_semilattice(6, associator={("2", "3", "5"): Morphism("id_3", "3", "3")})
+        serial = category.coherence_checker().pentagon_violations()
+        checker = category.coherence_checker(workers=2, chunk_size=64)
+        parallel = checker.pentagon_violations()
+        self.assertTrue(serial)
+        self.assertEqual(parallel, serial)
+        # The tuples are sent as ranges of codes, and the verdicts of the workers are kept
+        self.assertEqual(next(checker._chunks("pentagon", None, 0)), range(0, 64))
+        self.assertTrue(checker._verdicts)
+        self.assertEqual(checker.pentagon_violations(), serial)
+        sampled = category.coherence_checker(chunk_size=64).pentagon_violations(sample=300, seed=1)
+        self.assertTrue(all(v in serial for v in sampled))
+        everything = category.coherence_checker().pentagon_violations(sample=10 ** 6)
+        self.assertEqual(everything, serial)
+
+class StructureTable(dict):
+    """Structural morphisms created on demand, named after their indices"""
+
+    def __init__(self, symbol, ends):
+        super().__init__()
+        self.symbol, self.ends = symbol, ends
+
+    def get(self, key, default=None):
+        if key not in self:
+            label = ",".join(key) if isinstance(key, tuple) else key
+            self[key] = Morphism(f"{self.symbol}_{label}", *self.ends(key))
+        return self[key]
+
+def free_monoidal_category() -> AbstractMonoidalCategory:
+    """Formal bracketed words: nothing is identified, so every rebracketing is a structural morphism"""
+    def tensor(a: str, b: str) -> str:
+        return f"({a}⊗{b})"
+
+    return AbstractMonoidalCategory(
+        objects=["I", "A", "B", "C"], morphisms=[], morphism_association={},
+        unit_object="I", tensor_objects_func=tensor, tensor_morphisms_func=tensor_morphisms,
+        associators=StructureTable("α", lambda k: (tensor(tensor(k[0], k[1]), k[2]), tensor(k[0], tensor(k[1], k[2])))),
+        left_unitors=StructureTable("λ", lambda k: (tensor("I", k), k)),
+        right_unitors=StructureTable("ρ", lambda k: (tensor(k, "I"), k)))
+
+class TestCoherenceNormalizer(unittest.TestCase):
+
+    def setUp(self):
+        self.category = free_monoidal_category()
+        self.normalizer = self.category.normalizer
+
+    def test_normal_form(self):
+        self.assertEqual(self.category.normal_form(("A", (("B", "I"), "C"))), ("A", "B", "C"))
+        self.assertEqual(self.category.normal_form((("I", "I"), "I")), ())
+        self.assertEqual(self.category.normal_form("A"), ("A",))
+
+    def test_associator_and_unitors(self):
+        alpha = self.category.canonical_morphism((("A", "B"), "C"), ("A", ("B", "C")))
+        self.assertEqual(alpha.name, "α_A,B,C")
+        self.assertEqual(self.category.canonical_morphism(("A", "I"), "A").name, "ρ_A")
+        self.assertEqual(self.category.canonical_morphism("A", ("I", "A")).name, "λ_A⁻¹")
+        self.assertEqual(self.category.canonical_morphism("A", "A").name, "id_A")
+
+    def test_canonical_paths_compose(self):
+        bracketings = [
+            (((("A", "I"), "B"), ("C", "A")), ("I", "B")),
+            ("A", ("B", (("I", "C"), ("A", "B")))),
+            ((("A", ("B", "C")), (("I", "I"), "A")), "B"),
+        ]
+        terms = [self.normalizer.term(b) for b in bracketings]
+        checker = self.category.coherence_checker()
+        for source in terms:
+            for target in terms:
+                path = self.normalizer.canonical_path(source, target)
+                if source != target:
+                    self.assertIsNotNone(checker.compose_path(path))
+                    self.assertEqual(path[0].source, self.normalizer.terms.value(source))
+                    self.assertEqual(path[-1].target, self.normalizer.terms.value(target))
+                self.assertTrue(self.normalizer.same_structural_morphism((source, target), (source, target)))
+
+    def test_unrelated_bracketings(self):
+        with self.assertRaises(ValueError):
+            self.category.canonical_morphism(("A", "B"), ("B", "A"))
+        self.assertFalse(self.normalizer.coherent(self.normalizer.term(("A", "B")), self.normalizer.term("A")))
+
+    def test_long_words_are_linear(self):
+        n = 3000
+        expression = "A"
+        for _ in range(n - 1):
+            expression = (expression, "A")
+        term = self.normalizer.term(expression)
+        self.assertEqual(len(self.normalizer.normal_form(term)), n)
+        spine, steps = self.normalizer.steps(term)
+        self.assertEqual(len(steps), n - 2)
+        self.assertEqual(len(spine), n - 1)
+
+class TestBraiding(unittest.TestCase):
+
+    def test_thin_category_is_symmetric(self):
+        category = join_semilattice(4, symmetric=True)
+        self.assertTrue(category.verify_braiding_symmetry())
+        self.assertTrue(category.verify_hexagon_identities())
+        self.assertEqual(category.braiding_violations(workers=2), [])
+
+    def test_violations_are_all_reported(self):
+        category = join_semilattice(4, symmetric=True)
+        del category.braidings["1", "2"]
+        category.braidings["3", "0"] = Morphism("id_0", "0", "0")
+        violations = category.braiding_violations()
+        symmetry = [v["objects"] for v in violations if v["identity"] == "symmetry"]
+        self.assertEqual(sorted(symmetry), [("0", "3"), ("1", "2"), ("2", "1"), ("3", "0")])
+        hexagons = [v for v in violations if v["identity"] == "hexagon"]
+        self.assertTrue(hexagons)
+        self.assertTrue(all({"1", "2"} <= set(v["objects"]) or {"0", "3"} <= set(v["objects"]) for v in hexagons))
+        self.assertEqual(category.coherence_checker(workers=2, chunk_size=8).hexagon_violations(), hexagons)
+        self.assertFalse(category.verify_braiding_symmetry())
+
+    def test_non_involutive_braiding(self):
+        s = Morphism("s", "A", "A")
+        identities = {obj: Morphism(f"id_{obj}", obj, obj) for obj in ["I", "A"]}
+
+        def tensor_objects(a: str, b: str) -> str:
+            return "A" if "A" in (a, b) else "I"
+
+        def tensor_morphisms(m1: Morphism, m2: Morphism) -> Morphism:
+            flips = [m.name == "s" for m in (m1, m2)].count(True) % 2
+            return s if flips else identities[tensor_objects(m1.source, m2.source)]
+
+        objects = ["I", "A"]
+        associators = {(a, b, c): identities[tensor_objects(tensor_objects(a, b), c)]
+                       for a in objects for b in objects for c in objects}
+        braidings = {(a, b): identities[tensor_objects(a, b)] for a in objects for b in objects}
+        braidings["A", "A"] = s
+        category = SymmetricMonoidalCategory(
+            objects=objects, morphisms=[s, Morphism("s ∘ s", "A", "A")],
+            morphism_association={"I": {}, "A": {"A": [s, Morphism("s ∘ s", "A", "A")]}},
+            unit_object="I", tensor_objects_func=tensor_objects, tensor_morphisms_func=tensor_morphisms,
+            associators=associators, left_unitors=dict(identities), right_unitors=dict(identities),
+            braidings=braidings)
+        self.assertEqual([v["objects"] for v in category.coherence_checker().symmetry_violations()], [("A", "A")])
+        hexagon = category.coherence_checker().hexagon("A", "A", "A")
+        self.assertTrue(hexagon.startswith("First hexagon: s ≠ s ∘ s"))
+
+def chain(labels, wire="A") -> StringDiagram:
+    diagram = StringDiagram([wire])
+    for label in labels:
+        diagram.then_box(label, [wire], [wire])
+    return diagram
+
+class TestStringDiagrams(unittest.TestCase):
+
+    def setUp(self):
+        self.f = Morphism("f", "A", "A")
+        self.g = Morphism("g", "A", "A")
+        self.h = Morphism("h", "A", "A")
+        self.cancel = RewriteRule(chain([self.f, self.g]), StringDiagram(["A"]), name="cancel")
+
+    def labels(self, diagram):
+        return [diagram.label[box].name for box in diagram.topological_order()]
+
+    def test_diagram_of_composite(self):
+        f, g, m = Morphism("f", "A", "B"), Morphism("g", "B", "C"), Morphism("m", "C", "(A⊗A)")
+        objects = ["I", "A", "B", "C", "(A⊗A)", "(B⊗B)"]
+        category = AbstractMonoidalCategory(
+            objects, [f, g, m], {"A": {"B": [f], "C": [], "(A⊗A)": [], "(B⊗B)": []}, "B": {"C": [g]}, "C": {"(A⊗A)": [m]}},
+            "I", tensor_objects, tensor_morphisms, {}, {}, {})
+        composite = category.compose(category.compose(category.compose(f, g), m), category.tensor_morphisms_pair(f, f))
+        diagram = category.string_diagram(composite)
+        self.assertEqual(self.labels(diagram), ["f", "g", "m", "id_(A⊗A)", "f", "f"])
+        self.assertEqual((diagram.input_types, diagram.output_types), (["A"], ["B", "B"]))
+        self.assertEqual(category.factors(f), None)
+
+    def test_rewrite_to_fixpoint(self):
+        diagram = chain([self.f, self.f, self.g, self.g, self.h, self.f, self.g])
+        self.assertEqual(Rewriter([self.cancel]).rewrite(diagram), 3)
+        self.assertEqual(self.labels(diagram), ["h"])
+        self.assertEqual(diagram.producer[diagram.outputs[0]][0], diagram.consumer[diagram.inputs[0]][0])
+
+    def test_priorities(self):
+        fuse = RewriteRule(chain([self.f, self.g]), chain([self.h]), priority=1, name="fuse")
+        diagram = chain([self.f, self.g, self.f, self.g])
+        rewriter = Rewriter([self.cancel, fuse])
+        self.assertEqual(rewriter.rewrite(diagram), 2)
+        self.assertEqual(self.labels(diagram), ["h", "h"])
+        self.assertEqual([name for name, _ in rewriter.steps], ["fuse", "fuse"])
+        diagram = chain([self.f, self.g, self.f, self.g])
+        self.assertEqual(Rewriter([self.cancel, fuse]).rewrite(diagram, max_steps=1), 1)
+        self.assertEqual(len(diagram), 3)
+
+    def test_non_convex_match_is_rejected(self):
+        """f ⊗ g matches f ; h ; g only non-convexly: swapping its wires would create a cycle"""
+        lhs = chain([self.f]).tensor(chain([self.g]))
+        swap = StringDiagram(["A", "A"])
+        swap.outputs.reverse()
+        rule = RewriteRule(lhs, swap)
+        self.assertEqual(Rewriter([rule]).rewrite(chain([self.f, self.h, self.g])), 0)
+        parallel = chain([self.f]).tensor(chain([self.g]))
+        self.assertEqual(Rewriter([rule]).rewrite(parallel), 1)
+        self.assertEqual(parallel.outputs, parallel.inputs[::-1])
+
+    def test_long_chains(self):
+        diagram = chain([self.f] * 2000 + [self.g] * 2000)
+        self.assertEqual(Rewriter([self.cancel]).rewrite(diagram), 2000)
+        self.assertEqual(len(diagram), 0)
+        self.assertEqual(diagram.outputs, diagram.inputs)
+
+    def test_diagram_of_long_composite(self):
+        """Each box is added once; factors are recorded directly, since compose names composites in full"""
+        composites = {}
+        left, right = self.f, self.g
+        for k in range(1, 10000):
+            label = self.g if k % 2 else self.f
+            l, r = Morphism(f"l{k}", "A", "A"), Morphism(f"r{k}", "A", "A")
+            composites[l], composites[r] = ("∘", left, label), ("∘", label, right)
+            left, right = l, r
+        category = SimpleNamespace(unit_object="I", factors=composites.get)
+        start = time.perf_counter()
+        diagram = StringDiagram.from_morphism(category, left)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(len(diagram), 10000)
+        self.assertEqual(self.labels(diagram)[:4], ["f", "g", "f", "g"])
+        self.assertEqual(self.labels(StringDiagram.from_morphism(category, right))[-3:], ["f", "g", "g"])
+        # A shared subterm gives one box per occurrence
+        twice = Morphism("twice", "A", "A")
+        composites[twice] = ("∘", left, left)
+        self.assertEqual(len(StringDiagram.from_morphism(category, twice)), 20000)
+
+    def test_invalid_rules(self):
+        with self.assertRaises(ValueError):
+            RewriteRule(StringDiagram(["A"]), StringDiagram(["A"]))
+        with self.assertRaises(ValueError):
+            RewriteRule(chain([self.f]), StringDiagram(["A", "A"]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+
+import time
+import unittest
+from AbstractCategory.AbstractCategory import AbstractCategory
+from AbstractCategory.Morphism import Morphism
+from AbstractCategory.ProductCategory import ProductCategory
+from AbstractFunctor.AbstractFunctor import AbstractFunctor
+
+def chain(n, step=False):
+    """The total order o0 ≤ ... ≤ o{n-1}, or only its steps o{i} ≤ o{i+1} if step is set"""
+    objects = [f"o{i}" for i in range(n)]
+    return AbstractCategory.from_morphisms(objects, [Morphism(f"o{i}≤o{j}", f"o{i}", f"o{j}") for i in range(n)
+                                   for j in range(i + 1, min(n, i + 2) if step else n)])
+
+class TestProductCategory(unittest.TestCase):
+
+    def setUp(self):
+        """C has a parallel pair f, g: A → B, D is the arrow X → Y"""
+        self.f = Morphism("f", "A", "B")
+        self.g = Morphism("g", "A", "B")
+        self.h = Morphism("h", "X", "Y")
+        self.C = AbstractCategory.from_morphisms(["A", "B"], [self.f, self.g])
+        self.D = AbstractCategory.from_morphisms(["X", "Y"], [self.h])
+        self.P = ProductCategory(self.C, self.D)
+
+    def test_objects_are_index_pairs(self):
+        P = self.P
+        self.assertEqual(len(P.Objects), 4)
+        self.assertEqual(list(P.Objects), [(0, 0), (0, 1), (1, 0), (1, 1)])
+        self.assertEqual(P.Objects[2], P.pair("B", "X"))
+        self.assertEqual(P.object_name((1, 0)), "(B, X)")
+        self.assertIn((1, 1), P.Objects)
+        self.assertNotIn((2, 0), P.Objects)
+        with self.assertRaises(ValueError):
+            P.pair("A", "Z")
+
+    def test_hom_is_product_of_hom_sets(self):
+        P = self.P
+        AX, BY = P.pair("A", "X"), P.pair("B", "Y")
+        hom = P.Hom(AX, BY)
+        self.assertEqual(sorted(m.name for m in hom), ["(f, h)", "(g, h)"])
+        self.assertEqual(P.hom_size(AX, BY), 2)
+        self.assertEqual(P.Hom(BY, AX), [])
+        # The association is computed on access and returns the same interned morphisms
+        self.assertEqual(P.morphism_association.get(AX, {}).get(BY, []), hom)
+        self.assertIs(P.Hom(AX, BY)[0], hom[0])
+        self.assertEqual(P.morphism_association.get((5, 5), {}).get(BY, []), [])
+        self.assertEqual(len(P.morphism_association[AX]), 4)
+        self.assertEqual(P.morphism_components(hom[0]), (self.f, self.h))
+
+    def test_component_wise_composition(self):
+        P = ProductCategory(chain(3), chain(3))
+        first = P.Hom(P.pair("o0", "o1"), P.pair("o1", "o1"))[0]
+        second = P.Hom(P.pair("o1", "o1"), P.pair("o2", "o2"))[0]
+        composite = P.compose(first, second)
+        self.assertEqual(composite.name, "(o0≤o1 ∘ o1≤o2, o1≤o2)")
+        self.assertEqual((composite.source, composite.target), (P.pair("o0", "o1"), P.pair("o2", "o2")))
+        self.assertEqual(P.compositions[(first.name, second.name)], composite.name)
+        identity = P.identity(P.pair("o0", "o1"))
+        self.assertIs(P.compose(identity, first), first)
+        with self.assertRaises(ValueError):
+            P.compose(second, first)
+
+    def test_functors_from_and_to_the_product(self):
+        P = self.P
+        # The projection C × D → C
+        projection = AbstractFunctor(P, self.C,
+                                     {obj: P.components(obj)[0] for obj in P.Objects},
+                                     {m.name: P.morphism_components(m)[0].name for m in P.morphisms})
+        self.assertTrue(projection.is_valid())
+        AX = P.pair("A", "X")
+        self.assertEqual(projection.apply_morphism(P.Hom(AX, P.pair("B", "Y"))[1]), self.g)
+        # The section C → C × D at the object Y of D
+        section = AbstractFunctor(self.C, P,
+                                  {obj: P.pair(obj, "Y") for obj in self.C.Objects},
+                                  {m.name: P.morphism(m, self.D.identity("Y")).name for m in self.C.morphisms})
+        self.assertTrue(section.is_valid())
+        self.assertEqual(section.apply_morphism(self.f).name, "(f, id_Y)")
+
+    def test_large_product_is_not_materialized(self):
+        C, D = chain(1000, step=True), chain(1000, step=True)
+        start = time.perf_counter()
+        P = ProductCategory(C, D)
+        self.assertEqual(len(P.Objects), 1000000)
+        self.assertEqual(P.Objects[123456], (123, 456))
+        hom = P.Hom(P.pair("o998", "o2"), P.pair("o999", "o2"))
+        self.assertEqual([m.name for m in hom], ["(o998≤o999, id_o2)"])
+        self.assertLess(time.perf_counter() - start, 1.0)
+        # Only the morphisms that were asked for exist
+        self.assertEqual(len(P._components), 1)
+
+if __name__ == "__main__":
+    unittest.main()
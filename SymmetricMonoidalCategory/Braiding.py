@@ -0,0 +1,74 @@
+# CategoryTheory/SymmetricMonoidalCategory/Braiding.py
+
+from typing import Dict, List, Optional, Tuple
+from AbstractCategory.Morphism import Morphism
+from AbstractMonoidalCategory.Coherence import CoherenceChecker
+
+
+class BraidingChecker(CoherenceChecker):
+    """
+    Checks the axioms of a braided or symmetric monoidal category: symmetry of the braiding
+    for every object pair and both hexagon identities for every object triple. Both sides are
+    composed through the same memoized composition table as the pentagon and triangle, and
+    the object tuples are enumerated in the same chunks, optionally across worker processes.
+    """
+
+    ARITY = {**CoherenceChecker.ARITY, "symmetry": 2, "hexagon": 3}
+
+    def _braiding(self, A: str, B: str) -> Tuple[Optional[Morphism], Optional[str]]:
+        c = self.category
+        return self._structure("braiding", c.get_braiding(A, B), f"γ_{{{A},{B}}}", c.tensor(A, B), c.tensor(B, A))
+
+    def symmetry(self, A: str, B: str) -> Optional[str]:
+        """
+        Check the symmetry of the braiding for objects A, B:
+        γ_{A,B} ∘ γ_{B,A} = id_{A⊗B} (diagrammatic order).
+
+        :return: None if it holds, otherwise the reason it fails.
+        """
+        gamma_AB, problem = self._braiding(A, B)
+        if problem is not None:
+            return problem
+        gamma_BA, problem = self._braiding(B, A)
+        if problem is not None:
+            return problem
+        return self._compare([gamma_AB, gamma_BA], [self.identity(self.category.tensor(A, B))], "symmetry")
+
+    def hexagon(self, A: str, B: str, C: str) -> Optional[str]:
+        """
+        Check both hexagon identities for objects A, B, C (diagrammatic order):
+        α_{A,B,C} ∘ γ_{A,B⊗C} ∘ α_{B,C,A} = (γ_{A,B} ⊗ id_C) ∘ α_{B,A,C} ∘ (id_B ⊗ γ_{A,C}),
+        α⁻¹_{A,B,C} ∘ γ_{A⊗B,C} ∘ α⁻¹_{C,A,B} = (id_A ⊗ γ_{B,C}) ∘ α⁻¹_{A,C,B} ∘ (γ_{A,C} ⊗ id_B).
+
+        :return: None if both hold, otherwise the reason the first failing one fails.
+        """
+        c = self.category
+        structure = [self._associator(A, B, C), self._associator(B, C, A), self._associator(B, A, C),
+                     self._associator(C, A, B), self._associator(A, C, B),
+                     self._braiding(A, c.tensor(B, C)), self._braiding(A, B), self._braiding(A, C),
+                     self._braiding(c.tensor(A, B), C), self._braiding(B, C)]
+        for _, problem in structure:
+            if problem is not None:
+                return problem
+        abc, bca, bac, cab, acb, g_a_bc, g_ab, g_ac, g_ab_c, g_bc = (morph for morph, _ in structure)
+        first = self._compare([abc, g_a_bc, bca],
+                              [c.tensor_morphisms_pair(g_ab, self.identity(C)), bac,
+                               c.tensor_morphisms_pair(self.identity(B), g_ac)], "hexagon")
+        if first is not None:
+            return f"First hexagon: {first}"
+        second = self._compare([self.inverse(abc), g_ab_c, self.inverse(cab)],
+                               [c.tensor_morphisms_pair(self.identity(A), g_bc), self.inverse(acb),
+                                c.tensor_morphisms_pair(g_ac, self.identity(B))], "hexagon")
+        return None if second is None else f"Second hexagon: {second}"
+
+    def symmetry_violations(self, sample: Optional[int] = None, seed: int = 0) -> List[Dict[str, object]]:
+        """Object pairs whose braidings are not mutually inverse, see violations."""
+        return self.violations("symmetry", sample, seed)
+
+    def hexagon_violations(self, sample: Optional[int] = None, seed: int = 0) -> List[Dict[str, object]]:
+        """Object triples violating a hexagon identity, see violations."""
+        return self.violations("hexagon", sample, seed)
+
+    def braiding_violations(self, sample: Optional[int] = None, seed: int = 0) -> List[Dict[str, object]]:
+        """All violations of the braiding axioms: symmetry first, then the hexagons."""
+        return self.symmetry_violations(sample, seed) + self.hexagon_violations(sample, seed)
@@ -4,11 +4,14 @@ from typing import Callable, Dict, List, Optional, Tuple
 from AbstractMonoidalCategory.AbstractMonoidalCategory import AbstractMonoidalCategory
 from AbstractCategory.Morphism import Morphism
 from Diagram.Diagram import Diagram
+from .Braiding import BraidingChecker
 
 class SymmetricMonoidalCategory(AbstractMonoidalCategory):
     """
     Represents a symmetric monoidal category.
     """
+
+    checker_class = BraidingChecker
     
     def __init__(self,
                  objects: List[str],
@@ -20,7 +23,8 @@ class SymmetricMonoidalCategory(AbstractMonoidalCategory):
                  associators: Dict[Tuple[str, str, str], Morphism],
                  left_unitors: Dict[str, Morphism],
                  right_unitors: Dict[str, Morphism],
-                 braidings: Dict[Tuple[str, str], Morphism]):
+                 braidings: Dict[Tuple[str, str], Morphism],
+                 tensor_cache_size: Optional[int] = 1 << 16):
         """
         Initializes the symmetric monoidal category.
 
@@ -34,10 +38,11 @@ class SymmetricMonoidalCategory(AbstractMonoidalCategory):
         :param left_unitors: Dictionary mapping objects to their left unitor morphisms.
         :param right_unitors: Dictionary mapping objects to their right unitor morphisms.
         :param braidings: Dictionary mapping object pairs to their braiding morphisms γ_{A,B}.
+        :param tensor_cache_size: Maximum number of memoized tensor products (None for unbounded).
         """
         super().__init__(objects, morphisms, morphism_association, unit_object,
                          tensor_objects_func, tensor_morphisms_func,
-                         associators, left_unitors, right_unitors)
+                         associators, left_unitors, right_unitors, tensor_cache_size)
         self.braidings = braidings
 
     def get_braiding(self, A: str, B: str) -> Morphism:
@@ -51,25 +56,49 @@ class SymmetricMonoidalCategory(AbstractMonoidalCategory):
         key = (A, B)
         return self.braidings.get(key, None)
 
-    def verify_braiding_symmetry(self) -> bool:
+    def braiding_violations(self, workers: int = 1, sample: Optional[int] = None, seed: int = 0) -> List[Dict[str, object]]:
+        """
+        Check symmetry for all object pairs and both hexagon identities for all object triples.
+
+        :param workers: Number of processes the object tuples are split across.
+        :param sample: Check only this many random pairs and triples, for very large object sets.
+        :param seed: Seed of the sample.
+        :return: One report {"identity", "objects", "reason"} per violation.
+        """
+        return self.coherence_checker(workers).braiding_violations(sample, seed)
+
+    def verify_braiding_symmetry(self, workers: int = 1, sample: Optional[int] = None, seed: int = 0) -> bool:
         """
-        Verifies the symmetry condition: γ_{B,A} ∘ γ_{A,B} = id_{A⊗B}.
+        Verifies the symmetry condition: γ_{A,B} ∘ γ_{B,A} = id_{A⊗B} for all object pairs,
+        composites read in diagrammatic order.
 
+        :param workers: Number of processes the object pairs are split across.
+        :param sample: Check only this many random pairs, for very large object sets.
+        :param seed: Seed of the sample.
         :return: True if all symmetry conditions hold, False otherwise.
         """
-        for (A, B), gamma_AB in self.braidings.items():
-            gamma_BA = self.braidings.get((B, A), None)
-            if gamma_BA is None:
-                print(f"Missing braiding morphism for ({B}, {A}).")
-                return False
-            # Compose gamma_{B,A} ∘ gamma_{A,B}
-            composed_name = f"{gamma_BA.name} ∘ {gamma_AB.name}"
-            composed_morph = self.category.compose(gamma_BA, gamma_AB)
-            if composed_morph is None or composed_morph.name != f"id_{self.tensor_objects(A, B)}":
-                print(f"Symmetry condition failed for ({A}, {B}): {composed_name} != id_{self.tensor_objects(A, B)}")
-                return False
-        print("All symmetry conditions are satisfied.")
-        return True
+        violations = self.coherence_checker(workers).symmetry_violations(sample, seed)
+        for violation in violations:
+            print(f"Symmetry condition failed for {', '.join(violation['objects'])}: {violation['reason']}")
+        if not violations:
+            print("All symmetry conditions are satisfied.")
+        return not violations
+
+    def verify_hexagon_identities(self, workers: int = 1, sample: Optional[int] = None, seed: int = 0) -> bool:
+        """
+        Verifies both hexagon identities relating the braiding to the associators.
+
+        :param workers: Number of processes the object triples are split across.
+        :param sample: Check only this many random triples, for very large object sets.
+        :param seed: Seed of the sample.
+        :return: True if all hexagon identities hold, False otherwise.
+        """
+        violations = self.coherence_checker(workers).hexagon_violations(sample, seed)
+        for violation in violations:
+            print(f"Hexagon identity failed for {', '.join(violation['objects'])}: {violation['reason']}")
+        if not violations:
+            print("All hexagon identities are satisfied.")
+        return not violations
 
     def visualize_braiding(self, filename: str = "braiding_diagram", format: str = "png"):
         """
@@ -1,7 +1,9 @@
 # CategoryTheory/SymmetricMonoidalCategory/__init__.py
 
+from .Braiding import BraidingChecker
 from .SymmetricMonoidalCategory import SymmetricMonoidalCategory
 
 __all__ = [
-    "SymmetricMonoidalCategory"
+    "SymmetricMonoidalCategory",
+    "BraidingChecker"
 ]